@@ -0,0 +1,139 @@
+"""Memory high-water mark of collecting a full season of Statcast chunks.
+
+Reproduces the ``force_collect=True`` tail of ``pitch_by_pitch_data``: a
+season of synthetic chunks (one per ``--chunk-days`` days) is parsed with the
+library's CSV parser, then concatenated and collected by each strategy:
+
+* ``in-memory``: ``pl.concat(...).collect()`` on the default engine (the
+  former path).
+* ``streaming``: ``_collect_streaming``, the current default.
+* ``streaming+rechunk``: ``_collect_streaming(..., rechunk=True)``.
+* ``sink+in-memory`` / ``sink+streaming``: chunks are written to a
+  ``StatcastParquetSink`` and dropped as they arrive (``sink_dir=``), then the
+  scan over the written files is collected.
+
+Every strategy runs in a fresh interpreter. Resident memory is sampled from
+``/proc/self/statm`` (Linux only) while collecting; the table shows, above the
+interpreter's own footprint, resident memory once the chunks are held and the
+peak while collecting, next to the size of the result.
+
+    python benchmarks/bench_collect_memory.py --days 186 --rows-per-day 4500
+"""
+
+import argparse
+import io
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import Callable
+
+import polars as pl
+from memory_sampler import PeakSampler, rss
+from savant_stub_server import stub_date_range_urls, synthetic_statcast_csv
+
+from pybaseballstats.utils.statcast_storage_utils import StatcastParquetSink
+from pybaseballstats.utils.statcast_utils import (
+    _chunk_dates_from_url,
+    _collect_streaming,
+    _concat_chunks,
+    _load_all_data,
+    _parse_statcast_csv,
+)
+
+STRATEGIES = (
+    "in-memory",
+    "streaming",
+    "streaming+rechunk",
+    "sink+in-memory",
+    "sink+streaming",
+)
+
+
+def _season_chunks(args: argparse.Namespace, on_chunk: Callable) -> None:
+    start = date(2024, 3, 28)
+    end = start + timedelta(days=args.days - 1)
+    for url in stub_date_range_urls("http://stub", start, end, args.chunk_days):
+        chunk_start, chunk_end = _chunk_dates_from_url(url)
+        body = synthetic_statcast_csv(chunk_start, chunk_end, args.rows_per_day)
+        on_chunk(url, _parse_statcast_csv(io.BytesIO(body)))
+
+
+def _run_strategy(strategy: str, args: argparse.Namespace) -> None:
+    baseline = rss()
+    with tempfile.TemporaryDirectory() as sink_dir:
+        if strategy.startswith("sink+"):
+            sink = StatcastParquetSink(sink_dir)
+            _season_chunks(args, sink.write)
+            lf = sink.scan()
+        else:
+            frames: list[pl.DataFrame] = []
+            _season_chunks(args, lambda url, df: frames.append(df))
+            lf = _concat_chunks(_load_all_data(frames, show_progress=False))
+
+        held = rss() - baseline
+        sampler = PeakSampler()
+        sampler.start()
+        started = time.perf_counter()
+        if strategy.endswith("in-memory"):
+            df = lf.collect()
+        else:
+            df = _collect_streaming(lf, rechunk=strategy.endswith("rechunk"))
+        elapsed = time.perf_counter() - started
+        peak = sampler.stop() - baseline
+        print(
+            f"{strategy},{held},{peak},{df.estimated_size()},{df.height},"
+            f"{df.n_chunks()},{elapsed}"
+        )
+
+
+def main(args: argparse.Namespace) -> None:
+    rows: dict[str, list[str]] = {}
+    for strategy in STRATEGIES:
+        out = subprocess.run(
+            [sys.executable, __file__, "--strategy", strategy, *_forwarded(args)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        rows[strategy] = out.strip().splitlines()[-1].split(",")[1:]
+
+    print(
+        f"{args.days} days x {args.rows_per_day} rows/day in "
+        f"{args.chunk_days}-day chunks"
+    )
+    print(
+        f"{'strategy':>18} {'held MB':>8} {'peak MB':>8} {'result MB':>9} "
+        f"{'rows':>9} {'buffers':>7} {'seconds':>8}"
+    )
+    for strategy, (held, peak, size, height, n_chunks, elapsed) in rows.items():
+        print(
+            f"{strategy:>18} {int(held) / 1e6:>8.0f} {int(peak) / 1e6:>8.0f} "
+            f"{int(size) / 1e6:>9.0f} {int(height):>9} {int(n_chunks):>7} "
+            f"{float(elapsed):>8.2f}"
+        )
+
+
+def _forwarded(args: argparse.Namespace) -> list[str]:
+    return [
+        "--days",
+        str(args.days),
+        "--rows-per-day",
+        str(args.rows_per_day),
+        "--chunk-days",
+        str(args.chunk_days),
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=int, default=186)
+    parser.add_argument("--rows-per-day", type=int, default=4500)
+    parser.add_argument("--chunk-days", type=int, default=5)
+    parser.add_argument("--strategy", choices=STRATEGIES)
+    args = parser.parse_args()
+    if args.strategy is not None:
+        _run_strategy(args.strategy, args)
+    else:
+        main(args)
@@ -0,0 +1,130 @@
+"""Memory used to ingest one Statcast CSV response, by ingestion path.
+
+Measures the peak Python-heap allocation (``tracemalloc``) while a response
+body is downloaded from the local stub and parsed, for:
+
+* ``decode+StringIO``: ``response.read()``, decoded to ``str`` and parsed from
+  a ``StringIO`` (the former single-game path).
+* ``read+BytesIO``: ``response.read()`` wrapped in a ``BytesIO`` (the former
+  date-range chunk path).
+* ``streamed``: the body streamed into one buffer by ``_read_body`` and parsed
+  in place by ``_parse_statcast_csv``.
+
+Each path runs with and without gzip transfer encoding. Peaks are also shown
+as multiples of the decompressed body size; the parsed frame itself lives in
+Polars' own allocator and is not counted.
+
+    python benchmarks/bench_csv_ingest_memory.py --days 7 --rows-per-day 4000
+"""
+
+import argparse
+import asyncio
+import io
+import time
+import tracemalloc
+from datetime import date, timedelta
+from typing import Awaitable, Callable
+
+import aiohttp
+import polars as pl
+from savant_stub_server import serve_in_thread, stub_date_range_urls
+
+from pybaseballstats.consts.statcast_consts import STATCAST_PITCH_BY_PITCH_SCHEMA
+from pybaseballstats.utils.client_session_utils import DEFAULT_USER_AGENT
+from pybaseballstats.utils.statcast_utils import _parse_statcast_csv, _read_body
+
+
+def _read_csv(source: io.StringIO | io.BytesIO) -> pl.DataFrame:
+    return pl.read_csv(
+        source,
+        null_values=["null", "NULL", "NA"],
+        ignore_errors=True,
+        schema_overrides=STATCAST_PITCH_BY_PITCH_SCHEMA,
+        infer_schema=False,
+    )
+
+
+async def _decode_string_io(response: aiohttp.ClientResponse) -> pl.DataFrame:
+    content = await response.read()
+    return _read_csv(io.StringIO(content.decode("utf-8")))
+
+
+async def _read_bytes_io(response: aiohttp.ClientResponse) -> pl.DataFrame:
+    content = await response.read()
+    return _read_csv(io.BytesIO(content))
+
+
+async def _streamed(response: aiohttp.ClientResponse) -> pl.DataFrame:
+    body = await _read_body(response)
+    assert body is not None
+    return _parse_statcast_csv(body)
+
+
+PATHS: dict[str, Callable[[aiohttp.ClientResponse], Awaitable[pl.DataFrame]]] = {
+    "decode+StringIO": _decode_string_io,
+    "read+BytesIO": _read_bytes_io,
+    "streamed": _streamed,
+}
+
+
+async def _measure(
+    session: aiohttp.ClientSession,
+    url: str,
+    ingest: Callable[[aiohttp.ClientResponse], Awaitable[pl.DataFrame]],
+) -> tuple[int, float, int]:
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    async with session.get(url) as response:
+        df = await ingest(response)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return peak, elapsed, df.height
+
+
+async def _wire_size(url: str, encoding: str) -> tuple[int, int]:
+    headers = {"User-Agent": DEFAULT_USER_AGENT, "Accept-Encoding": encoding}
+    async with aiohttp.ClientSession(headers=headers, auto_decompress=False) as s:
+        async with s.get(url) as response:
+            wire = len(await response.read())
+    async with aiohttp.ClientSession(headers=headers) as s:
+        async with s.get(url) as response:
+            body = len(await response.read())
+    return wire, body
+
+
+async def main(args: argparse.Namespace) -> None:
+    start = date(2024, 4, 1)
+    end = start + timedelta(days=args.days - 1)
+    with serve_in_thread(rows_per_day=args.rows_per_day, compress=True) as origin:
+        (url,) = stub_date_range_urls(origin, start, end, args.days)
+        print(
+            f"{'encoding':>8} {'path':>16} {'wire MB':>8} {'body MB':>8} "
+            f"{'peak MB':>8} {'x body':>7} {'seconds':>8}"
+        )
+        for encoding in ("identity", "gzip"):
+            wire, body = await _wire_size(url, encoding)
+            headers = {"User-Agent": DEFAULT_USER_AGENT, "Accept-Encoding": encoding}
+            async with aiohttp.ClientSession(headers=headers) as session:
+                # Warm the stub's body cache and the connection.
+                await _measure(session, url, _streamed)
+                for label, ingest in PATHS.items():
+                    runs = [
+                        await _measure(session, url, ingest) for _ in range(args.repeat)
+                    ]
+                    peak = min(r[0] for r in runs)
+                    elapsed = min(r[1] for r in runs)
+                    print(
+                        f"{encoding:>8} {label:>16} {wire / 1e6:>8.1f} "
+                        f"{body / 1e6:>8.1f} {peak / 1e6:>8.1f} "
+                        f"{peak / body:>7.2f} {elapsed:>8.3f}"
+                    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--rows-per-day", type=int, default=4000)
+    parser.add_argument("--repeat", type=int, default=3)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,184 @@
+"""Throughput, peak memory and tail latency of ``pitch_by_pitch_data``.
+
+Runs the public ``pitch_by_pitch_data`` API end to end against the local
+Savant stub for every combination of ``--chunk-days`` and ``--concurrency``
+(``auto`` is the adaptive default). Every configuration runs in a fresh
+interpreter with its own stub, so memory and connection state do not carry
+over between runs. Reported per configuration:
+
+* wall time, rows/s and MB/s (decompressed CSV bytes) of the whole call;
+* p50/p95 chunk latency from the call's ``StatcastFetchReport``;
+* retries, and the 429/503 responses the stub injected;
+* peak resident memory above the interpreter's footprint (Linux only),
+  which includes the response bodies the stub keeps in memory.
+
+Stub behavior is controlled with the same knobs as ``savant_stub_server``:
+
+    python benchmarks/bench_pitch_by_pitch.py --days 30 --chunk-days 1 5 10 \\
+        --concurrency 4 16 auto --latency 0.2 --latency-jitter 0.3 \\
+        --throttle-above 12 --error-rate 0.02
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from datetime import date, timedelta
+
+import polars as pl
+from memory_sampler import PeakSampler, rss
+from savant_stub_server import redirect_statcast_search, serve_in_thread
+
+from pybaseballstats import statcast
+
+
+def _run_config(args: argparse.Namespace) -> dict[str, float]:
+    start = args.start
+    end = start + timedelta(days=args.days - 1)
+    stub = {
+        "rows_per_day": args.rows_per_day,
+        "latency_s": args.latency,
+        "latency_jitter_s": args.latency_jitter,
+        "error_rate": args.error_rate,
+        "throttle_rate": args.throttle_rate,
+        "throttle_above": args.throttle_above,
+        "recorded_dir": args.recorded_dir,
+        "compress": args.compress,
+    }
+    concurrency = None if args.run_concurrency == "auto" else int(args.run_concurrency)
+    reports: list[statcast.StatcastFetchReport] = []
+    server: dict[str, int] = {}
+
+    def _pull(on_report=None):
+        return statcast.pitch_by_pitch_data(
+            start.isoformat(),
+            end.isoformat(),
+            force_collect=True,
+            chunk_size_days=args.run_chunk_days,
+            concurrency=concurrency,
+            show_progress=False,
+            resume=False,
+            on_report=on_report,
+        )
+
+    baseline = rss()
+    with serve_in_thread(server, **stub) as origin, redirect_statcast_search(origin):
+        # Let the stub generate (and keep) every body before timing, so
+        # synthetic CSV generation does not count as server latency.
+        try:
+            _pull()
+        except RuntimeError:
+            pass
+        server.update(dict.fromkeys(server, 0))
+
+        sampler = PeakSampler()
+        sampler.start()
+        started = time.perf_counter()
+        df = _pull(reports.append)
+        elapsed = time.perf_counter() - started
+        peak = sampler.stop() - baseline
+    assert isinstance(df, pl.DataFrame)
+
+    (report,) = reports
+    return {
+        "seconds": elapsed,
+        "rows": df.height,
+        "chunks": len(report.chunks),
+        "rows_per_s": df.height / elapsed,
+        "mb_per_s": report.body_bytes / 1e6 / elapsed,
+        "p50_s": report.p50_latency_seconds,
+        "p95_s": report.p95_latency_seconds,
+        "retries": report.retries,
+        "throttled": server["throttled"],
+        "errors": server["errors"],
+        "peak_mb": peak / 1e6,
+    }
+
+
+def _stub_flags(args: argparse.Namespace) -> list[str]:
+    flags = [
+        f"--start={args.start}",
+        f"--days={args.days}",
+        f"--rows-per-day={args.rows_per_day}",
+        f"--latency={args.latency}",
+        f"--latency-jitter={args.latency_jitter}",
+        f"--error-rate={args.error_rate}",
+        f"--throttle-rate={args.throttle_rate}",
+    ]
+    if args.throttle_above is not None:
+        flags.append(f"--throttle-above={args.throttle_above}")
+    if args.recorded_dir is not None:
+        flags.append(f"--recorded-dir={args.recorded_dir}")
+    if args.compress:
+        flags.append("--compress")
+    return flags
+
+
+def main(args: argparse.Namespace) -> None:
+    print(
+        f"{args.days} days x {args.rows_per_day} rows/day, "
+        f"{args.latency * 1000:.0f} ms (+{args.latency_jitter * 1000:.0f} ms jitter) "
+        f"latency, {args.error_rate:.0%} 503s, {args.throttle_rate:.0%} 429s"
+        + (
+            f", 429 above {args.throttle_above} in flight"
+            if args.throttle_above is not None
+            else ""
+        )
+    )
+    print(
+        f"{'chunk days':>10} {'conc.':>5} {'seconds':>8} {'rows/s':>10} "
+        f"{'MB/s':>6} {'p50 s':>6} {'p95 s':>6} {'retries':>7} {'429s':>5} "
+        f"{'503s':>5} {'peak MB':>8}"
+    )
+    for chunk_days in args.chunk_days:
+        for concurrency in args.concurrency:
+            runs = []
+            for _ in range(args.repeat):
+                out = subprocess.run(
+                    [
+                        sys.executable,
+                        __file__,
+                        f"--run-chunk-days={chunk_days}",
+                        f"--run-concurrency={concurrency}",
+                        *_stub_flags(args),
+                    ],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+                runs.append(json.loads(out.strip().splitlines()[-1]))
+            r = min(runs, key=lambda run: run["seconds"])
+            print(
+                f"{chunk_days:>10} {concurrency:>5} {r['seconds']:>8.2f} "
+                f"{r['rows_per_s']:>10,.0f} {r['mb_per_s']:>6.1f} "
+                f"{r['p50_s']:>6.2f} {r['p95_s']:>6.2f} {r['retries']:>7} "
+                f"{r['throttled']:>5} {r['errors']:>5} {r['peak_mb']:>8.0f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--start", type=date.fromisoformat, default=date(2024, 4, 1))
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--rows-per-day", type=int, default=4000)
+    parser.add_argument("--chunk-days", type=int, nargs="+", default=[1, 5, 10])
+    parser.add_argument("--concurrency", nargs="+", default=["4", "16", "auto"])
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--latency-jitter", type=float, default=0.1)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-above", type=int, default=None)
+    parser.add_argument("--recorded-dir", default=None)
+    parser.add_argument("--compress", action="store_true")
+    parser.add_argument("--repeat", type=int, default=1)
+    # Set by main() for the child process that runs one configuration.
+    parser.add_argument("--run-chunk-days", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--run-concurrency", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.run_chunk_days is not None:
+        print(json.dumps(_run_config(args)))
+    else:
+        main(args)
@@ -0,0 +1,76 @@
+"""Throughput of the Statcast download/parse pipeline against a local stub.
+
+Compares parsing inline on the event loop (``parse_workers=0``) with the
+thread-pool parse stage at several concurrency levels.
+
+    python benchmarks/bench_statcast_pipeline.py --days 60 --rows-per-day 4000
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import date, timedelta
+
+from savant_stub_server import serve_in_thread, stub_date_range_urls
+
+from pybaseballstats.utils.statcast_utils import _fetch_all_data
+
+
+async def _run_once(
+    urls: list[str], concurrency: int, parse_workers: int | None
+) -> tuple[float, int, int]:
+    start = time.perf_counter()
+    frames = await _fetch_all_data(
+        urls,
+        concurrency=concurrency,
+        show_progress=False,
+        row_cap=None,
+        parse_workers=parse_workers,
+    )
+    elapsed = time.perf_counter() - start
+    rows = sum(df.height for df in frames)
+    size = sum(df.estimated_size() for df in frames)
+    return elapsed, rows, size
+
+
+async def main(args: argparse.Namespace) -> None:
+    start = date(2024, 4, 1)
+    end = start + timedelta(days=args.days - 1)
+    with serve_in_thread(
+        rows_per_day=args.rows_per_day, latency_s=args.latency
+    ) as origin:
+        urls = stub_date_range_urls(origin, start, end, args.chunk_days)
+        # Warm the stub's body cache so CSV generation is not timed.
+        await _run_once(urls, 16, None)
+
+        print(
+            f"{len(urls)} chunks x {args.chunk_days * args.rows_per_day} rows, "
+            f"{args.latency * 1000:.0f} ms server latency"
+        )
+        print(
+            f"{'concurrency':>11} {'mode':>10} {'seconds':>8} {'rows/s':>10} {'MB/s':>7}"
+        )
+        for concurrency in args.concurrency:
+            for label, parse_workers in (("inline", 0), ("pipelined", None)):
+                best = min(
+                    [
+                        await _run_once(urls, concurrency, parse_workers)
+                        for _ in range(args.repeat)
+                    ]
+                )
+                elapsed, rows, size = best
+                print(
+                    f"{concurrency:>11} {label:>10} {elapsed:>8.2f} "
+                    f"{rows / elapsed:>10,.0f} {size / elapsed / 1e6:>7.1f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--chunk-days", type=int, default=5)
+    parser.add_argument("--rows-per-day", type=int, default=4000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    asyncio.run(main(parser.parse_args()))
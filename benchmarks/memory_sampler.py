@@ -0,0 +1,29 @@
+"""Resident-memory sampling shared by the benchmarks (Linux only)."""
+
+import threading
+
+
+def rss() -> int:
+    """Return the resident set size of this process in bytes."""
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * 4096
+
+
+class PeakSampler(threading.Thread):
+    """Poll :func:`rss` every few milliseconds until :meth:`stop` is called."""
+
+    def __init__(self, interval_s: float = 0.002) -> None:
+        super().__init__(daemon=True)
+        self.interval_s = interval_s
+        self.peak = rss()
+        self._stop = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            self.peak = max(self.peak, rss())
+
+    def stop(self) -> int:
+        """Stop sampling and return the peak resident set size in bytes."""
+        self._stop.set()
+        self.join()
+        return max(self.peak, rss())
@@ -0,0 +1,312 @@
+"""Local stand-in for Baseball Savant's statcast_search CSV endpoint.
+
+Serves synthetic pitch-by-pitch CSV with the same columns as the real export,
+or days recorded from the real site, so the Statcast downloader can be
+exercised offline. Latency, HTTP 503 errors and HTTP 429 throttling can be
+injected to reproduce how Savant behaves under load.
+
+    python benchmarks/savant_stub_server.py serve --latency 0.2 --throttle-above 8
+    python benchmarks/savant_stub_server.py record 2024-07-01 2024-07-07 recorded/
+"""
+
+import argparse
+import asyncio
+import random
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import AsyncIterator, Iterator
+
+import polars as pl
+from aiohttp import web
+
+from pybaseballstats.consts.statcast_consts import (
+    STATCAST_DATE_FORMAT,
+    STATCAST_DATE_RANGE_URL,
+    STATCAST_PITCH_BY_PITCH_SCHEMA,
+)
+
+SAVANT_ORIGIN = "https://baseballsavant.mlb.com"
+STATS = web.AppKey("stats", dict)
+
+
+def _synthetic_column(name: str, dtype: pl.DataType, n: int) -> pl.Expr:
+    idx = pl.int_range(0, n, eager=False)
+    if isinstance(dtype, pl.Enum):
+        categories = dtype.categories.to_list()
+        return (
+            pl.lit(pl.Series(categories))
+            .gather(idx % len(categories))
+            .cast(pl.String)
+            .alias(name)
+        )
+    if dtype == pl.Categorical:
+        return pl.format("{}_{}", pl.lit(name), idx % 12).alias(name)
+    if dtype.is_float():
+        return ((idx * 7919 % 10000) / 100.0).alias(name)
+    if dtype.is_integer():
+        return (idx % 3 + 1).alias(name)
+    return pl.format("{}_{}", pl.lit(name), idx).alias(name)
+
+
+def synthetic_statcast_csv(start: date, end: date, rows_per_day: int) -> bytes:
+    """Return a statcast_search-shaped CSV body covering ``[start, end]``."""
+    days = (end - start).days + 1
+    n = days * rows_per_day
+    columns = [
+        _synthetic_column(name, dtype, n)
+        for name, dtype in STATCAST_PITCH_BY_PITCH_SCHEMA.items()
+        if name not in {"game_date", "game_pk", "at_bat_number", "pitch_number"}
+    ]
+    idx = pl.int_range(0, n, eager=False)
+    day_offset = idx // rows_per_day
+    df = pl.select(
+        (pl.lit(start) + pl.duration(days=day_offset))
+        .dt.strftime(STATCAST_DATE_FORMAT)
+        .alias("game_date"),
+        (day_offset * 100 + (idx % rows_per_day) // 300).alias("game_pk"),
+        ((idx % 300) // 4 + 1).alias("at_bat_number"),
+        (idx % 4 + 1).alias("pitch_number"),
+        *columns,
+    )
+    return df.write_csv().encode()
+
+
+def _load_recorded_days(recorded_dir: Path) -> dict[date, pl.DataFrame]:
+    """Load ``YYYY-MM-DD.csv`` files saved by ``record`` as string frames."""
+    days = {}
+    for path in sorted(recorded_dir.glob("*.csv")):
+        day = datetime.strptime(path.stem, STATCAST_DATE_FORMAT).date()
+        days[day] = pl.read_csv(path, infer_schema=False)
+    return days
+
+
+def _recorded_csv(days: dict[date, pl.DataFrame], start: date, end: date) -> bytes:
+    """Return the recorded rows for ``[start, end]`` as one CSV body."""
+    frames = [df for day, df in days.items() if start <= day <= end]
+    if not frames:
+        return b""
+    return pl.concat(frames, how="diagonal").write_csv().encode()
+
+
+def create_app(
+    *,
+    rows_per_day: int = 4000,
+    latency_s: float = 0.0,
+    latency_jitter_s: float = 0.0,
+    compress: bool = False,
+    error_rate: float = 0.0,
+    throttle_rate: float = 0.0,
+    throttle_above: int | None = None,
+    recorded_dir: str | Path | None = None,
+    seed: int = 0,
+    stats: dict[str, int] | None = None,
+) -> web.Application:
+    """Build an aiohttp app serving ``/statcast_search/csv``.
+
+    Request counts are kept in ``app[STATS]`` (``requests``, ``errors``,
+    ``throttled``, ``peak_in_flight``), which is ``stats`` when given.
+
+    Args:
+        rows_per_day: Synthetic pitches returned for every requested day.
+        latency_s: Delay before the response starts (time to first byte).
+        latency_jitter_s: Extra delay drawn uniformly from ``[0, jitter]``
+            for each request, to give latency a tail.
+        compress: Compress responses according to the request's
+            ``Accept-Encoding``, as Savant does.
+        error_rate: Fraction of requests answered with HTTP 503.
+        throttle_rate: Fraction of requests answered with HTTP 429.
+        throttle_above: Answer HTTP 429 whenever more than this many requests
+            are in flight, the way Savant pushes back on bursts.
+        recorded_dir: Serve rows from the per-day CSV files written by
+            ``python savant_stub_server.py record`` instead of synthetic rows.
+            Days without a file have no games.
+        seed: Seed of the error, throttle and jitter draws.
+        stats: Dict to keep the request counts in, so callers can read and
+            reset them while the server runs.
+    """
+    bodies: dict[tuple[date, date], bytes] = {}
+    recorded = _load_recorded_days(Path(recorded_dir)) if recorded_dir else None
+    rng = random.Random(seed)
+    if stats is None:
+        stats = {}
+    stats.update(requests=0, errors=0, throttled=0, peak_in_flight=0)
+    in_flight = 0
+
+    async def statcast_search(request: web.Request) -> web.Response:
+        nonlocal in_flight
+        start = datetime.strptime(
+            request.query["game_date_gt"], STATCAST_DATE_FORMAT
+        ).date()
+        end = datetime.strptime(
+            request.query["game_date_lt"], STATCAST_DATE_FORMAT
+        ).date()
+        stats["requests"] += 1
+        in_flight += 1
+        stats["peak_in_flight"] = max(stats["peak_in_flight"], in_flight)
+        try:
+            delay = latency_s + rng.uniform(0, latency_jitter_s)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            draw = rng.random()
+            if (throttle_above is not None and in_flight > throttle_above) or (
+                draw < throttle_rate
+            ):
+                stats["throttled"] += 1
+                return web.Response(status=429, headers={"Retry-After": "1"})
+            if draw < throttle_rate + error_rate:
+                stats["errors"] += 1
+                return web.Response(status=503)
+
+            body = bodies.get((start, end))
+            if body is None:
+                if recorded is not None:
+                    body = _recorded_csv(recorded, start, end)
+                else:
+                    body = synthetic_statcast_csv(start, end, rows_per_day)
+                bodies[(start, end)] = body
+            response = web.Response(body=body, content_type="text/csv")
+            if compress:
+                response.enable_compression()
+            return response
+        finally:
+            in_flight -= 1
+
+    app = web.Application()
+    app[STATS] = stats
+    app.router.add_get("/statcast_search/csv", statcast_search)
+    return app
+
+
+@asynccontextmanager
+async def run_stub_server(
+    stats: dict[str, int] | None = None, **app_kwargs
+) -> AsyncIterator[str]:
+    """Run the stub on an ephemeral localhost port and yield its origin URL.
+
+    ``stats`` is passed to :func:`create_app` to receive the request counts.
+    """
+    app = create_app(stats=stats, **app_kwargs)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        await runner.cleanup()
+
+
+@contextmanager
+def serve_in_thread(stats: dict[str, int] | None = None, **app_kwargs) -> Iterator[str]:
+    """Run the stub on its own event loop thread so it does not compete with
+    the client being measured, and yield its origin URL."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    server = run_stub_server(stats, **app_kwargs)
+    origin = asyncio.run_coroutine_threadsafe(server.__aenter__(), loop).result()
+    try:
+        yield origin
+    finally:
+        asyncio.run_coroutine_threadsafe(
+            server.__aexit__(None, None, None), loop
+        ).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def stub_date_range_urls(origin: str, start: date, end: date, step: int) -> list[str]:
+    """Build statcast_search URLs for consecutive ``step``-day chunks."""
+    urls = []
+    chunk_start = start
+    while chunk_start <= end:
+        chunk_end = min(chunk_start + timedelta(days=step - 1), end)
+        urls.append(
+            STATCAST_DATE_RANGE_URL.replace(SAVANT_ORIGIN, origin).format(
+                player_type="pitcher",
+                start_date=chunk_start,
+                end_date=chunk_end,
+                team="",
+            )
+        )
+        chunk_start = chunk_end + timedelta(days=1)
+    return urls
+
+
+@contextmanager
+def redirect_statcast_search(origin: str) -> Iterator[None]:
+    """Point the public ``pitch_by_pitch_data`` API at the stub at ``origin``."""
+    from pybaseballstats import statcast
+
+    original = statcast.STATCAST_DATE_RANGE_URL
+    statcast.STATCAST_DATE_RANGE_URL = original.replace(SAVANT_ORIGIN, origin)
+    try:
+        yield
+    finally:
+        statcast.STATCAST_DATE_RANGE_URL = original
+
+
+def record_savant_days(start: date, end: date, out_dir: Path) -> None:
+    """Save the real Savant export for each day of ``[start, end]`` as
+    ``out_dir/YYYY-MM-DD.csv`` for ``create_app(recorded_dir=...)``."""
+    from pybaseballstats import statcast
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    day = start
+    while day <= end:
+        df = statcast.pitch_by_pitch_data(
+            day.isoformat(),
+            day.isoformat(),
+            force_collect=True,
+            show_progress=False,
+            resume=False,
+        )
+        if isinstance(df, pl.DataFrame) and df.height > 0:
+            df.write_csv(out_dir / f"{day.isoformat()}.csv")
+            print(f"{day}: {df.height} pitches")
+        day += timedelta(days=1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="Run the stub until interrupted.")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--rows-per-day", type=int, default=4000)
+    serve.add_argument("--latency", type=float, default=0.0)
+    serve.add_argument("--latency-jitter", type=float, default=0.0)
+    serve.add_argument("--error-rate", type=float, default=0.0)
+    serve.add_argument("--throttle-rate", type=float, default=0.0)
+    serve.add_argument("--throttle-above", type=int, default=None)
+    serve.add_argument("--recorded-dir", type=Path, default=None)
+    serve.add_argument("--compress", action="store_true")
+    record = commands.add_parser(
+        "record", help="Save real Savant days for --recorded-dir (needs network)."
+    )
+    record.add_argument("start", type=date.fromisoformat)
+    record.add_argument("end", type=date.fromisoformat)
+    record.add_argument("out_dir", type=Path)
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record_savant_days(args.start, args.end, args.out_dir)
+        return
+    app = create_app(
+        rows_per_day=args.rows_per_day,
+        latency_s=args.latency,
+        latency_jitter_s=args.latency_jitter,
+        compress=args.compress,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        throttle_above=args.throttle_above,
+        recorded_dir=args.recorded_dir,
+    )
+    web.run_app(app, host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
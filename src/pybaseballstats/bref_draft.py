@@ -13,7 +13,7 @@ from pybaseballstats.utils.bref_utils import (
 )
 from pybaseballstats.utils.session_utils import PBSSessionManager
 
-session = PBSSessionManager.instance(max_req_per_minute=5)  # type: ignore[attr-defined]
+session = PBSSessionManager.instance()  # type: ignore[attr-defined]
 
 
 __all__ = ["BREFTeams", "draft_order_by_year_round", "franchise_draft_order"]
@@ -15,7 +15,7 @@ from pybaseballstats.utils.bref_utils import (
 )
 from pybaseballstats.utils.session_utils import PBSSessionManager
 
-session = PBSSessionManager.instance(max_req_per_minute=5)  # type: ignore[attr-defined]
+session = PBSSessionManager.instance()  # type: ignore[attr-defined]
 __all__ = [
     "single_player_batting",
     "single_player_pitching",
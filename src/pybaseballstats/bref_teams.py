@@ -1,9 +1,11 @@
+import asyncio
 import re
 from datetime import datetime
 from typing import Literal
 
 import polars as pl
 from bs4 import BeautifulSoup
+from curl_cffi import requests
 
 from pybaseballstats.consts.bref_consts import (
     BREF_TEAMS_BATTING_BASE_URL,
@@ -18,18 +20,23 @@ from pybaseballstats.utils.bref_utils import (
     get_bref_table_html,
     resolve_bref_team_code,
 )
-from pybaseballstats.utils.session_utils import PBSSessionManager
-
-session = PBSSessionManager.instance(max_req_per_minute=5)  # type: ignore[attr-defined]
+from pybaseballstats.utils.client_session_utils import run_sync
+from pybaseballstats.utils.session_utils import get_async_session_manager
 
 __all__ = [
     "BREFTeams",
     "game_by_game_schedule_results",
+    "game_by_game_schedule_results_async",
     "roster_and_appearances",
+    "roster_and_appearances_async",
     "batting_orders",
+    "batting_orders_async",
     "batting",
+    "batting_async",
     "pitching",
+    "pitching_async",
     "fielding",
+    "fielding_async",
 ]
 
 
@@ -62,6 +69,17 @@ def batting_orders(team: BREFTeams, year: int, verbose: bool = False) -> pl.Data
     Returns:
         pl.DataFrame: Per-game batting orders with metadata and lineup columns.
     """
+    return run_sync(batting_orders_async(team, year, verbose))
+
+
+async def batting_orders_async(
+    team: BREFTeams, year: int, verbose: bool = False
+) -> pl.DataFrame:
+    """Asynchronous variant of :func:`batting_orders`.
+
+    Runs on the caller's event loop, so several pages can be awaited
+    together with ``asyncio.gather``.
+    """
     if not isinstance(team, BREFTeams):
         raise ValueError("Team must be a member of the BREFTeams enum")
     if year < 1871:
@@ -69,8 +87,14 @@ def batting_orders(team: BREFTeams, year: int, verbose: bool = False) -> pl.Data
 
     team_code = resolve_bref_team_code(team=team, year=year)
     url = f"https://www.baseball-reference.com/teams/{team_code}/{year}-batting-orders.shtml"
-    session.set_verbose(verbose)
-    resp = session.get(url)
+    manager = await get_async_session_manager()
+    resp = await manager.get(url, verbose=verbose)
+    return await asyncio.to_thread(_batting_orders_from_page, resp, team, year)
+
+
+def _batting_orders_from_page(
+    resp: requests.Response | None, team: BREFTeams, year: int
+) -> pl.DataFrame:
     if resp is None:
         raise ValueError(f"Failed to fetch batting orders for {team.name} in {year}.")
 
@@ -199,13 +223,31 @@ def game_by_game_schedule_results(
     Returns:
         pl.DataFrame: Team schedule and results rows from Baseball Reference.
     """
+    return run_sync(game_by_game_schedule_results_async(team, year, verbose))
+
+
+async def game_by_game_schedule_results_async(
+    team: BREFTeams, year: int, verbose: bool = False
+) -> pl.DataFrame:
+    """Asynchronous variant of :func:`game_by_game_schedule_results`.
+
+    Runs on the caller's event loop, so several pages can be awaited
+    together with ``asyncio.gather``.
+    """
     if not isinstance(team, BREFTeams):
         raise ValueError("Team must be a member of the BREFTeams enum")
     team_code = resolve_bref_team_code(team=team, year=year)
     url = BREF_TEAMS_SCHEDULE_RESULTS_URL.format(team_code=team_code, year=year)
-    session.set_verbose(verbose)
-    resp = session.get(url)
+    manager = await get_async_session_manager()
+    resp = await manager.get(url, verbose=verbose)
+    return await asyncio.to_thread(
+        _game_by_game_schedule_results_from_page, resp, team, year
+    )
 
+
+def _game_by_game_schedule_results_from_page(
+    resp: requests.Response | None, team: BREFTeams, year: int
+) -> pl.DataFrame:
     if resp is None:
         raise ValueError(f"Failed to fetch data for {team.name} in {year}.")
 
@@ -238,13 +280,30 @@ def roster_and_appearances(
     Returns:
         pl.DataFrame: Team roster and appearances rows from Baseball Reference.
     """
+    return run_sync(roster_and_appearances_async(team, year, verbose))
+
+
+async def roster_and_appearances_async(
+    team: BREFTeams, year: int, verbose: bool = False
+) -> pl.DataFrame:
+    """Asynchronous variant of :func:`roster_and_appearances`.
+
+    Runs on the caller's event loop, so several pages can be awaited
+    together with ``asyncio.gather``.
+    """
     if not isinstance(team, BREFTeams):
         raise ValueError("Team must be a member of the BREFTeams enum")
     team_code = resolve_bref_team_code(team=team, year=year)
-    polars_data = None
     url = BREF_TEAMS_ROSTER_URL.format(team_code=team_code, year=year)
-    session.set_verbose(verbose)
-    resp = session.get(url)
+    manager = await get_async_session_manager()
+    resp = await manager.get(url, verbose=verbose)
+    return await asyncio.to_thread(_roster_and_appearances_from_page, resp, team, year)
+
+
+def _roster_and_appearances_from_page(
+    resp: requests.Response | None, team: BREFTeams, year: int
+) -> pl.DataFrame:
+    polars_data = None
     if resp:
         table_html = get_bref_table_html(resp.text, "appearances")
         if table_html:
@@ -298,6 +357,31 @@ def batting(
     Returns:
         pl.DataFrame: Requested batting table with normalized column names.
     """
+    return run_sync(batting_async(team, year, metric_type, verbose))
+
+
+async def batting_async(
+    team: BREFTeams,
+    year: int,
+    metric_type: Literal[
+        "standard",
+        "value",
+        "advanced",
+        "sabermetric",
+        "ratio",
+        "win_probability",
+        "baserunning",
+        "situational",
+        "pitches",
+        "cumulative",
+    ] = "standard",
+    verbose: bool = False,
+) -> pl.DataFrame:
+    """Asynchronous variant of :func:`batting`.
+
+    Runs on the caller's event loop, so several pages can be awaited
+    together with ``asyncio.gather``.
+    """
 
     if not isinstance(team, BREFTeams):
         raise ValueError("Team must be a member of the BREFTeams enum")
@@ -323,8 +407,20 @@ def batting(
         team_code=resolve_bref_team_code(team, year=year), year=year
     )
     table_id = f"players_{metric_type}_batting"
-    session.set_verbose(verbose)
-    resp = session.get(url)
+    manager = await get_async_session_manager()
+    resp = await manager.get(url, verbose=verbose)
+    return await asyncio.to_thread(
+        _batting_from_page, resp, team, year, metric_type, table_id
+    )
+
+
+def _batting_from_page(
+    resp: requests.Response | None,
+    team: BREFTeams,
+    year: int,
+    metric_type: str,
+    table_id: str,
+) -> pl.DataFrame:
     polars_data = None
     if resp:
         table_html = get_bref_table_html(resp.text, table_id)
@@ -392,6 +488,31 @@ def pitching(
     Returns:
         pl.DataFrame: Requested pitching table with normalized column names.
     """
+    return run_sync(pitching_async(team, year, metric_type, verbose))
+
+
+async def pitching_async(
+    team: BREFTeams,
+    year: int,
+    metric_type: Literal[
+        "standard",
+        "value",
+        "advanced",
+        "ratio",
+        "batting_against",
+        "win_probability",
+        "starting",
+        "relief",
+        "baserunning_situational",
+        "cumulative",
+    ] = "standard",
+    verbose: bool = False,
+) -> pl.DataFrame:
+    """Asynchronous variant of :func:`pitching`.
+
+    Runs on the caller's event loop, so several pages can be awaited
+    together with ``asyncio.gather``.
+    """
     if not isinstance(team, BREFTeams):
         raise ValueError("Team must be a member of the BREFTeams enum")
     if metric_type not in [
@@ -430,8 +551,20 @@ def pitching(
     url = BREF_TEAMS_PITCHING_BASE_URL.format(
         team_code=resolve_bref_team_code(team, year=year), year=year
     )
-    session.set_verbose(verbose)
-    resp = session.get(url)
+    manager = await get_async_session_manager()
+    resp = await manager.get(url, verbose=verbose)
+    return await asyncio.to_thread(
+        _pitching_from_page, resp, team, year, metric_type, table_id
+    )
+
+
+def _pitching_from_page(
+    resp: requests.Response | None,
+    team: BREFTeams,
+    year: int,
+    metric_type: str,
+    table_id: str,
+) -> pl.DataFrame:
     polars_data = None
     if resp:
         table_html = get_bref_table_html(resp.text, table_id)
@@ -540,6 +673,36 @@ def fielding(
     Returns:
         pl.DataFrame: Requested fielding table with typed numeric columns.
     """
+    return run_sync(fielding_async(team, year, metric_type, position, verbose))
+
+
+async def fielding_async(
+    team: BREFTeams,
+    year: int,
+    metric_type: Literal["standard", "advanced"],
+    position: Literal[
+        "",
+        "all",
+        "c",
+        "1b",
+        "2b",
+        "3b",
+        "ss",
+        "lf",
+        "cf",
+        "rf",
+        "of",
+        "p",
+        "dh",
+        "c_baserunning",
+    ] = "",
+    verbose: bool = False,
+) -> pl.DataFrame:
+    """Asynchronous variant of :func:`fielding`.
+
+    Runs on the caller's event loop, so several pages can be awaited
+    together with ``asyncio.gather``.
+    """
     if not isinstance(team, BREFTeams):
         raise ValueError("Team must be a member of the BREFTeams enum")
 
@@ -603,8 +766,21 @@ def fielding(
     url = BREF_TEAMS_FIELDING_BASE_URL.format(
         team_code=resolve_bref_team_code(team, year=year), year=year
     )
-    session.set_verbose(verbose)
-    resp = session.get(url)
+    manager = await get_async_session_manager()
+    resp = await manager.get(url, verbose=verbose)
+    return await asyncio.to_thread(
+        _fielding_from_page, resp, team, year, metric_type, position, table_id
+    )
+
+
+def _fielding_from_page(
+    resp: requests.Response | None,
+    team: BREFTeams,
+    year: int,
+    metric_type: str,
+    position: str,
+    table_id: str,
+) -> pl.DataFrame:
     polars_data = None
     if resp:
         table_html = get_bref_table_html(resp.text, table_id)
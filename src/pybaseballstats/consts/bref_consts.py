@@ -128,3 +128,14 @@ BREF_SINGLE_PLAYER_BATTING_URL = (
 BREF_SINGLE_PLAYER_PITCHING_URL = (
     "https://www.baseball-reference.com/players/{initial}/{player_code}-pitch.shtml"
 )
+
+# Sports Reference blocks clients that make more than 20 requests a minute
+# (https://www.sports-reference.com/bot-traffic.html).
+BREF_HOST = "baseball-reference.com"
+BREF_MAX_REQUESTS_PER_MINUTE = 20
+# Minimum gap between two requests, before jitter.
+BREF_MIN_REQUEST_INTERVAL_SECONDS = 3.0
+
+# HTTP cache lifetime of pages that may still change: current-season and
+# undated (e.g. career) pages. Pages of past seasons never expire.
+BREF_CURRENT_SEASON_CACHE_TTL_SECONDS = 6 * 60 * 60
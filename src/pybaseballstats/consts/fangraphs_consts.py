@@ -1230,3 +1230,11 @@ FANGRAPHS_BATTING_LEADERBOARD_URL = "https://www.fangraphs.com/api/leaders/major
 
 FANGRAPHS_WAR_LEADERBOARD_URL = "https://www.fangraphs.com/leaders/war?wartype={war_type}&teamid={team_id}&lg={league}&season={season}"
 FANGRAPHS_FIELDING_API_URL = "https://www.fangraphs.com/api/leaders/major-league/data?age=&pos={fielding_position}&stats=fld&lg={league}&qual={min_inn}&season={end_year}&season1={start_year}&startdate=&enddate=&month=0&hand=&team={team}&pageitems=2000000000&pagenum=1&ind=0&rost={active_roster_only}&players=0&type=1&postseason=&sortdir=default&sortstat=Defense"
+
+# FanGraphs publishes no limit; stay polite while allowing short bursts.
+FANGRAPHS_HOST = "fangraphs.com"
+FANGRAPHS_MAX_REQUESTS_PER_MINUTE = 60
+FANGRAPHS_REQUEST_BURST = 5
+
+# HTTP cache lifetime of current-season box scores; past seasons never expire.
+FANGRAPHS_CURRENT_SEASON_CACHE_TTL_SECONDS = 6 * 60 * 60
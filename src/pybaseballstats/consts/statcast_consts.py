@@ -1,6 +1,8 @@
 from datetime import date
 from enum import Enum
 
+import polars as pl
+
 
 class StatcastTeams(Enum):
     DIAMONDBACKS = "AZ"
@@ -43,8 +45,48 @@ class StatcastTeams(Enum):
         return "\n".join(f"{team.name}: {team.value}" for team in cls)
 
 
+class StatcastPitchTypes(Enum):
+    FOUR_SEAM_FASTBALL = "FF"
+    SINKER = "SI"
+    CUTTER = "FC"
+    SLIDER = "SL"
+    SWEEPER = "ST"
+    SLURVE = "SV"
+    CURVEBALL = "CU"
+    KNUCKLE_CURVE = "KC"
+    SLOW_CURVE = "CS"
+    CHANGEUP = "CH"
+    SPLIT_FINGER = "FS"
+    FORKBALL = "FO"
+    SCREWBALL = "SC"
+    KNUCKLEBALL = "KN"
+    EEPHUS = "EP"
+    OTHER = "FA"
+    PITCHOUT = "PO"
+
+    @classmethod
+    def show_options(cls):
+        return "\n".join(f"{pitch.name}: {pitch.value}" for pitch in cls)
+
+
+class StatcastGameTypes(Enum):
+    REGULAR_SEASON = "R"
+    POSTSEASON = "PO"
+    WILD_CARD = "F"
+    DIVISION_SERIES = "D"
+    LEAGUE_CHAMPIONSHIP_SERIES = "L"
+    WORLD_SERIES = "W"
+    SPRING_TRAINING = "S"
+    ALL_STAR = "A"
+    EXHIBITION = "E"
+
+    @classmethod
+    def show_options(cls):
+        return "\n".join(f"{game_type.name}: {game_type.value}" for game_type in cls)
+
+
 STATCAST_SINGLE_GAME_URL = "https://baseballsavant.mlb.com/statcast_search/csv?all=true&type=details&game_pk={game_pk}"
-STATCAST_DATE_RANGE_URL = "https://baseballsavant.mlb.com/statcast_search/csv?all=true&player_type=pitcher&game_date_gt={start_date}&game_date_lt={end_date}&sort_col=pitches&team={team}&player_event_sort=api_p_release_speed&sort_order=desc&type=details#results"
+STATCAST_DATE_RANGE_URL = "https://baseballsavant.mlb.com/statcast_search/csv?all=true&player_type={player_type}&game_date_gt={start_date}&game_date_lt={end_date}&sort_col=pitches&team={team}&player_event_sort=api_p_release_speed&sort_order=desc&type=details#results"
 STATCAST_YEAR_RANGES = {
     2015: (date(2015, 4, 5), date(2015, 11, 1)),
     2016: (date(2016, 4, 3), date(2016, 11, 2)),
@@ -61,3 +103,168 @@ STATCAST_YEAR_RANGES = {
 }
 STATCAST_SINGLE_GAME_EV_PV_WP_URL = "https://baseballsavant.mlb.com/gamefeed?date={game_date}&gamePk={game_pk}&chartType=pitch&legendType=pitchName&playerType=pitcher&inning=&count=&pitchHand=&batSide=&descFilter=&ptFilter=&resultFilter=&hf={stat_type}&sportId=1"
 STATCAST_DATE_FORMAT = "%Y-%m-%d"
+# MLB Stats API schedule, used to plan chunks from the number of games per date.
+MLB_SCHEDULE_URL = "https://statsapi.mlb.com/api/v1/schedule?sportId=1&startDate={start_date}&endDate={end_date}"
+# Bump whenever the shape of cached chunk DataFrames changes so old entries are ignored.
+STATCAST_CACHE_SCHEMA_VERSION = 2
+# Chunks ending within this many days of today are still being corrected upstream.
+STATCAST_CACHE_RECENT_DAYS = 3
+STATCAST_CACHE_RECENT_TTL_SECONDS = 6 * 60 * 60
+# How long a process waits for another process downloading the same cached
+# chunk before downloading it itself.
+STATCAST_CACHE_LOCK_TIMEOUT_SECONDS = 10 * 60
+# Checkpoints of failed pulls older than this are discarded instead of resumed.
+STATCAST_CHECKPOINT_TTL_SECONDS = 24 * 60 * 60
+# File in a sync_pitch_by_pitch store recording which dates have been synced.
+STATCAST_SYNC_MANIFEST_NAME = "_synced_dates.json"
+# Uniquely identifies a pitch across Statcast pulls.
+STATCAST_PITCH_KEY_COLUMNS = ["game_pk", "at_bat_number", "pitch_number"]
+# statcast_search CSV exports silently stop at this many rows.
+STATCAST_SEARCH_ROW_CAP = 25000
+# Typical pitches per game (both teams), used only to estimate chunk sizes.
+STATCAST_EST_PITCHES_PER_GAME = 300
+# Estimated rows per request the balanced chunk planner aims for, leaving
+# headroom under the row cap for games that run long.
+STATCAST_BALANCED_TARGET_ROWS = 20000
+# Days per chunk of the per-team planner: one team's pitches (half a game a
+# day, every day) over this many days stay within the balanced row budget.
+STATCAST_PER_TEAM_CHUNK_DAYS = STATCAST_BALANCED_TARGET_ROWS // (
+    STATCAST_EST_PITCHES_PER_GAME // 2
+)
+# Bounds for the adaptive request concurrency used by the Statcast downloader.
+STATCAST_INITIAL_CONCURRENCY = 4
+STATCAST_MAX_CONCURRENCY = 32
+# Request rate for Savant pages fetched through the shared scraping session
+# (the Statcast downloader paces itself with adaptive concurrency instead).
+SAVANT_HOST = "baseballsavant.mlb.com"
+SAVANT_MAX_REQUESTS_PER_MINUTE = 120
+SAVANT_REQUEST_BURST = 10
+
+_HANDEDNESS = pl.Enum(["L", "R"])
+
+# Declared dtypes for the statcast_search CSV, passed straight to pl.read_csv so
+# every chunk parses to the same compact schema without inference. Columns that
+# Savant adds later and that are not declared here are read as strings.
+STATCAST_PITCH_BY_PITCH_SCHEMA: dict[str, pl.DataType] = {
+    "pitch_type": pl.Categorical(),
+    "game_date": pl.String(),
+    "release_speed": pl.Float32(),
+    "release_pos_x": pl.Float32(),
+    "release_pos_z": pl.Float32(),
+    "player_name": pl.String(),
+    "batter": pl.Int32(),
+    "pitcher": pl.Int32(),
+    "events": pl.Categorical(),
+    "description": pl.Categorical(),
+    "spin_dir": pl.Float32(),
+    "spin_rate_deprecated": pl.Float32(),
+    "break_angle_deprecated": pl.Float32(),
+    "break_length_deprecated": pl.Float32(),
+    "zone": pl.Int8(),
+    "des": pl.String(),
+    "game_type": pl.Categorical(),
+    "stand": _HANDEDNESS,
+    "p_throws": _HANDEDNESS,
+    "home_team": pl.Categorical(),
+    "away_team": pl.Categorical(),
+    "type": pl.Enum(["B", "S", "X"]),
+    "hit_location": pl.Int8(),
+    "bb_type": pl.Categorical(),
+    "balls": pl.Int8(),
+    "strikes": pl.Int8(),
+    "game_year": pl.Int16(),
+    "pfx_x": pl.Float32(),
+    "pfx_z": pl.Float32(),
+    "plate_x": pl.Float32(),
+    "plate_z": pl.Float32(),
+    "on_3b": pl.Int32(),
+    "on_2b": pl.Int32(),
+    "on_1b": pl.Int32(),
+    "outs_when_up": pl.Int8(),
+    "inning": pl.Int8(),
+    "inning_topbot": pl.Enum(["Top", "Bot"]),
+    "hc_x": pl.Float32(),
+    "hc_y": pl.Float32(),
+    "tfs_deprecated": pl.String(),
+    "tfs_zulu_deprecated": pl.String(),
+    "umpire": pl.String(),
+    "sv_id": pl.String(),
+    "vx0": pl.Float32(),
+    "vy0": pl.Float32(),
+    "vz0": pl.Float32(),
+    "ax": pl.Float32(),
+    "ay": pl.Float32(),
+    "az": pl.Float32(),
+    "sz_top": pl.Float32(),
+    "sz_bot": pl.Float32(),
+    "hit_distance_sc": pl.Int16(),
+    "launch_speed": pl.Float32(),
+    "launch_angle": pl.Float32(),
+    "effective_speed": pl.Float32(),
+    "release_spin_rate": pl.Int16(),
+    "release_extension": pl.Float32(),
+    "game_pk": pl.Int32(),
+    # Savant repeats these headers; Polars suffixes the second occurrence.
+    "pitcher_duplicated_0": pl.Int32(),
+    "fielder_2": pl.Int32(),
+    "fielder_2_duplicated_0": pl.Int32(),
+    "fielder_3": pl.Int32(),
+    "fielder_4": pl.Int32(),
+    "fielder_5": pl.Int32(),
+    "fielder_6": pl.Int32(),
+    "fielder_7": pl.Int32(),
+    "fielder_8": pl.Int32(),
+    "fielder_9": pl.Int32(),
+    "release_pos_y": pl.Float32(),
+    "estimated_ba_using_speedangle": pl.Float32(),
+    "estimated_woba_using_speedangle": pl.Float32(),
+    "woba_value": pl.Float32(),
+    "woba_denom": pl.Int8(),
+    "babip_value": pl.Int8(),
+    "iso_value": pl.Int8(),
+    "launch_speed_angle": pl.Int8(),
+    "at_bat_number": pl.Int16(),
+    "pitch_number": pl.Int8(),
+    "pitch_name": pl.Categorical(),
+    "home_score": pl.Int16(),
+    "away_score": pl.Int16(),
+    "bat_score": pl.Int16(),
+    "fld_score": pl.Int16(),
+    "post_away_score": pl.Int16(),
+    "post_home_score": pl.Int16(),
+    "post_bat_score": pl.Int16(),
+    "post_fld_score": pl.Int16(),
+    "if_fielding_alignment": pl.Categorical(),
+    "of_fielding_alignment": pl.Categorical(),
+    "spin_axis": pl.Int16(),
+    "delta_home_win_exp": pl.Float32(),
+    "delta_run_exp": pl.Float32(),
+    "bat_speed": pl.Float32(),
+    "swing_length": pl.Float32(),
+    "estimated_slg_using_speedangle": pl.Float32(),
+    "delta_pitcher_run_exp": pl.Float32(),
+    "hyper_speed": pl.Float32(),
+    "home_score_diff": pl.Int16(),
+    "bat_score_diff": pl.Int16(),
+    "home_win_exp": pl.Float32(),
+    "bat_win_exp": pl.Float32(),
+    "age_pit_legacy": pl.Int8(),
+    "age_bat_legacy": pl.Int8(),
+    "age_pit": pl.Int8(),
+    "age_bat": pl.Int8(),
+    "n_thruorder_pitcher": pl.Int8(),
+    "n_priorpa_thisgame_player_at_bat": pl.Int8(),
+    "pitcher_days_since_prev_game": pl.Int16(),
+    "batter_days_since_prev_game": pl.Int16(),
+    "pitcher_days_until_next_game": pl.Int16(),
+    "batter_days_until_next_game": pl.Int16(),
+    "api_break_z_with_gravity": pl.Float32(),
+    "api_break_x_arm": pl.Float32(),
+    "api_break_x_batter_in": pl.Float32(),
+    "arm_angle": pl.Float32(),
+    "attack_angle": pl.Float32(),
+    "attack_direction": pl.Float32(),
+    "swing_path_tilt": pl.Float32(),
+    "intercept_ball_minus_batter_pos_x_inches": pl.Float32(),
+    "intercept_ball_minus_batter_pos_y_inches": pl.Float32(),
+}
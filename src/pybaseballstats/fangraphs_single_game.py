@@ -1,18 +1,23 @@
+import asyncio
 from datetime import datetime
 
 import polars as pl
 from bs4 import BeautifulSoup
+from curl_cffi import requests
 
 from pybaseballstats.consts.fangraphs_consts import (
     FG_SINGLE_GAME_URL,
     FangraphsSingleGameTeams,
 )
 
-__all__ = ["FangraphsSingleGameTeams", "fangraphs_single_game_play_by_play"]
+__all__ = [
+    "FangraphsSingleGameTeams",
+    "fangraphs_single_game_play_by_play",
+    "fangraphs_single_game_play_by_play_async",
+]
 
-from pybaseballstats.utils.session_utils import PBSSessionManager
-
-session = PBSSessionManager.instance(max_req_per_minute=None)  # type: ignore[attr-defined]
+from pybaseballstats.utils.client_session_utils import run_sync
+from pybaseballstats.utils.session_utils import get_async_session_manager
 
 
 def fangraphs_single_game_play_by_play(
@@ -34,6 +39,19 @@ def fangraphs_single_game_play_by_play(
     Returns:
         pl.DataFrame: A DataFrame of play-by-play data for the given date and team.
     """
+    return run_sync(fangraphs_single_game_play_by_play_async(date, team, verbose))
+
+
+async def fangraphs_single_game_play_by_play_async(
+    date: str,
+    team: FangraphsSingleGameTeams,
+    verbose: bool = False,
+) -> pl.DataFrame:
+    """Asynchronous variant of :func:`fangraphs_single_game_play_by_play`.
+
+    Runs on the caller's event loop, so several games can be awaited
+    together with ``asyncio.gather``.
+    """
     # validate date
     date_object = datetime.strptime(date, "%Y-%m-%d")
     assert date_object, "date must be in 'YYYY-MM-DD' format"
@@ -45,12 +63,19 @@ def fangraphs_single_game_play_by_play(
 
     if type(team) is not FangraphsSingleGameTeams:
         raise ValueError("team must be of type FangraphsSingleGameTeams")
-    session.set_verbose(verbose)
-    resp = session.get(
+    manager = await get_async_session_manager()
+    resp = await manager.get(
         FG_SINGLE_GAME_URL.format(
             date=date_object.strftime("%Y-%m-%d"), team=team.value
-        )
+        ),
+        verbose=verbose,
     )
+    return await asyncio.to_thread(_play_by_play_from_page, resp, date, team)
+
+
+def _play_by_play_from_page(
+    resp: requests.Response | None, date: str, team: FangraphsSingleGameTeams
+) -> pl.DataFrame:
     if resp is None or resp.status_code != 200:
         raise ValueError(
             f"Error fetching data for date {date} and team {team.name}. Please validate inputs."
@@ -1,103 +1,400 @@
 import asyncio
-from typing import Optional
+import os
+from contextlib import aclosing
+from datetime import date, timedelta
+from typing import (
+    AsyncIterator,
+    Callable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import polars as pl
 
 from pybaseballstats.consts.statcast_consts import (
+    STATCAST_CACHE_RECENT_DAYS,
+    STATCAST_DATE_FORMAT,
     STATCAST_DATE_RANGE_URL,
+    StatcastGameTypes,
+    StatcastPitchTypes,
     StatcastTeams,
 )
+from pybaseballstats.utils.client_session_utils import (
+    ClientSessionConfig,
+    close_client_sessions,
+    configure_client_session,
+    iterate_sync,
+    run_sync,
+)
+from pybaseballstats.utils.statcast_cache_utils import (
+    StatcastCheckpoint,
+    StatcastChunkCache,
+)
+from pybaseballstats.utils.statcast_planning_utils import (
+    BalancedPlanner,
+    FixedDaysPlanner,
+    PerTeamPlanner,
+    StatcastChunk,
+    StatcastChunkPlanner,
+)
+from pybaseballstats.utils.statcast_storage_utils import (
+    StatcastParquetSink,
+    StatcastParquetStore,
+)
 from pybaseballstats.utils.statcast_utils import (
+    StatcastFetchReport,
+    _collect_streaming,
+    _concat_chunks,
     _create_date_ranges,
     _fetch_all_data,
     _handle_dates,
+    _iter_chunks,
     _load_all_data,
+    _make_concurrency_limiter,
+    _merge_small_ranges,
+    _missing_date_runs,
+    _season_date_range,
+    _statcast_search_filters,
 )
 
-__all__ = ["pitch_by_pitch_data"]
+__all__ = [
+    "BalancedPlanner",
+    "ClientSessionConfig",
+    "FixedDaysPlanner",
+    "PerTeamPlanner",
+    "StatcastChunkPlanner",
+    "StatcastFetchReport",
+    "close_client_sessions",
+    "configure_client_session",
+    "iter_pitch_by_pitch",
+    "iter_pitch_by_pitch_async",
+    "pitch_by_pitch_data",
+    "pitch_by_pitch_data_async",
+    "player_pitch_by_pitch",
+    "player_pitch_by_pitch_async",
+    "sync_pitch_by_pitch",
+    "sync_pitch_by_pitch_async",
+]
+
+
+def _build_date_range_urls(
+    date_ranges: List[Tuple[date, date]],
+    team: Optional[StatcastTeams],
+    filters: str = "",
+    player_type: Literal["pitcher", "batter"] = "pitcher",
+) -> List[str]:
+    return _build_chunk_urls(
+        [StatcastChunk(start, end, team) for start, end in date_ranges],
+        filters,
+        player_type,
+    )
+
 
+def _build_chunk_urls(
+    chunks: Sequence[StatcastChunk],
+    filters: str = "",
+    player_type: Literal["pitcher", "batter"] = "pitcher",
+) -> List[str]:
+    return [
+        STATCAST_DATE_RANGE_URL.format(
+            player_type=player_type,
+            start_date=chunk.start,
+            end_date=chunk.end,
+            team=chunk.team.value if chunk.team else "",
+        ).replace("#results", f"{filters}#results")
+        for chunk in chunks
+    ]
 
-async def _async_pitch_by_pitch_data(
+
+def _validate_search_filters(
+    pitch_types: Optional[Sequence[StatcastPitchTypes]],
+    pitchers: Optional[Sequence[int]],
+    batters: Optional[Sequence[int]],
+    game_types: Optional[Sequence[StatcastGameTypes]],
+    seasons: Optional[Sequence[int]],
+    columns: Optional[Sequence[str]],
+) -> None:
+    for name, values in (
+        ("pitch_types", pitch_types),
+        ("pitchers", pitchers),
+        ("batters", batters),
+        ("game_types", game_types),
+        ("seasons", seasons),
+    ):
+        # A bare value (e.g. one pitcher id) would fail later with a TypeError.
+        if values is not None and not isinstance(values, (list, tuple)):
+            raise ValueError(f"{name} must be a list or tuple")
+    if pitch_types is not None and not all(
+        isinstance(p, StatcastPitchTypes) for p in pitch_types
+    ):
+        raise ValueError(
+            "pitch_types must be StatcastPitchTypes enum values. See StatcastPitchTypes class for valid values."
+        )
+    if game_types is not None and not all(
+        isinstance(g, StatcastGameTypes) for g in game_types
+    ):
+        raise ValueError(
+            "game_types must be StatcastGameTypes enum values. See StatcastGameTypes class for valid values."
+        )
+    for name, ids in (
+        ("pitchers", pitchers),
+        ("batters", batters),
+        ("seasons", seasons),
+    ):
+        if ids is not None and not all(
+            isinstance(i, int) and not isinstance(i, bool) for i in ids
+        ):
+            raise ValueError(f"{name} must be a sequence of integers")
+    if columns is not None and (
+        isinstance(columns, str)
+        or not columns
+        or not all(isinstance(c, str) for c in columns)
+    ):
+        raise ValueError("columns must be a non-empty sequence of column names")
+
+
+def _prepare_date_range_pull(
+    start_date: str,
+    end_date: str,
+    team: Optional[StatcastTeams],
+    *,
+    pitch_types: Optional[Sequence[StatcastPitchTypes]],
+    pitchers: Optional[Sequence[int]],
+    batters: Optional[Sequence[int]],
+    game_types: Optional[Sequence[StatcastGameTypes]],
+    seasons: Optional[Sequence[int]],
+    columns: Optional[Sequence[str]],
+    chunk_size_days: int,
+    planner: Optional[StatcastChunkPlanner],
+) -> Tuple[date, date, StatcastChunkPlanner, str]:
+    """Validate date-range pull arguments.
+
+    Returns the parsed dates, the chunk planner to use and the encoded search
+    filters.
+    """
+    if start_date is None or end_date is None:
+        raise ValueError("Both start_date and end_date must be provided")
+
+    if not isinstance(team, StatcastTeams) and team is not None:
+        raise ValueError(
+            "Team must be a valid StatcastTeams enum value. See StatcastTeams class for valid values."
+        )
+    _validate_search_filters(
+        pitch_types, pitchers, batters, game_types, seasons, columns
+    )
+
+    start_dt, end_dt = _handle_dates(start_date, end_date)
+    if planner is None:
+        planner = FixedDaysPlanner(chunk_size_days)
+    elif not isinstance(planner, StatcastChunkPlanner):
+        raise ValueError(
+            "planner must be a StatcastChunkPlanner, e.g. FixedDaysPlanner, "
+            "PerTeamPlanner or BalancedPlanner"
+        )
+
+    filters = _statcast_search_filters(
+        pitch_types=pitch_types,
+        pitchers=pitchers,
+        batters=batters,
+        game_types=game_types,
+        seasons=seasons,
+    )
+    return start_dt, end_dt, planner, filters
+
+
+def _plan_urls(
+    planner: StatcastChunkPlanner,
+    start_dt: date,
+    end_dt: date,
+    team: Optional[StatcastTeams],
+    filters: str,
+    verbose: bool,
+) -> List[str]:
+    """Split a pull into chunks with ``planner`` and build their request URLs.
+
+    May block: some planners look up the schedule.
+    """
+    if verbose:
+        print(f"Pulling data for date range: {start_dt} to {end_dt}.")
+        print(f"Splitting date range into chunks with {type(planner).__name__}.")
+    chunks = planner.plan(start_dt, end_dt, team)
+    if verbose:
+        if chunks:
+            print(f"Planned {len(chunks)} request chunk(s).")
+        else:
+            print("No valid date ranges to pull.")
+    return _build_chunk_urls(chunks, filters)
+
+
+async def pitch_by_pitch_data_async(
     start_date: str,
     end_date: str,
     team: Optional[StatcastTeams] = None,
     force_collect: bool = False,
     *,
-    chunk_size_days: int = 3,
+    pitch_types: Optional[Sequence[StatcastPitchTypes]] = None,
+    pitchers: Optional[Sequence[int]] = None,
+    batters: Optional[Sequence[int]] = None,
+    game_types: Optional[Sequence[StatcastGameTypes]] = None,
+    seasons: Optional[Sequence[int]] = None,
+    columns: Optional[Sequence[str]] = None,
+    chunk_size_days: int = 5,
+    planner: Optional[StatcastChunkPlanner] = None,
     show_progress: bool = True,
     concurrency: int | None = None,
     verbose: bool = False,
+    use_cache: bool = False,
+    cache_dir: str | os.PathLike[str] | None = None,
+    sink_dir: str | os.PathLike[str] | None = None,
+    resume: bool = False,
+    on_report: Callable[[StatcastFetchReport], None] | None = None,
+    rechunk: bool = False,
 ) -> pl.LazyFrame | pl.DataFrame | None:
-    """Asynchronously fetch Statcast pitch-by-pitch data for a date range.
+    """Asynchronous variant of :func:`pitch_by_pitch_data`.
+
+    Runs on the caller's event loop and never starts or nests one, so several
+    pulls can be awaited together with ``asyncio.gather``.
 
     Args:
         start_date (str): Start date in ``YYYY-MM-DD`` format.
         end_date (str): End date in ``YYYY-MM-DD`` format.
         team (StatcastTeams | None, optional): Optional team filter.
         force_collect (bool, optional): Return an eager ``pl.DataFrame`` when True.
-        chunk_size_days (int, optional): Days per request chunk.
+        pitch_types (Sequence[StatcastPitchTypes] | None, optional): Only
+            return these pitch types.
+        pitchers (Sequence[int] | None, optional): Only return pitches thrown
+            by these pitchers (MLBAM ids).
+        batters (Sequence[int] | None, optional): Only return pitches to these
+            batters (MLBAM ids).
+        game_types (Sequence[StatcastGameTypes] | None, optional): Only return
+            games of these types, e.g. regular season or postseason.
+        seasons (Sequence[int] | None, optional): Only return games from these
+            seasons.
+        columns (Sequence[str] | None, optional): Only parse and return these
+            columns.
+        chunk_size_days (int, optional): Days per request chunk. Chunks that
+            hit Savant's row cap are split automatically, and adjacent
+            low-volume chunks (e.g. in the postseason) are merged.
+        planner (StatcastChunkPlanner | None, optional): How the range is
+            split into requests, e.g. ``BalancedPlanner()``. Replaces
+            ``chunk_size_days`` when given.
         show_progress (bool, optional): Show progress while downloading/loading.
-        concurrency (int | None, optional): Max concurrent requests override.
+        concurrency (int | None, optional): Fixed number of concurrent
+            requests. By default concurrency adapts to Savant's responses.
         verbose (bool, optional): Print additional runtime logs.
+        use_cache (bool, optional): Serve chunks from the on-disk Parquet cache
+            and store newly downloaded chunks in it.
+        cache_dir (str | os.PathLike | None, optional): Cache location. Defaults
+            to ``~/.cache/pybaseballstats/statcast``.
+        sink_dir (str | os.PathLike | None, optional): Write chunks to a
+            ``year=/month=`` partitioned Parquet dataset as they arrive and
+            return a scan over the written files.
+        resume (bool, optional): Checkpoint completed chunks so that a failed
+            multi-chunk pull can be resumed by repeating the call. Defaults to
+            False, since checkpointing writes every chunk to disk.
+        on_report (Callable[[StatcastFetchReport], None] | None, optional):
+            Called with the per-chunk timings and throughput of the pull once
+            it ends, whether or not it succeeded.
+        rechunk (bool, optional): With ``force_collect``, copy the result into
+            contiguous columns instead of the parsed chunks' buffers.
 
     Raises:
-        ValueError: If ``chunk_size_days`` is not positive.
+        ValueError: If dates are missing or ``chunk_size_days`` is not positive.
+        ValueError: If ``team`` is not a valid ``StatcastTeams`` enum value.
+        ValueError: If a search filter, ``columns`` or ``planner`` has the wrong type.
         RuntimeError: If remote downloads cannot be completed.
 
     Returns:
         pl.LazyFrame | pl.DataFrame | None: Retrieved Statcast data.
     """
-    start_dt, end_dt = _handle_dates(start_date, end_date)
-    if verbose:
-        print(f"Pulling data for date range: {start_dt} to {end_dt}.")
-        print("Splitting date range into smaller chunks.")
-
-    if chunk_size_days <= 0:
-        raise ValueError("chunk_size_days must be a positive integer")
-
-    date_ranges = list(_create_date_ranges(start_dt, end_dt, step=chunk_size_days))
-    if len(date_ranges) == 0:
-        if verbose:
-            print("No valid date ranges to pull. Returning empty DataFrame.")
+    start_dt, end_dt, planner, filters = _prepare_date_range_pull(
+        start_date,
+        end_date,
+        team,
+        pitch_types=pitch_types,
+        pitchers=pitchers,
+        batters=batters,
+        game_types=game_types,
+        seasons=seasons,
+        columns=columns,
+        chunk_size_days=chunk_size_days,
+        planner=planner,
+    )
+    urls = await asyncio.to_thread(
+        _plan_urls, planner, start_dt, end_dt, team, filters, verbose
+    )
+    if not urls:
         return pl.DataFrame() if force_collect else pl.LazyFrame()
 
-    urls = []
-    for chunk_start_dt, chunk_end_dt in date_ranges:
-        urls.append(
-            STATCAST_DATE_RANGE_URL.format(
-                start_date=chunk_start_dt,
-                end_date=chunk_end_dt,
-                team=team.value if team else "",
-            )
-        )
+    sink = StatcastParquetSink(sink_dir) if sink_dir is not None else None
+    if columns is not None:
+        columns = list(dict.fromkeys(columns))
+        if sink is not None and "game_date" not in columns:
+            # The sink partitions on game_date.
+            columns.append("game_date")
 
-    # inclusive days in the requested range (used only for concurrency heuristics)
-    date_range_total_days = (end_dt - start_dt).days + 1
+    limiter = _make_concurrency_limiter(concurrency)
+    checkpoint = (
+        StatcastCheckpoint(urls, columns=columns) if resume and len(urls) > 1 else None
+    )
+    if verbose and checkpoint is not None and checkpoint.completed_count:
+        print(
+            f"Resuming from checkpoint with {checkpoint.completed_count} "
+            "completed chunk(s)."
+        )
+    report = StatcastFetchReport()
     try:
         responses = await _fetch_all_data(
             urls,
-            date_range_total_days,
-            concurrency=concurrency,
+            limiter=limiter,
             show_progress=show_progress,
+            cache=StatcastChunkCache(cache_dir, columns=columns) if use_cache else None,
+            checkpoint=checkpoint,
+            columns=columns,
+            on_chunk=sink.write if sink is not None else None,
+            report=report,
         )
     except RuntimeError as e:
         raise RuntimeError(
             "Unable to complete Statcast pitch-by-pitch download for the requested "
             f"range {start_dt} to {end_dt}. {e}"
         ) from e
-    data_list = _load_all_data(responses, show_progress=show_progress)
+    finally:
+        if on_report is not None:
+            on_report(report)
+    if verbose:
+        print(f"Request concurrency: {limiter.summary()}")
+        print(f"Fetch report: {report.summary()}")
+
+    if sink is not None:
+        if verbose:
+            print(f"Wrote {len(sink.files)} Parquet file(s) to {sink.sink_dir}.")
+        lf = sink.scan()
+        if force_collect:
+            return await asyncio.to_thread(_collect_streaming, lf, rechunk=rechunk)
+        return lf
+
+    # Loading and collecting the chunks is CPU-bound, so it runs in a worker
+    # thread rather than stalling other tasks on the caller's loop.
+    data_list = await asyncio.to_thread(
+        _load_all_data, responses, show_progress=show_progress
+    )
 
     if not data_list:
         print("No data was successfully retrieved.")
 
     if verbose:
         print("Concatenating data.")
-    df = pl.concat(data_list)
+    df = _concat_chunks(data_list)
     if verbose:
         print("Data retrieval complete.")
 
     if force_collect:
-        return df.collect()
+        return await asyncio.to_thread(_collect_streaming, df, rechunk=rechunk)
     return df
 
 
@@ -107,25 +404,83 @@ def pitch_by_pitch_data(
     team: Optional[StatcastTeams] = None,
     force_collect: bool = False,
     *,
-    chunk_size_days: int = 3,
+    pitch_types: Optional[Sequence[StatcastPitchTypes]] = None,
+    pitchers: Optional[Sequence[int]] = None,
+    batters: Optional[Sequence[int]] = None,
+    game_types: Optional[Sequence[StatcastGameTypes]] = None,
+    seasons: Optional[Sequence[int]] = None,
+    columns: Optional[Sequence[str]] = None,
+    chunk_size_days: int = 5,
+    planner: Optional[StatcastChunkPlanner] = None,
     show_progress: bool = True,
     concurrency: int | None = None,
     verbose: bool = False,
+    use_cache: bool = False,
+    cache_dir: str | os.PathLike[str] | None = None,
+    sink_dir: str | os.PathLike[str] | None = None,
+    resume: bool = False,
+    on_report: Callable[[StatcastFetchReport], None] | None = None,
+    rechunk: bool = False,
 ) -> pl.LazyFrame | pl.DataFrame | None:
     """Return pitch-by-pitch Statcast data for a date range.
 
     This function manages async downloading internally and exposes a synchronous
-    interface for scripts and notebooks.
+    interface for scripts and notebooks. Use :func:`pitch_by_pitch_data_async`
+    from async code.
 
     Args:
         start_date (str): Start date in ``YYYY-MM-DD`` format.
         end_date (str): End date in ``YYYY-MM-DD`` format.
         team (StatcastTeams | None, optional): Optional team filter.
         force_collect (bool, optional): Return an eager ``pl.DataFrame`` when True.
-        chunk_size_days (int, optional): Days per request chunk.
+        pitch_types (Sequence[StatcastPitchTypes] | None, optional): Only
+            return these pitch types.
+        pitchers (Sequence[int] | None, optional): Only return pitches thrown
+            by these pitchers (MLBAM ids).
+        batters (Sequence[int] | None, optional): Only return pitches to these
+            batters (MLBAM ids).
+        game_types (Sequence[StatcastGameTypes] | None, optional): Only return
+            games of these types, e.g. regular season or postseason.
+        seasons (Sequence[int] | None, optional): Only return games from these
+            seasons.
+        columns (Sequence[str] | None, optional): Only parse and return these
+            columns.
+        chunk_size_days (int, optional): Days per request chunk. Chunks that
+            hit Savant's row cap are split automatically, and adjacent
+            low-volume chunks (e.g. in the postseason) are merged.
+        planner (StatcastChunkPlanner | None, optional): How the range is
+            split into requests, e.g. ``BalancedPlanner()``. Replaces
+            ``chunk_size_days`` when given.
         show_progress (bool, optional): Show progress while downloading/loading.
-        concurrency (int | None, optional): Max concurrent requests override.
+        concurrency (int | None, optional): Fixed number of concurrent
+            requests. By default concurrency adapts to Savant's responses.
         verbose (bool, optional): Print additional runtime logs.
+        use_cache (bool, optional): Serve chunks from the on-disk Parquet cache
+            and store newly downloaded chunks in it. Chunks from completed
+            seasons never expire; chunks covering the last few days are
+            refreshed after a few hours.
+        cache_dir (str | os.PathLike | None, optional): Cache location. Defaults
+            to ``~/.cache/pybaseballstats/statcast``.
+        sink_dir (str | os.PathLike | None, optional): Stream chunks into a
+            ``year=/month=`` partitioned Parquet dataset under this directory
+            instead of holding them in memory. The result is a
+            ``pl.scan_parquet`` LazyFrame over the files written by this call,
+            with ``year`` and ``month`` partition columns added.
+        resume (bool, optional): Checkpoint every completed chunk under
+            ``~/.cache/pybaseballstats/checkpoints`` while a multi-chunk pull
+            runs. If some chunks still fail after retries, calling the
+            function again with the same arguments (within a day) downloads
+            only the missing chunks. The checkpoint is removed once the pull
+            succeeds. Defaults to False, since checkpointing writes every
+            chunk to disk.
+        on_report (Callable[[StatcastFetchReport], None] | None, optional):
+            Called with the per-chunk timings and throughput of the pull once
+            it ends, whether or not it succeeded.
+        rechunk (bool, optional): With ``force_collect``, return contiguous
+            columns. The result is collected with Polars' streaming engine and
+            by default reuses the buffers of the parsed chunks, which avoids a
+            full copy of the data; rechunking makes that copy once, at the
+            cost of briefly holding the data twice.
 
     Returns:
         pl.LazyFrame | pl.DataFrame | None: ``pl.LazyFrame`` by default,
@@ -134,34 +489,592 @@ def pitch_by_pitch_data(
     Raises:
         ValueError: If dates are missing.
         ValueError: If ``team`` is not a valid ``StatcastTeams`` enum value.
+        ValueError: If a search filter, ``columns`` or ``planner`` has the wrong type.
     """
-    if start_date is None or end_date is None:
-        raise ValueError("Both start_date and end_date must be provided")
-
-    if not isinstance(team, StatcastTeams) and team is not None:
-        raise ValueError(
-            "Team must be a valid StatcastTeams enum value. See StatcastTeams class for valid values."
-        )
-
-    coro = _async_pitch_by_pitch_data(
+    coro = pitch_by_pitch_data_async(
         start_date=start_date,
         end_date=end_date,
         team=team,
         force_collect=force_collect,
+        pitch_types=pitch_types,
+        pitchers=pitchers,
+        batters=batters,
+        game_types=game_types,
+        seasons=seasons,
+        columns=columns,
+        chunk_size_days=chunk_size_days,
+        planner=planner,
+        show_progress=show_progress,
+        concurrency=concurrency,
+        verbose=verbose,
+        use_cache=use_cache,
+        cache_dir=cache_dir,
+        sink_dir=sink_dir,
+        resume=resume,
+        on_report=on_report,
+        rechunk=rechunk,
+    )
+    return run_sync(coro)
+
+
+def iter_pitch_by_pitch_async(
+    start_date: str,
+    end_date: str,
+    team: Optional[StatcastTeams] = None,
+    *,
+    pitch_types: Optional[Sequence[StatcastPitchTypes]] = None,
+    pitchers: Optional[Sequence[int]] = None,
+    batters: Optional[Sequence[int]] = None,
+    game_types: Optional[Sequence[StatcastGameTypes]] = None,
+    seasons: Optional[Sequence[int]] = None,
+    columns: Optional[Sequence[str]] = None,
+    chunk_size_days: int = 5,
+    planner: Optional[StatcastChunkPlanner] = None,
+    show_progress: bool = True,
+    concurrency: int | None = None,
+    verbose: bool = False,
+    use_cache: bool = False,
+    cache_dir: str | os.PathLike[str] | None = None,
+    resume: bool = False,
+    on_report: Callable[[StatcastFetchReport], None] | None = None,
+) -> AsyncIterator[pl.DataFrame]:
+    """Yield pitch-by-pitch Statcast data for a date range one chunk at a time.
+
+    Use with ``async for``. Each chunk is yielded as soon as it has been
+    downloaded and parsed, in completion order rather than date order, while
+    the remaining chunks keep downloading in the background. Arguments are
+    validated when this function is called, before iteration starts.
+
+    Args:
+        start_date (str): Start date in ``YYYY-MM-DD`` format.
+        end_date (str): End date in ``YYYY-MM-DD`` format.
+        team (StatcastTeams | None, optional): Optional team filter.
+        pitch_types (Sequence[StatcastPitchTypes] | None, optional): Only
+            return these pitch types.
+        pitchers (Sequence[int] | None, optional): Only return pitches thrown
+            by these pitchers (MLBAM ids).
+        batters (Sequence[int] | None, optional): Only return pitches to these
+            batters (MLBAM ids).
+        game_types (Sequence[StatcastGameTypes] | None, optional): Only return
+            games of these types, e.g. regular season or postseason.
+        seasons (Sequence[int] | None, optional): Only return games from these
+            seasons.
+        columns (Sequence[str] | None, optional): Only parse and return these
+            columns, so every chunk has exactly these columns in this order.
+        chunk_size_days (int, optional): Days per request chunk.
+        planner (StatcastChunkPlanner | None, optional): How the range is
+            split into requests. Replaces ``chunk_size_days`` when given.
+        show_progress (bool, optional): Show progress while downloading.
+        concurrency (int | None, optional): Fixed number of concurrent
+            requests. By default concurrency adapts to Savant's responses.
+        verbose (bool, optional): Print additional runtime logs.
+        use_cache (bool, optional): Serve chunks from the on-disk Parquet cache
+            and store newly downloaded chunks in it.
+        cache_dir (str | os.PathLike | None, optional): Cache location. Defaults
+            to ``~/.cache/pybaseballstats/statcast``.
+        resume (bool, optional): Checkpoint every chunk before it is yielded,
+            so repeating a call that failed only downloads the missing chunks.
+            Defaults to False.
+        on_report (Callable[[StatcastFetchReport], None] | None, optional):
+            Called with the per-chunk timings and throughput of the pull once
+            it ends, whether or not it succeeded.
+
+    Raises:
+        ValueError: If dates are missing or ``chunk_size_days`` is not positive.
+        ValueError: If ``team`` is not a valid ``StatcastTeams`` enum value.
+        ValueError: If a search filter, ``columns`` or ``planner`` has the wrong type.
+        RuntimeError: During iteration, after every other chunk has been
+            yielded, if some chunks could not be downloaded.
+
+    Returns:
+        AsyncIterator[pl.DataFrame]: Non-empty chunks using the declared
+        Statcast schema.
+    """
+    start_dt, end_dt, planner, filters = _prepare_date_range_pull(
+        start_date,
+        end_date,
+        team,
+        pitch_types=pitch_types,
+        pitchers=pitchers,
+        batters=batters,
+        game_types=game_types,
+        seasons=seasons,
+        columns=columns,
+        chunk_size_days=chunk_size_days,
+        planner=planner,
+    )
+    if columns is not None:
+        columns = list(dict.fromkeys(columns))
+    limiter = _make_concurrency_limiter(concurrency)
+
+    async def _chunks() -> AsyncIterator[pl.DataFrame]:
+        urls = await asyncio.to_thread(
+            _plan_urls, planner, start_dt, end_dt, team, filters, verbose
+        )
+        if not urls:
+            return
+        checkpoint = (
+            StatcastCheckpoint(urls, columns=columns)
+            if resume and len(urls) > 1
+            else None
+        )
+        report = StatcastFetchReport()
+        chunks = _iter_chunks(
+            urls,
+            limiter=limiter,
+            show_progress=show_progress,
+            cache=(
+                StatcastChunkCache(cache_dir, columns=columns) if use_cache else None
+            ),
+            checkpoint=checkpoint,
+            columns=columns,
+            report=report,
+        )
+        try:
+            # aclosing: stopping early must cancel the downloads now, not
+            # whenever the inner generator is garbage collected.
+            async with aclosing(chunks):
+                async for _, df in chunks:
+                    if df.height > 0:
+                        yield df
+        except RuntimeError as e:
+            raise RuntimeError(
+                "Unable to complete Statcast pitch-by-pitch download for the "
+                f"requested range {start_dt} to {end_dt}; the chunks already "
+                f"yielded are complete. {e}"
+            ) from e
+        finally:
+            if on_report is not None:
+                on_report(report)
+        if verbose:
+            print(f"Request concurrency: {limiter.summary()}")
+            print(f"Fetch report: {report.summary()}")
+
+    return _chunks()
+
+
+def iter_pitch_by_pitch(
+    start_date: str,
+    end_date: str,
+    team: Optional[StatcastTeams] = None,
+    *,
+    pitch_types: Optional[Sequence[StatcastPitchTypes]] = None,
+    pitchers: Optional[Sequence[int]] = None,
+    batters: Optional[Sequence[int]] = None,
+    game_types: Optional[Sequence[StatcastGameTypes]] = None,
+    seasons: Optional[Sequence[int]] = None,
+    columns: Optional[Sequence[str]] = None,
+    chunk_size_days: int = 5,
+    planner: Optional[StatcastChunkPlanner] = None,
+    show_progress: bool = True,
+    concurrency: int | None = None,
+    verbose: bool = False,
+    use_cache: bool = False,
+    cache_dir: str | os.PathLike[str] | None = None,
+    resume: bool = False,
+    on_report: Callable[[StatcastFetchReport], None] | None = None,
+) -> Iterator[pl.DataFrame]:
+    """Iterate over pitch-by-pitch Statcast data for a date range by chunk.
+
+    Synchronous counterpart of :func:`iter_pitch_by_pitch_async`: each chunk
+    is returned as soon as it has been downloaded and parsed, while the
+    remaining downloads continue on the library's background event loop. This
+    lets downstream processing (feature computation, database writes) start
+    on the first chunks instead of waiting for the whole range. Breaking out
+    of the loop cancels the downloads still in flight.
+
+    Args:
+        start_date (str): Start date in ``YYYY-MM-DD`` format.
+        end_date (str): End date in ``YYYY-MM-DD`` format.
+        team (StatcastTeams | None, optional): Optional team filter.
+        pitch_types (Sequence[StatcastPitchTypes] | None, optional): Only
+            return these pitch types.
+        pitchers (Sequence[int] | None, optional): Only return pitches thrown
+            by these pitchers (MLBAM ids).
+        batters (Sequence[int] | None, optional): Only return pitches to these
+            batters (MLBAM ids).
+        game_types (Sequence[StatcastGameTypes] | None, optional): Only return
+            games of these types, e.g. regular season or postseason.
+        seasons (Sequence[int] | None, optional): Only return games from these
+            seasons.
+        columns (Sequence[str] | None, optional): Only parse and return these
+            columns, so every chunk has exactly these columns in this order.
+        chunk_size_days (int, optional): Days per request chunk.
+        planner (StatcastChunkPlanner | None, optional): How the range is
+            split into requests. Replaces ``chunk_size_days`` when given.
+        show_progress (bool, optional): Show progress while downloading.
+        concurrency (int | None, optional): Fixed number of concurrent
+            requests. By default concurrency adapts to Savant's responses.
+        verbose (bool, optional): Print additional runtime logs.
+        use_cache (bool, optional): Serve chunks from the on-disk Parquet cache
+            and store newly downloaded chunks in it.
+        cache_dir (str | os.PathLike | None, optional): Cache location. Defaults
+            to ``~/.cache/pybaseballstats/statcast``.
+        resume (bool, optional): Checkpoint every chunk before it is returned,
+            so repeating a call that failed only downloads the missing chunks.
+            Defaults to False.
+        on_report (Callable[[StatcastFetchReport], None] | None, optional):
+            Called with the per-chunk timings and throughput of the pull once
+            it ends, whether or not it succeeded.
+
+    Returns:
+        Iterator[pl.DataFrame]: Non-empty chunks in completion order.
+
+    Raises:
+        ValueError: If dates are missing.
+        ValueError: If ``team`` is not a valid ``StatcastTeams`` enum value.
+        ValueError: If a search filter, ``columns`` or ``planner`` has the wrong type.
+        RuntimeError: During iteration, after every other chunk has been
+            returned, if some chunks could not be downloaded.
+    """
+    chunks = iter_pitch_by_pitch_async(
+        start_date,
+        end_date,
+        team,
+        pitch_types=pitch_types,
+        pitchers=pitchers,
+        batters=batters,
+        game_types=game_types,
+        seasons=seasons,
+        columns=columns,
         chunk_size_days=chunk_size_days,
+        planner=planner,
         show_progress=show_progress,
         concurrency=concurrency,
         verbose=verbose,
+        use_cache=use_cache,
+        cache_dir=cache_dir,
+        resume=resume,
+        on_report=on_report,
+    )
+    return iterate_sync(chunks)
+
+
+async def sync_pitch_by_pitch_async(
+    store_dir: str | os.PathLike[str],
+    start_date: str,
+    end_date: str,
+    team: Optional[StatcastTeams] = None,
+    *,
+    chunk_size_days: int = 5,
+    show_progress: bool = True,
+    concurrency: int | None = None,
+    verbose: bool = False,
+) -> pl.LazyFrame:
+    """Asynchronous variant of :func:`sync_pitch_by_pitch`.
+
+    Runs on the caller's event loop and never starts or nests one, so several
+    pulls can be awaited together with ``asyncio.gather``.
+
+    Args:
+        store_dir (str | os.PathLike): Root of the ``year=/month=`` store.
+        start_date (str): Start date in ``YYYY-MM-DD`` format.
+        end_date (str): End date in ``YYYY-MM-DD`` format.
+        team (StatcastTeams | None, optional): Optional team filter.
+        chunk_size_days (int, optional): Days per request chunk.
+        show_progress (bool, optional): Show progress while downloading.
+        concurrency (int | None, optional): Fixed number of concurrent
+            requests. By default concurrency adapts to Savant's responses.
+        verbose (bool, optional): Print additional runtime logs.
+
+    Raises:
+        ValueError: If dates are missing or ``chunk_size_days`` is not positive.
+        ValueError: If ``team`` is not a valid ``StatcastTeams`` enum value.
+        RuntimeError: If remote downloads cannot be completed.
+
+    Returns:
+        pl.LazyFrame: Stored rows for the requested date range.
+    """
+    if start_date is None or end_date is None:
+        raise ValueError("Both start_date and end_date must be provided")
+
+    if not isinstance(team, StatcastTeams) and team is not None:
+        raise ValueError(
+            "Team must be a valid StatcastTeams enum value. See StatcastTeams class for valid values."
+        )
+
+    start_dt, end_dt = _handle_dates(start_date, end_date)
+    if chunk_size_days <= 0:
+        raise ValueError("chunk_size_days must be a positive integer")
+
+    # Recent dates are still being corrected upstream (and late games may be
+    # missing), so they are re-requested on every sync and the store replaces
+    # the rows it already has for the games they return.
+    refresh_from = date.today() - timedelta(days=STATCAST_CACHE_RECENT_DAYS)
+    store = StatcastParquetStore(store_dir, replace_from=refresh_from)
+    scope = team.value if team is not None else ""
+    # Today's games may still be in progress, so they are never stored.
+    sync_end_dt = min(end_dt, date.today() - timedelta(days=1))
+    synced = {d for d in store.synced_dates(scope) if d < refresh_from}
+
+    date_ranges: List[Tuple[date, date]] = []
+    for gap_start, gap_end in _missing_date_runs(start_dt, sync_end_dt, synced):
+        date_ranges.extend(_create_date_ranges(gap_start, gap_end, chunk_size_days))
+    date_ranges = _merge_small_ranges(date_ranges)
+    if verbose:
+        print(
+            f"{len(synced)} date(s) already synced; "
+            f"requesting {len(date_ranges)} chunk(s) to fill gaps."
+        )
+
+    if date_ranges:
+        urls = _build_date_range_urls(date_ranges, team)
+        limiter = _make_concurrency_limiter(concurrency)
+        try:
+            await _fetch_all_data(
+                urls,
+                limiter=limiter,
+                show_progress=show_progress,
+                on_chunk=store.write,
+            )
+        except RuntimeError as e:
+            raise RuntimeError(
+                "Unable to complete Statcast sync for the requested "
+                f"range {start_dt} to {end_dt}. Chunks downloaded before the "
+                f"failure were kept in {store.sink_dir}. {e}"
+            ) from e
+        if verbose:
+            print(f"Request concurrency: {limiter.summary()}")
+            print(f"Wrote {len(store.files)} new Parquet file(s).")
+    if start_dt <= sync_end_dt:
+        store.record_synced(start_dt, sync_end_dt, scope)
+
+    if not store.existing_files():
+        return pl.LazyFrame()
+    return store.scan_all().filter(
+        pl.col("game_date").is_between(
+            pl.lit(start_dt.strftime(STATCAST_DATE_FORMAT)),
+            pl.lit(end_dt.strftime(STATCAST_DATE_FORMAT)),
+        )
+    )
+
+
+def sync_pitch_by_pitch(
+    store_dir: str | os.PathLike[str],
+    start_date: str,
+    end_date: str,
+    team: Optional[StatcastTeams] = None,
+    *,
+    chunk_size_days: int = 5,
+    show_progress: bool = True,
+    concurrency: int | None = None,
+    verbose: bool = False,
+) -> pl.LazyFrame:
+    """Download only the game dates missing from a local Statcast Parquet store.
+
+    The store uses the same ``year=/month=`` layout as ``pitch_by_pitch_data``'s
+    ``sink_dir`` mode. The dates each sync covers, game days or not, are
+    recorded in a manifest in the store and skipped by later syncs; the
+    remaining gaps are chunked and downloaded, and new rows are appended
+    with duplicates on ``(game_pk, at_bat_number, pitch_number)`` dropped.
+    Today's date is never synced because its games may still be in progress,
+    and the 3 days before it are re-requested on every sync to pick up late
+    games and corrections.
+
+    Args:
+        store_dir (str | os.PathLike): Root directory of the Parquet store.
+        start_date (str): Start date in ``YYYY-MM-DD`` format.
+        end_date (str): End date in ``YYYY-MM-DD`` format.
+        team (StatcastTeams | None, optional): Optional team filter. Use the
+            same value for every sync into a given store.
+        chunk_size_days (int, optional): Days per request chunk.
+        show_progress (bool, optional): Show progress while downloading.
+        concurrency (int | None, optional): Fixed number of concurrent
+            requests. By default concurrency adapts to Savant's responses.
+        verbose (bool, optional): Print additional runtime logs.
+
+    Returns:
+        pl.LazyFrame: Stored rows for ``start_date`` through ``end_date``.
+
+    Raises:
+        ValueError: If dates are missing.
+        ValueError: If ``team`` is not a valid ``StatcastTeams`` enum value.
+    """
+    return run_sync(
+        sync_pitch_by_pitch_async(
+            store_dir,
+            start_date,
+            end_date,
+            team,
+            chunk_size_days=chunk_size_days,
+            show_progress=show_progress,
+            concurrency=concurrency,
+            verbose=verbose,
+        )
+    )
+
+
+async def player_pitch_by_pitch_async(
+    mlbam_id: int,
+    role: Literal["pitcher", "batter"],
+    seasons: Sequence[int] | int,
+    force_collect: bool = False,
+    *,
+    pitch_types: Optional[Sequence[StatcastPitchTypes]] = None,
+    game_types: Optional[Sequence[StatcastGameTypes]] = None,
+    columns: Optional[Sequence[str]] = None,
+    show_progress: bool = True,
+    concurrency: int | None = None,
+    verbose: bool = False,
+    use_cache: bool = False,
+    cache_dir: str | os.PathLike[str] | None = None,
+) -> pl.LazyFrame | pl.DataFrame:
+    """Asynchronous variant of :func:`player_pitch_by_pitch`.
+
+    Runs on the caller's event loop and never starts or nests one, so several
+    pulls can be awaited together with ``asyncio.gather``.
+
+    Args:
+        mlbam_id (int): MLBAM id of the player.
+        role (Literal["pitcher", "batter"]): Whether to fetch pitches thrown by
+            (``"pitcher"``) or thrown to (``"batter"``) the player.
+        seasons (Sequence[int] | int): Season or seasons to fetch (2015 on).
+        force_collect (bool, optional): Return an eager ``pl.DataFrame`` when True.
+        pitch_types (Sequence[StatcastPitchTypes] | None, optional): Only
+            return these pitch types.
+        game_types (Sequence[StatcastGameTypes] | None, optional): Only return
+            games of these types.
+        columns (Sequence[str] | None, optional): Only parse and return these
+            columns.
+        show_progress (bool, optional): Show progress while downloading.
+        concurrency (int | None, optional): Fixed number of concurrent
+            requests. By default concurrency adapts to Savant's responses.
+        verbose (bool, optional): Print additional runtime logs.
+        use_cache (bool, optional): Serve seasons from the on-disk Parquet
+            cache and store newly downloaded seasons in it.
+        cache_dir (str | os.PathLike | None, optional): Cache location.
+
+    Raises:
+        ValueError: If ``mlbam_id``, ``role``, ``seasons`` or a filter is invalid.
+        RuntimeError: If remote downloads cannot be completed.
+
+    Returns:
+        pl.LazyFrame | pl.DataFrame: Retrieved Statcast data.
+    """
+    if not isinstance(mlbam_id, int) or isinstance(mlbam_id, bool):
+        raise ValueError("mlbam_id must be an integer MLBAM player id")
+    if role not in ("pitcher", "batter"):
+        raise ValueError("role must be either 'pitcher' or 'batter'")
+    if isinstance(seasons, int):
+        seasons = [seasons]
+    if not seasons:
+        raise ValueError("At least one season must be provided")
+    _validate_search_filters(pitch_types, None, None, game_types, seasons, columns)
+    if min(seasons) < 2015:
+        raise ValueError("Statcast data is only available from the 2015 season on")
+
+    date_ranges = [
+        season_range
+        for season in sorted(set(seasons))
+        if (season_range := _season_date_range(season)) is not None
+    ]
+    if not date_ranges:
+        if verbose:
+            print("No requested season has started yet. Returning empty DataFrame.")
+        return pl.DataFrame() if force_collect else pl.LazyFrame()
+
+    filters = _statcast_search_filters(
+        pitch_types=pitch_types,
+        pitchers=[mlbam_id] if role == "pitcher" else None,
+        batters=[mlbam_id] if role == "batter" else None,
+        game_types=game_types,
     )
+    # One request per season; the row-cap bisection in _fetch_all_data splits
+    # a season only if a single player ever exceeds Savant's export limit.
+    urls = _build_date_range_urls(date_ranges, None, filters, role)
+    if columns is not None:
+        columns = list(dict.fromkeys(columns))
 
+    limiter = _make_concurrency_limiter(concurrency)
     try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        # No event loop running - normal case for CLI/scripts
-        return asyncio.run(coro)
-    else:
-        # Event loop already running - Jupyter notebooks, existing async context
-        import nest_asyncio  # type: ignore
-
-        nest_asyncio.apply()
-        return loop.run_until_complete(coro)
+        responses = await _fetch_all_data(
+            urls,
+            limiter=limiter,
+            show_progress=show_progress,
+            cache=StatcastChunkCache(cache_dir, columns=columns) if use_cache else None,
+            columns=columns,
+        )
+    except RuntimeError as e:
+        raise RuntimeError(
+            f"Unable to complete Statcast download for {role} {mlbam_id}. {e}"
+        ) from e
+    if verbose:
+        print(f"Request concurrency: {limiter.summary()}")
+
+    data_list = await asyncio.to_thread(
+        _load_all_data, responses, show_progress=show_progress
+    )
+    df = _concat_chunks(data_list)
+    if force_collect:
+        return await asyncio.to_thread(_collect_streaming, df)
+    return df
+
+
+def player_pitch_by_pitch(
+    mlbam_id: int,
+    role: Literal["pitcher", "batter"],
+    seasons: Sequence[int] | int,
+    force_collect: bool = False,
+    *,
+    pitch_types: Optional[Sequence[StatcastPitchTypes]] = None,
+    game_types: Optional[Sequence[StatcastGameTypes]] = None,
+    columns: Optional[Sequence[str]] = None,
+    show_progress: bool = True,
+    concurrency: int | None = None,
+    verbose: bool = False,
+    use_cache: bool = False,
+    cache_dir: str | os.PathLike[str] | None = None,
+) -> pl.LazyFrame | pl.DataFrame:
+    """Return every Statcast pitch thrown or seen by one player.
+
+    Instead of chunking the league-wide search by date, this issues one
+    player-scoped statcast_search request per season, all concurrently, so a
+    full career is a handful of small requests.
+
+    Args:
+        mlbam_id (int): MLBAM id of the player.
+        role (Literal["pitcher", "batter"]): Whether to fetch pitches thrown by
+            (``"pitcher"``) or thrown to (``"batter"``) the player.
+        seasons (Sequence[int] | int): Season or seasons to fetch (2015 on).
+        force_collect (bool, optional): Return an eager ``pl.DataFrame`` when True.
+        pitch_types (Sequence[StatcastPitchTypes] | None, optional): Only
+            return these pitch types.
+        game_types (Sequence[StatcastGameTypes] | None, optional): Only return
+            games of these types, e.g. regular season or postseason.
+        columns (Sequence[str] | None, optional): Only parse and return these
+            columns.
+        show_progress (bool, optional): Show progress while downloading.
+        concurrency (int | None, optional): Fixed number of concurrent
+            requests. By default concurrency adapts to Savant's responses.
+        verbose (bool, optional): Print additional runtime logs.
+        use_cache (bool, optional): Serve seasons from the on-disk Parquet
+            cache and store newly downloaded seasons in it.
+        cache_dir (str | os.PathLike | None, optional): Cache location. Defaults
+            to ``~/.cache/pybaseballstats/statcast``.
+
+    Returns:
+        pl.LazyFrame | pl.DataFrame: ``pl.LazyFrame`` by default,
+        ``pl.DataFrame`` when ``force_collect=True``.
+
+    Raises:
+        ValueError: If ``mlbam_id`` is not an integer.
+        ValueError: If ``role`` is not ``"pitcher"`` or ``"batter"``.
+        ValueError: If ``seasons`` is empty or contains a season before 2015.
+        ValueError: If a search filter or ``columns`` has the wrong type.
+    """
+    return run_sync(
+        player_pitch_by_pitch_async(
+            mlbam_id,
+            role,
+            seasons,
+            force_collect,
+            pitch_types=pitch_types,
+            game_types=game_types,
+            columns=columns,
+            show_progress=show_progress,
+            concurrency=concurrency,
+            verbose=verbose,
+            use_cache=use_cache,
+            cache_dir=cache_dir,
+        )
+    )
@@ -1,11 +1,10 @@
+import asyncio
 import io
 from datetime import datetime
-from typing import List, Literal
+from typing import Any, List, Literal
 
 import polars as pl
-import requests
 from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright
 
 from pybaseballstats.consts.statcast_leaderboard_consts import (
     ABS_CHALLENGES_LEADERBOARD_URL,
@@ -23,6 +22,9 @@ from pybaseballstats.consts.statcast_leaderboard_consts import (
     TIMER_INFRACTIONS_LEADERBOARD_URL,
     StatcastLeaderboardsTeams,
 )
+from pybaseballstats.utils.browser_pool_utils import get_browser_pool
+from pybaseballstats.utils.client_session_utils import run_sync
+from pybaseballstats.utils.session_utils import get_async_session_manager
 
 __all__ = [
     "StatcastLeaderboardsTeams",
@@ -38,13 +40,51 @@ __all__ = [
     "pitch_arsenals_leaderboard",
     "pitch_movement_leaderboard",
     "pitcher_running_game_leaderboard",
+    "park_factor_yearly_leaderboard_async",
+    "park_factor_distance_leaderboard_async",
+    "park_factor_dimensions_leaderboard_async",
+    "timer_infractions_leaderboard_async",
+    "arm_strength_leaderboard_async",
+    "abs_challenges_leaderboard_async",
+    "spin_direction_leaderboard_async",
+    "active_spin_leaderboard_async",
+    "arm_angle_leaderboard_async",
+    "pitch_arsenals_leaderboard_async",
+    "pitch_movement_leaderboard_async",
+    "pitcher_running_game_leaderboard_async",
 ]
 
 
+async def _park_factors_table_html(
+    url: str, wait_until: Literal["domcontentloaded", "load"] = "load"
+) -> str:
+    """Render a park-factor page in the shared browser pool and return its table."""
+    pool = await get_browser_pool()
+    async with pool.page() as page:
+        await page.goto(url, wait_until=wait_until)
+        await page.wait_for_selector("#parkFactors")
+        return await page.inner_html("#parkFactors")
+
+
+async def _read_leaderboard_csv(url: str, **read_csv_kwargs: Any) -> pl.DataFrame:
+    """Download a leaderboard CSV through the shared session and parse it.
+
+    The request is paced by the shared per-host rate limits, and failed
+    requests (including HTTP errors) raise instead of being parsed.
+    """
+    manager = await get_async_session_manager()
+    resp = await manager.get(url)
+    if resp is None:
+        raise RuntimeError(f"Failed to fetch Statcast leaderboard data from {url}")
+    return await asyncio.to_thread(
+        pl.read_csv, io.StringIO(resp.text), **read_csv_kwargs
+    )
+
+
 # region random
 def park_factor_dimensions_leaderboard(
     season: int, metric: Literal["distance", "height"] = "distance"
-):
+) -> pl.DataFrame:
     """Return Baseball Savant park-dimension leaderboard data.
 
     Args:
@@ -58,6 +98,17 @@ def park_factor_dimensions_leaderboard(
     Returns:
         pl.DataFrame: Park-dimension leaderboard data.
     """
+    return run_sync(park_factor_dimensions_leaderboard_async(season, metric))
+
+
+async def park_factor_dimensions_leaderboard_async(
+    season: int, metric: Literal["distance", "height"] = "distance"
+) -> pl.DataFrame:
+    """Asynchronous variant of :func:`park_factor_dimensions_leaderboard`.
+
+    Runs on the caller's event loop, rendering the page in the shared
+    browser pool, so several leaderboards can be gathered.
+    """
     if metric not in ["distance", "height"]:
         raise ValueError("Metric must be either 'distance' or 'height'")
     curr_season = (
@@ -66,18 +117,15 @@ def park_factor_dimensions_leaderboard(
     if season < 2015 or season > curr_season:
         raise ValueError(f"Season must be between 2015 and {curr_season}")
     url = PARK_FACTOR_DIMENSIONS_URL.format(season=season, metric_type=metric)
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
-        try:
-            page.goto(url, wait_until="domcontentloaded")
-            page.wait_for_selector("#parkFactors")
-
-            table_html = page.inner_html("#parkFactors")
-        finally:
-            page.close()
-            browser.close()
+    table_html = await _park_factors_table_html(url, wait_until="domcontentloaded")
+    return await asyncio.to_thread(
+        _park_factor_dimensions_leaderboard_from_html, table_html, metric
+    )
 
+
+def _park_factor_dimensions_leaderboard_from_html(
+    table_html: str, metric: Literal["distance", "height"]
+) -> pl.DataFrame:
     table_soup = BeautifulSoup(table_html, "html.parser")
 
     table = table_soup.find("table")
@@ -260,6 +308,24 @@ def park_factor_yearly_leaderboard(
     Returns:
         pl.DataFrame: Park-factor leaderboard data.
     """
+    return run_sync(
+        park_factor_yearly_leaderboard_async(
+            season, bat_side, conditions, rolling_years
+        )
+    )
+
+
+async def park_factor_yearly_leaderboard_async(
+    season: int,
+    bat_side: Literal["L", "R", ""] = "",
+    conditions: Literal["All", "Day", "Night", "Open Air", "Roof Closed"] = "All",
+    rolling_years: int = 3,  # 1,2,3
+) -> pl.DataFrame:
+    """Asynchronous variant of :func:`park_factor_yearly_leaderboard`.
+
+    Runs on the caller's event loop, rendering the page in the shared
+    browser pool, so several leaderboards can be gathered.
+    """
     if bat_side not in ["L", "R", ""]:
         raise ValueError("bat_side must be 'L', 'R', or ''")
     if conditions not in ["All", "Day", "Night", "Open Air", "Roof Closed"]:
@@ -280,18 +346,13 @@ def park_factor_yearly_leaderboard(
         condition=conditions,
         rolling_years=rolling_years,
     )
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
-        try:
-            page.goto(url)
-            page.wait_for_selector("#parkFactors")
-
-            table_html = page.inner_html("#parkFactors")
-        finally:
-            page.close()
-            browser.close()
+    table_html = await _park_factors_table_html(url)
+    return await asyncio.to_thread(
+        _park_factor_yearly_leaderboard_from_html, table_html
+    )
 
+
+def _park_factor_yearly_leaderboard_from_html(table_html: str) -> pl.DataFrame:
     table_soup = BeautifulSoup(table_html, "html.parser")
 
     table = table_soup.find("table")
@@ -352,6 +413,15 @@ def park_factor_distance_leaderboard(season: int) -> pl.DataFrame:
     Returns:
         pl.DataFrame: Park-factor distance leaderboard data.
     """
+    return run_sync(park_factor_distance_leaderboard_async(season))
+
+
+async def park_factor_distance_leaderboard_async(season: int) -> pl.DataFrame:
+    """Asynchronous variant of :func:`park_factor_distance_leaderboard`.
+
+    Runs on the caller's event loop, rendering the page in the shared
+    browser pool, so several leaderboards can be gathered.
+    """
     curr_season = (
         datetime.now().year if datetime.now().month >= 3 else datetime.now().year - 1
     )
@@ -359,18 +429,13 @@ def park_factor_distance_leaderboard(season: int) -> pl.DataFrame:
         raise ValueError(f"Season must be between 2016 and {curr_season}")
 
     url = PARK_FACTOR_DISTANCE_URL.format(season=season)
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
-        try:
-            page.goto(url)
-            page.wait_for_selector("#parkFactors")
-
-            table_html = page.inner_html("#parkFactors")
-        finally:
-            page.close()
-            browser.close()
+    table_html = await _park_factors_table_html(url)
+    return await asyncio.to_thread(
+        _park_factor_distance_leaderboard_from_html, table_html
+    )
 
+
+def _park_factor_distance_leaderboard_from_html(table_html: str) -> pl.DataFrame:
     table_soup = BeautifulSoup(table_html, "html.parser")
     thead = table_soup.find("thead")
     assert thead is not None, "Could not find table header element"
@@ -467,6 +532,25 @@ def timer_infractions_leaderboard(
     Returns:
         pl.DataFrame: Timer-infraction leaderboard data.
     """
+    return run_sync(
+        timer_infractions_leaderboard_async(
+            season=season,
+            perspective=perspective,
+            min_pitches=min_pitches,
+        )
+    )
+
+
+async def timer_infractions_leaderboard_async(
+    season: int,
+    perspective: Literal["Pit", "Bat", "Cat", "Team"] = "Pit",
+    min_pitches: int = 1,
+) -> pl.DataFrame:
+    """Asynchronous variant of :func:`timer_infractions_leaderboard`.
+
+    Runs on the caller's event loop, so several leaderboards can be
+    awaited together with ``asyncio.gather``.
+    """
     if perspective not in ["Pit", "Bat", "Cat", "Team"]:
         raise ValueError("perspective must be one of 'Pit', 'Bat', 'Cat', or 'Team'")
     if min_pitches < 1:
@@ -477,12 +561,11 @@ def timer_infractions_leaderboard(
     if season < 2023 or season > curr_season:
         raise ValueError(f"Season must be between 2023 and {curr_season}")
 
-    resp = requests.get(
+    df = await _read_leaderboard_csv(
         TIMER_INFRACTIONS_LEADERBOARD_URL.format(
             perspective=perspective, season=season, min_pitches=min_pitches
         )
     )
-    df = pl.read_csv(io.StringIO(resp.text))
     df = df.rename(
         {
             "entity_name": "player_name"
@@ -550,6 +633,53 @@ def abs_challenges_leaderboard(
     Returns:
         pl.DataFrame: ABS challenges leaderboard data.
     """
+    return run_sync(
+        abs_challenges_leaderboard_async(
+            season=season,
+            challenge_type=challenge_type,
+            game_type=game_type,
+            level=level,
+            challenging_teams=challenging_teams,
+            opposing_teams=opposing_teams,
+            pitch_types=pitch_types,
+            attack_zone=attack_zone,
+            in_zone=in_zone,
+            min_challenges=min_challenges,
+            min_opp_challenges=min_opp_challenges,
+        )
+    )
+
+
+async def abs_challenges_leaderboard_async(
+    season: int,
+    challenge_type: Literal[
+        "batter",
+        "batting-team",
+        "catcher",
+        "pitcher",
+        "catching-team",
+        "team-summary",
+        "league",
+    ] = "batter",
+    game_type: Literal["regular", "spring", "playoff"] = "regular",
+    level: Literal["mlb", "aaa"] = "mlb",
+    challenging_teams: List[StatcastLeaderboardsTeams] | None = None,
+    opposing_teams: List[StatcastLeaderboardsTeams] | None = None,
+    pitch_types: List[
+        Literal["FF", "SI", "FC", "CH", "FS", "FO", "SC", "CU", "SL", "ST", "SV", "KN"]
+    ]
+    | None = None,
+    attack_zone: List[Literal["11", "12", "13", "14", "16", "17", "18", "19"]]
+    | None = None,
+    in_zone: bool | None = None,
+    min_challenges: int = 0,
+    min_opp_challenges: int = 0,
+) -> pl.DataFrame:
+    """Asynchronous variant of :func:`abs_challenges_leaderboard`.
+
+    Runs on the caller's event loop, so several leaderboards can be
+    awaited together with ``asyncio.gather``.
+    """
     # Validate inputs
 
     # season must be greater than 2025
@@ -675,7 +805,7 @@ def abs_challenges_leaderboard(
         min_challenges=min_challenges,
         min_opp_challenges=min_opp_challenges,
     )
-    df = pl.read_csv(io.StringIO(requests.get(url).text))
+    df = await _read_leaderboard_csv(url)
     return df
 
 
@@ -711,6 +841,31 @@ def arm_strength_leaderboard(
     Returns:
         pl.DataFrame: Arm-strength leaderboard data.
     """
+    return run_sync(
+        arm_strength_leaderboard_async(
+            stat_type=stat_type,
+            year=year,
+            min_throws=min_throws,
+            pos=pos,
+            team=team,
+        )
+    )
+
+
+async def arm_strength_leaderboard_async(
+    stat_type: Literal["player", "team"] = "player",
+    year: int | str = 2025,  # All for all years (9999) is passed in
+    min_throws: int = 50,
+    pos: Literal[
+        "All", "2b_ss_3b", "outfield", "1b", "2b", "3b", "ss", "lf", "cf", "rf"
+    ] = "All",
+    team: StatcastLeaderboardsTeams | None = None,
+) -> pl.DataFrame:
+    """Asynchronous variant of :func:`arm_strength_leaderboard`.
+
+    Runs on the caller's event loop, so several leaderboards can be
+    awaited together with ``asyncio.gather``.
+    """
     if stat_type not in ["player", "team"]:
         raise ValueError("stat_type must be either 'player' or 'team'")
     if isinstance(year, int) and (year < 2020 or year > datetime.now().year):
@@ -741,8 +896,7 @@ def arm_strength_leaderboard(
         pos=ARM_STRENGTH_POS_INPUT_MAP[pos],
         team=team_value,
     )
-    resp = requests.get(url)
-    df = pl.read_csv(io.StringIO(resp.text), truncate_ragged_lines=True)
+    df = await _read_leaderboard_csv(url, truncate_ragged_lines=True)
     if stat_type == "player":
         df = df.drop(["team_name"])
     if stat_type == "team":
@@ -809,6 +963,31 @@ def spin_direction_leaderboard(
         - Spin direction data has been available since 2020.
         - Column names are standardized with ``last_name, first_name`` renamed to ``player_name``.
     """
+    return run_sync(
+        spin_direction_leaderboard_async(
+            season=season,
+            team=team,
+            pitch_type=pitch_type,
+            pitcher_handedness=pitcher_handedness,
+            min_pitches=min_pitches,
+        )
+    )
+
+
+async def spin_direction_leaderboard_async(
+    season: int | str = "ALL",
+    team: StatcastLeaderboardsTeams | None = None,
+    pitch_type: Literal[
+        "FF", "CH", "CU", "FC", "FO", "KN", "SC", "SI", "SL", "SV", "FS", "ST", "ALL"
+    ] = "ALL",
+    pitcher_handedness: Literal["R", "L", "ALL"] = "ALL",
+    min_pitches: int | str = "q",
+) -> pl.DataFrame:
+    """Asynchronous variant of :func:`spin_direction_leaderboard`.
+
+    Runs on the caller's event loop, so several leaderboards can be
+    awaited together with ``asyncio.gather``.
+    """
     # validate season input, can either be int from 2020 to current year, or "ALL"
     if isinstance(season, int):
         if season < 2020 or season > datetime.now().year:
@@ -869,8 +1048,7 @@ def spin_direction_leaderboard(
         team_id=team_id_param,
         throws=throws_param,
     )
-    resp = requests.get(url)
-    df = pl.read_csv(io.StringIO(resp.text))
+    df = await _read_leaderboard_csv(url)
     df = df.rename({"last_name, first_name": "player_name"})
     return df
 
@@ -914,6 +1092,27 @@ def active_spin_leaderboard(
         - Observed spin measurements are available from 2017 onwards.
         - Column names are standardized with ``entity_name`` to ``player_name`` and ``entity_id`` to ``player_id``.
     """
+    return run_sync(
+        active_spin_leaderboard_async(
+            season=season,
+            min_pitches=min_pitches,
+            stat_method=stat_method,
+            pitcher_handedness=pitcher_handedness,
+        )
+    )
+
+
+async def active_spin_leaderboard_async(
+    season: int,
+    min_pitches: int = 100,
+    stat_method: Literal["spin-based", "observed"] = "spin-based",
+    pitcher_handedness: Literal["R", "L", "ALL"] = "ALL",
+) -> pl.DataFrame:
+    """Asynchronous variant of :func:`active_spin_leaderboard`.
+
+    Runs on the caller's event loop, so several leaderboards can be
+    awaited together with ``asyncio.gather``.
+    """
     # validate season input
     if season < 2017 or season > datetime.now().year:
         raise ValueError(f"season must be between 2017 and {datetime.now().year}")
@@ -936,8 +1135,7 @@ def active_spin_leaderboard(
         min_pitches=min_pitches,
         pitcher_handedness=throws_param,
     )
-    resp = requests.get(url)
-    df = pl.read_csv(io.StringIO(resp.text))
+    df = await _read_leaderboard_csv(url)
     df = df.rename({"entity_name": "player_name", "entity_id": "player_id"})
     return df
 
@@ -1015,6 +1213,47 @@ def arm_angle_leaderboard(
         - Seasons are automatically inferred from the date range.
         - Data is aggregated across all inferred seasons unless ``group_by`` includes ``"season"``.
     """
+    return run_sync(
+        arm_angle_leaderboard_async(
+            start_date=start_date,
+            end_date=end_date,
+            teams=teams,
+            season_type=season_type,
+            pitcher_handedness=pitcher_handedness,
+            batter_handedness=batter_handedness,
+            pitch_types=pitch_types,
+            min_pitches=min_pitches,
+            group_by=group_by,
+            min_group_size=min_group_size,
+        )
+    )
+
+
+async def arm_angle_leaderboard_async(
+    start_date: str = "2020-01-01",
+    end_date: str = datetime.today().strftime("%Y-%m-%d"),
+    teams: List[StatcastLeaderboardsTeams] | None = None,
+    season_type: List[Literal["R", "WC", "DS", "CS", "WS"]] | None = None,
+    pitcher_handedness: Literal["R", "L", "ALL"] = "ALL",
+    batter_handedness: Literal["R", "L", "ALL"] = "ALL",
+    pitch_types: List[
+        Literal["FF", "SI", "FC", "CH", "FS", "FO", "SC", "CU", "SL", "ST", "SV", "KN"]
+    ]
+    | None = None,
+    min_pitches: int | str = "q",
+    group_by: List[
+        Literal[
+            "season", "month", "pitch_type", "game_type", "bat_side", "fielding_team"
+        ]
+    ]
+    | None = None,
+    min_group_size: int = 1,
+) -> pl.DataFrame:
+    """Asynchronous variant of :func:`arm_angle_leaderboard`.
+
+    Runs on the caller's event loop, so several leaderboards can be
+    awaited together with ``asyncio.gather``.
+    """
     # validate date inputs
     try:
         start_date_obj = datetime.strptime(start_date, "%Y-%m-%d")
@@ -1149,8 +1388,7 @@ def arm_angle_leaderboard(
         team=teams_param,
         seasons_inferred=seasons_inferred,
     )
-    resp = requests.get(url)
-    df = pl.read_csv(io.StringIO(resp.text))
+    df = await _read_leaderboard_csv(url)
     if "api_pitch_type_group03" in df.columns:
         df = df.rename({"api_pitch_type_group03": "pitch_type"})
     if "api_game_date_month_text" in df.columns:
@@ -1198,6 +1436,27 @@ def pitch_arsenals_leaderboard(
         - Usage percentage metrics are calculated as percentages across all pitch types thrown.
         - Column names are automatically standardized after retrieval.
     """
+    return run_sync(
+        pitch_arsenals_leaderboard_async(
+            season=season,
+            metric_type=metric_type,
+            pitcher_handedness=pitcher_handedness,
+            min_pitches=min_pitches,
+        )
+    )
+
+
+async def pitch_arsenals_leaderboard_async(
+    season: int = 2026,
+    metric_type: Literal["avg_speed", "usage_percentage", "avg_spin"] = "avg_speed",
+    pitcher_handedness: Literal["R", "L", "ALL"] = "ALL",
+    min_pitches: int | str = "q",
+) -> pl.DataFrame:
+    """Asynchronous variant of :func:`pitch_arsenals_leaderboard`.
+
+    Runs on the caller's event loop, so several leaderboards can be
+    awaited together with ``asyncio.gather``.
+    """
     # validate season input
     if season < 2008 or season > datetime.now().year:
         raise ValueError(f"season must be between 2008 and {datetime.now().year}")
@@ -1228,8 +1487,7 @@ def pitch_arsenals_leaderboard(
         pitcher_handedness=throws_param,
         min_pitches=min_pitches_param,
     )
-    resp = requests.get(url)
-    df = pl.read_csv(io.StringIO(resp.text))
+    df = await _read_leaderboard_csv(url)
     df = df.rename({"last_name, first_name": "player_name", "pitcher": "player_id"})
     if metric_type == "usage_percentage":
         for col in df.columns:
@@ -1282,6 +1540,29 @@ def pitch_movement_leaderboard(
         - Movement metrics typically include induced vertical break (IVB) and horizontal break (HB).
         - Column names are standardized with ``last_name, first_name`` renamed to ``player_name``.
     """
+    return run_sync(
+        pitch_movement_leaderboard_async(
+            season=season,
+            pitch_type=pitch_type,
+            pitcher_handedness=pitcher_handedness,
+            min_pitches=min_pitches,
+        )
+    )
+
+
+async def pitch_movement_leaderboard_async(
+    season: int = 2026,
+    pitch_type: Literal[
+        "FF", "CH", "CU", "FC", "FO", "KN", "SC", "SI", "SL", "SV", "FS", "ST", "ALL"
+    ] = "ALL",
+    pitcher_handedness: Literal["R", "L", "ALL"] = "ALL",
+    min_pitches: int | str = "q",
+) -> pl.DataFrame:
+    """Asynchronous variant of :func:`pitch_movement_leaderboard`.
+
+    Runs on the caller's event loop, so several leaderboards can be
+    awaited together with ``asyncio.gather``.
+    """
     # validate season input
     if season < 2017 or season > datetime.now().year:
         raise ValueError(f"season must be between 2017 and {datetime.now().year}")
@@ -1327,8 +1608,7 @@ def pitch_movement_leaderboard(
         pitcher_handedness=throws_param,
         min_pitches=min_pitches_param,
     )
-    resp = requests.get(url)
-    df = pl.read_csv(io.StringIO(resp.text))
+    df = await _read_leaderboard_csv(url)
     df = df.rename({"last_name, first_name": "player_name"})
     return df
 
@@ -1400,6 +1680,41 @@ def pitcher_running_game_leaderboard(
         - The ``"All-Split"`` team option is useful for tracking pitchers who played for multiple teams.
         - Results can be aggregated across years or split by individual season using ``split_years``.
     """
+    return run_sync(
+        pitcher_running_game_leaderboard_async(
+            start_season=start_season,
+            end_season=end_season,
+            game_type=game_type,
+            group_by=group_by,
+            pitcher_handedness=pitcher_handedness,
+            runner_movement=runner_movement,
+            target_base=target_base,
+            num_prior_disengagements=num_prior_disengagements,
+            min_sb_opportunities=min_sb_opportunities,
+            team=team,
+            split_years=split_years,
+        )
+    )
+
+
+async def pitcher_running_game_leaderboard_async(
+    start_season: int,
+    end_season: int,
+    game_type: Literal["Regular", "Playoff", "All"] = "All",
+    group_by: Literal["Pit", "Pitching Team", "League"] = "Pit",
+    pitcher_handedness: Literal["R", "L", "ALL"] = "ALL",
+    runner_movement: Literal["All", "Advance", "Out", "Hold"] = "All",
+    target_base: Literal["All", "2B", "3B"] = "All",
+    num_prior_disengagements: Literal["All", "0", "1", "2", "3+"] = "All",
+    min_sb_opportunities: int | str = "q",
+    team: StatcastLeaderboardsTeams | str = "All",
+    split_years: bool = False,
+) -> pl.DataFrame:
+    """Asynchronous variant of :func:`pitcher_running_game_leaderboard`.
+
+    Runs on the caller's event loop, so several leaderboards can be
+    awaited together with ``asyncio.gather``.
+    """
     # validate season inputs
     if start_season < 2016 or start_season > datetime.now().year:
         raise ValueError(f"start_season must be between 2016 and {datetime.now().year}")
@@ -1484,8 +1799,7 @@ def pitcher_running_game_leaderboard(
         team=team_param,
         group_by=group_by_param,
     )
-    resp = requests.get(url)
-    df = pl.read_csv(io.StringIO(resp.text))
+    df = await _read_leaderboard_csv(url)
     return df
 
 
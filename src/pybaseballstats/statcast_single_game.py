@@ -1,58 +1,57 @@
 import asyncio
-import io
 from typing import Dict, List
 
-import nest_asyncio  # type: ignore
 import polars as pl
-import requests
 from bs4 import BeautifulSoup
 
 from pybaseballstats.consts.statcast_consts import (
     STATCAST_SINGLE_GAME_EV_PV_WP_URL,
     STATCAST_SINGLE_GAME_URL,
 )
-from pybaseballstats.statcast import pitch_by_pitch_data
+from pybaseballstats.statcast import pitch_by_pitch_data_async
+from pybaseballstats.utils.client_session_utils import get_client_session, run_sync
 from pybaseballstats.utils.statcast_single_game_utils import (
     _handle_single_game_date,
     fetch_gamefeed_table_html,
     get_page_async,
 )
+from pybaseballstats.utils.statcast_utils import _parse_statcast_csv, _read_body
 
 __all__ = [
     "get_available_game_pks_for_date",
+    "get_available_game_pks_for_date_async",
     "single_game_pitch_by_pitch",
+    "single_game_pitch_by_pitch_async",
     "single_game_exit_velocity",
+    "single_game_exit_velocity_async",
     "single_game_pitch_velocity",
+    "single_game_pitch_velocity_async",
     "single_game_win_probability",
+    "single_game_win_probability_async",
 ]
 
 
-# helper for running async code in sync functions
-def _run_in_loop(coro):
-    """Run an async coroutine in the current runtime context.
-
-    If an event loop is already active (e.g. notebooks), this function applies
-    ``nest_asyncio`` and reuses the running loop.
+def get_available_game_pks_for_date(
+    game_date: str,
+) -> List[Dict[str, str]]:
+    """Return game IDs and teams for all games on a date.
 
     Args:
-        coro: Coroutine object to execute.
+        game_date (str): Date in ``YYYY-MM-DD`` format.
 
     Returns:
-        Any: Result returned by ``coro``.
+        list[dict[str, str]]: One dictionary per game with ``game_pk``,
+        ``home_team``, and ``away_team``.
     """
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        return asyncio.run(coro)
-    else:
-        nest_asyncio.apply()
-        return loop.run_until_complete(coro)
+    return run_sync(get_available_game_pks_for_date_async(game_date))
 
 
-def get_available_game_pks_for_date(
+async def get_available_game_pks_for_date_async(
     game_date: str,
 ) -> List[Dict[str, str]]:
-    """Return game IDs and teams for all games on a date.
+    """Asynchronous variant of :func:`get_available_game_pks_for_date`.
+
+    Runs on the caller's event loop, so several dates can be gathered.
 
     Args:
         game_date (str): Date in ``YYYY-MM-DD`` format.
@@ -62,10 +61,11 @@ def get_available_game_pks_for_date(
         ``home_team``, and ``away_team``.
     """
     available_games: List[Dict[str, str]] = []
-    df = pitch_by_pitch_data(
+    df = await pitch_by_pitch_data_async(
         game_date,
         game_date,
         force_collect=True,  # we force collect here bc we only have one day, dataframe shouldnt be too large
+        columns=["game_pk", "home_team", "away_team"],
     )  # don't need game date string conversion here, the pitch_by_pitch_data function handles that
     if df is None:
         return available_games
@@ -92,15 +92,43 @@ def single_game_pitch_by_pitch(game_pk: int) -> pl.DataFrame:
     Args:
         game_pk (int): Baseball Savant game identifier.
 
+    Raises:
+        RuntimeError: If Savant answers with an HTTP error.
+
     Returns:
         pl.DataFrame: Pitch-level Statcast data for the requested game.
     """
-    response = requests.get(
-        STATCAST_SINGLE_GAME_URL.format(game_pk=game_pk),
-    )
-    statcast_content = response.content
-    df = pl.read_csv(io.StringIO(statcast_content.decode("utf-8")))
-    return df
+    return run_sync(single_game_pitch_by_pitch_async(game_pk))
+
+
+async def single_game_pitch_by_pitch_async(game_pk: int) -> pl.DataFrame:
+    """Asynchronous variant of :func:`single_game_pitch_by_pitch`.
+
+    Runs on the caller's event loop, so several games can be gathered.
+
+    Args:
+        game_pk (int): Baseball Savant game identifier.
+
+    Raises:
+        RuntimeError: If Savant answers with an HTTP error.
+
+    Returns:
+        pl.DataFrame: Pitch-level Statcast data for the requested game.
+    """
+    session = await get_client_session()
+    async with session.get(
+        STATCAST_SINGLE_GAME_URL.format(game_pk=game_pk)
+    ) as response:
+        if response.status != 200:
+            # Error pages (429/5xx) are not CSV; don't parse them as data.
+            raise RuntimeError(
+                f"Unable to fetch Statcast data for game {game_pk}: "
+                f"HTTP {response.status}"
+            )
+        body = await _read_body(response)
+    if body is None:
+        return pl.DataFrame()
+    return await asyncio.to_thread(_parse_statcast_csv, body)
 
 
 def single_game_exit_velocity(game_pk: int, game_date: str) -> pl.DataFrame:
@@ -117,13 +145,26 @@ def single_game_exit_velocity(game_pk: int, game_date: str) -> pl.DataFrame:
         ball in play). Returns an empty DataFrame when no table can be loaded
         (for example, invalid ``game_pk``/date or upstream fetch failure).
     """
-    return _run_in_loop(_single_game_exit_velocity_async(game_pk, game_date))
+    return run_sync(single_game_exit_velocity_async(game_pk, game_date))
 
 
-async def _single_game_exit_velocity_async(
+async def single_game_exit_velocity_async(
     game_pk: int,
     game_date: str,
 ) -> pl.DataFrame:
+    """Asynchronous variant of :func:`single_game_exit_velocity`.
+
+    Runs on the caller's event loop, so several games can be gathered.
+
+    Args:
+        game_pk (int): Baseball Savant game identifier.
+        game_date (str): Game date in ``YYYY-MM-DD`` format. Must match
+            ``game_pk``.
+
+    Returns:
+        pl.DataFrame: The exit velocity table, or an empty DataFrame when it
+        cannot be loaded.
+    """
     game_date_str = _handle_single_game_date(game_date)
     url = STATCAST_SINGLE_GAME_EV_PV_WP_URL.format(
         game_date=game_date_str, game_pk=game_pk, stat_type="exitVelocity"
@@ -252,13 +293,26 @@ def single_game_pitch_velocity(game_pk: int, game_date: str) -> pl.DataFrame:
         pitch). Returns an empty DataFrame when no table can be loaded
         (for example, invalid ``game_pk``/date or upstream fetch failure).
     """
-    return _run_in_loop(_single_game_pitch_velocity_async(game_pk, game_date))
+    return run_sync(single_game_pitch_velocity_async(game_pk, game_date))
 
 
-async def _single_game_pitch_velocity_async(
+async def single_game_pitch_velocity_async(
     game_pk: int,
     game_date: str,
 ) -> pl.DataFrame:
+    """Asynchronous variant of :func:`single_game_pitch_velocity`.
+
+    Runs on the caller's event loop, so several games can be gathered.
+
+    Args:
+        game_pk (int): Baseball Savant game identifier.
+        game_date (str): Game date in ``YYYY-MM-DD`` format. Must match
+            ``game_pk``.
+
+    Returns:
+        pl.DataFrame: The pitch velocity table, or an empty DataFrame when it
+        cannot be loaded.
+    """
     game_date_str = _handle_single_game_date(game_date)
     url = STATCAST_SINGLE_GAME_EV_PV_WP_URL.format(
         game_date=game_date_str, game_pk=game_pk, stat_type="pitchVelocity"
@@ -395,13 +449,26 @@ def single_game_win_probability(game_pk: int, game_date: str) -> pl.DataFrame:
         table can be loaded (for example, invalid ``game_pk``/date or upstream
         fetch failure).
     """
-    return _run_in_loop(_single_game_win_probability_async(game_pk, game_date))
+    return run_sync(single_game_win_probability_async(game_pk, game_date))
 
 
-async def _single_game_win_probability_async(
+async def single_game_win_probability_async(
     game_pk: int,
     game_date: str,
 ) -> pl.DataFrame:
+    """Asynchronous variant of :func:`single_game_win_probability`.
+
+    Runs on the caller's event loop, so several games can be gathered.
+
+    Args:
+        game_pk (int): Baseball Savant game identifier.
+        game_date (str): Game date in ``YYYY-MM-DD`` format. Must match
+            ``game_pk``.
+
+    Returns:
+        pl.DataFrame: The win probability table, or an empty DataFrame when it
+        cannot be loaded.
+    """
     game_date_str = _handle_single_game_date(game_date)
     url = STATCAST_SINGLE_GAME_EV_PV_WP_URL.format(
         game_date=game_date_str, game_pk=game_pk, stat_type="winProbability"
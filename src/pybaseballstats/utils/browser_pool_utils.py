@@ -0,0 +1,330 @@
+import asyncio
+import atexit
+import os
+import weakref
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Sequence,
+    Tuple,
+)
+
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    async_playwright,
+)
+from playwright_stealth import Stealth  # type: ignore[import-untyped]
+
+DEFAULT_LAUNCH_ARGS: Tuple[str, ...] = (
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-popup-blocking",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-translate",
+)
+
+# Files whose presence marks a Docker or Podman container.
+_CONTAINER_MARKERS = ("/.dockerenv", "/run/.containerenv")
+
+# Images, fonts and stylesheets are never needed to read a table.
+_BLOCKED_RESOURCES = "**/*.{png,jpg,jpeg,gif,svg,woff,woff2,ttf,css}"
+
+
+@dataclass(frozen=True)
+class BrowserContextProfile:
+    """Settings of a pooled browser context.
+
+    Pages requested with equal profiles share one context (and so its
+    cookies and cache), which is created on first use and kept until the
+    browser shuts down.
+
+    Attributes:
+        user_agent: User agent to send, or None for Chromium's own.
+        viewport_width: Viewport width in pixels.
+        viewport_height: Viewport height in pixels.
+        block_resources: Abort requests for images, fonts and stylesheets.
+        stealth: Patch the context against automation detection with
+            ``playwright_stealth`` (needed for Cloudflare challenges).
+    """
+
+    user_agent: str | None = None
+    viewport_width: int = 1280
+    viewport_height: int = 720
+    block_resources: bool = False
+    stealth: bool = False
+
+
+def default_launch_args() -> Tuple[str, ...]:
+    """Return the Chromium flags pools use unless given ``launch_args``.
+
+    Chromium refuses to start its sandbox as root, which is how containers
+    usually run, so ``--no-sandbox`` is added there and only there.
+    """
+    if _running_as_root_in_container():
+        return (*DEFAULT_LAUNCH_ARGS, "--no-sandbox")
+    return DEFAULT_LAUNCH_ARGS
+
+
+def _running_as_root_in_container() -> bool:
+    if not hasattr(os, "geteuid") or os.geteuid() != 0:
+        return False
+    return "container" in os.environ or any(
+        Path(marker).exists() for marker in _CONTAINER_MARKERS
+    )
+
+
+async def _launch_chromium(args: Sequence[str]) -> Tuple[Playwright, Browser]:
+    playwright = await async_playwright().start()
+    try:
+        browser = await playwright.chromium.launch(headless=True, args=list(args))
+    except BaseException:
+        await playwright.stop()
+        raise
+    return playwright, browser
+
+
+class BrowserPool:
+    """A lazily launched headless Chromium shared by every Playwright scrape.
+
+    The browser is launched by the first :meth:`page` call and reused by
+    later ones, with one context per :class:`BrowserContextProfile`. At most
+    ``max_pages`` pages are open at once; further callers wait for a page to
+    close. Once no page has been open for ``idle_timeout_seconds`` the
+    browser is shut down, to be launched again on the next call.
+
+    The pool is bound to the event loop it is used on; use
+    :func:`get_browser_pool` to get the shared pool of the running loop.
+
+    Args:
+        max_pages (int, optional): Pages open at once. Defaults to 4.
+        idle_timeout_seconds (float | None, optional): Seconds without an open
+            page before the browser shuts down; None keeps it running until
+            :meth:`close`. Defaults to 60.
+        launch_args (Sequence[str] | None, optional): Chromium command-line
+            flags. Defaults to :func:`default_launch_args`.
+        launch (Callable, optional): Coroutine function starting Playwright
+            and the browser from ``launch_args``.
+
+    Attributes:
+        launches: Number of times the browser has been launched.
+    """
+
+    def __init__(
+        self,
+        max_pages: int = 4,
+        idle_timeout_seconds: float | None = 60.0,
+        launch_args: Sequence[str] | None = None,
+        launch: Callable[
+            [Sequence[str]], Awaitable[Tuple[Playwright, Browser]]
+        ] = _launch_chromium,
+    ) -> None:
+        if max_pages < 1:
+            raise ValueError("max_pages must be at least 1")
+        self.max_pages = max_pages
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.launch_args = tuple(
+            launch_args if launch_args is not None else default_launch_args()
+        )
+        self._launch = launch
+        self._pages = asyncio.Semaphore(max_pages)
+        # Serializes launching and shutting down the browser.
+        self._lock = asyncio.Lock()
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._contexts: Dict[BrowserContextProfile, BrowserContext] = {}
+        # Callers holding or waiting for a page; the browser is only shut
+        # down for idleness while this is zero.
+        self._users = 0
+        self._idle_timer: asyncio.TimerHandle | None = None
+        self._idle_close: asyncio.Future[None] | None = None
+        self.launches = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the browser is currently launched."""
+        return self._browser is not None
+
+    async def _context(self, profile: BrowserContextProfile) -> BrowserContext:
+        async with self._lock:
+            if self._browser is not None and not self._browser.is_connected():
+                # The browser crashed or was closed under us: start over.
+                await self._shutdown()
+            if self._browser is None:
+                self._playwright, self._browser = await self._launch(self.launch_args)
+                self.launches += 1
+            context = self._contexts.get(profile)
+            if context is None:
+                context = await self._browser.new_context(
+                    user_agent=profile.user_agent,
+                    viewport={
+                        "width": profile.viewport_width,
+                        "height": profile.viewport_height,
+                    },
+                )
+                if profile.block_resources:
+                    await context.route(_BLOCKED_RESOURCES, lambda route: route.abort())
+                if profile.stealth:
+                    await Stealth().apply_stealth_async(context)
+                self._contexts[profile] = context
+            return context
+
+    @asynccontextmanager
+    async def page(
+        self, profile: BrowserContextProfile | None = None
+    ) -> AsyncIterator[Page]:
+        """Open a page in the pooled browser, closing it on exit.
+
+        Args:
+            profile (BrowserContextProfile | None, optional): Settings of the
+                context the page is opened in. Defaults to
+                ``BrowserContextProfile()``.
+
+        Yields:
+            Page: A fresh page. Waits while ``max_pages`` pages are open.
+        """
+        self._users += 1
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+        try:
+            async with self._pages:
+                context = await self._context(profile or BrowserContextProfile())
+                page = await context.new_page()
+                try:
+                    yield page
+                finally:
+                    with suppress(Exception):
+                        await page.close()
+        finally:
+            self._users -= 1
+            if self._users == 0 and self.idle_timeout_seconds is not None:
+                self._idle_timer = asyncio.get_running_loop().call_later(
+                    self.idle_timeout_seconds, self._on_idle_timeout
+                )
+
+    def _on_idle_timeout(self) -> None:
+        self._idle_timer = None
+        self._idle_close = asyncio.ensure_future(self._close_if_idle())
+
+    async def _close_if_idle(self) -> None:
+        async with self._lock:
+            if self._users == 0:
+                await self._shutdown()
+
+    async def _shutdown(self) -> None:
+        contexts = list(self._contexts.values())
+        browser, playwright = self._browser, self._playwright
+        self._contexts.clear()
+        self._browser = self._playwright = None
+        # A crashed browser fails to close its contexts; stop it anyway.
+        for context in contexts:
+            with suppress(Exception):
+                await context.close()
+        if browser is not None:
+            with suppress(Exception):
+                await browser.close()
+        if playwright is not None:
+            with suppress(Exception):
+                await playwright.stop()
+
+    async def close(self) -> None:
+        """Shut the browser down now; a later :meth:`page` relaunches it."""
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+        async with self._lock:
+            await self._shutdown()
+
+
+# Playwright objects are bound to the event loop that created them, so there
+# is one pool per loop, shut down when asyncio.run() closes the loop (see
+# ``client_session_utils._sessions``).
+_atexit_registered = False
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[BrowserPool, int, AsyncGenerator[None, None]]]" = weakref.WeakKeyDictionary()
+_pool_settings: Dict[str, Any] = {}
+_pool_settings_version = 0
+
+
+def configure_browser_pool(**settings: Any) -> Dict[str, Any]:
+    """Change the settings of the shared browser pools.
+
+    Accepts the ``max_pages``, ``idle_timeout_seconds`` and ``launch_args``
+    arguments of :class:`BrowserPool`, e.g. ``launch_args=(*DEFAULT_LAUNCH_ARGS,
+    "--no-sandbox")`` where Chromium's sandbox cannot start. Pools created
+    before the call are shut down and replaced the next time they are
+    requested.
+
+    Returns:
+        Dict[str, Any]: The settings now in effect.
+    """
+    global _pool_settings_version
+    unknown = set(settings) - {"max_pages", "idle_timeout_seconds", "launch_args"}
+    if unknown:
+        raise ValueError(f"Unknown browser pool settings: {sorted(unknown)}")
+    _pool_settings.update(settings)
+    _pool_settings_version += 1
+    return dict(_pool_settings)
+
+
+async def _close_on_loop_shutdown(pool: BrowserPool) -> AsyncGenerator[None, None]:
+    try:
+        yield
+    finally:
+        await pool.close()
+
+
+async def get_browser_pool() -> BrowserPool:
+    """Return the shared :class:`BrowserPool` of the running event loop.
+
+    Synchronous entry points reach it through ``run_sync``, so they share
+    one warm browser on the library's background loop.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _pools.get(loop)
+    if entry is not None:
+        pool, version, closer = entry
+        if version == _pool_settings_version:
+            return pool
+        await closer.aclose()
+
+    global _atexit_registered
+    if not _atexit_registered:
+        # Registered on first use rather than at import, so it runs before
+        # client_session_utils stops the background loop the pool lives on.
+        atexit.register(close_browser_pools)
+        _atexit_registered = True
+
+    pool = BrowserPool(**_pool_settings)
+    closer = _close_on_loop_shutdown(pool)
+    await closer.__anext__()
+    _pools[loop] = (pool, _pool_settings_version, closer)
+    return pool
+
+
+def close_browser_pools() -> None:
+    """Shut down every shared browser whose loop can still run code.
+
+    Registered with ``atexit`` once a pool is created, so Chromium does not
+    outlive the interpreter when the pool of the background event loop is
+    still warm.
+    """
+    for loop, (pool, _, _) in list(_pools.items()):
+        if loop.is_closed() or not pool.is_running:
+            continue
+        with suppress(Exception):
+            if loop.is_running():
+                future = asyncio.run_coroutine_threadsafe(pool.close(), loop)
+                future.result(timeout=10)
+            else:
+                loop.run_until_complete(pool.close())
@@ -0,0 +1,245 @@
+import asyncio
+import atexit
+import importlib.util
+import os
+import threading
+import weakref
+from dataclasses import dataclass, field, replace
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Coroutine,
+    Dict,
+    Iterator,
+    Tuple,
+    TypeVar,
+)
+
+import aiohttp
+
+T = TypeVar("T")
+
+DEFAULT_USER_AGENT = "pybaseballstats (https://github.com/nico671/pybaseballstats)"
+
+
+def _default_accept_encoding() -> str:
+    # aiohttp decodes brotli only when one of these packages is installed
+    # (e.g. via aiohttp[speedups]), so only advertise it then.
+    encodings = ["gzip", "deflate"]
+    if any(importlib.util.find_spec(m) for m in ("brotli", "brotlicffi")):
+        encodings.append("br")
+    return ", ".join(encodings)
+
+
+def _default_headers() -> Dict[str, str]:
+    return {
+        "User-Agent": DEFAULT_USER_AGENT,
+        "Accept-Encoding": _default_accept_encoding(),
+    }
+
+
+@dataclass(frozen=True)
+class ClientSessionConfig:
+    """Settings for the shared aiohttp sessions used for Baseball Savant.
+
+    Attributes:
+        limit: Total connections kept by the pool (0 for no limit).
+        limit_per_host: Connections per host (0 for no limit).
+        keepalive_timeout: Seconds an idle connection is kept open for reuse.
+        ttl_dns_cache: Seconds resolved addresses are cached.
+        connect_timeout: Seconds allowed to establish a connection.
+        read_timeout: Seconds allowed between reads of a response.
+        headers: Default headers sent with every request. Compressed
+            responses (gzip, and brotli when available) are requested by
+            default and decompressed as they stream in.
+    """
+
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 60.0
+    ttl_dns_cache: int = 300
+    connect_timeout: float = 15.0
+    read_timeout: float = 45.0
+    headers: Dict[str, str] = field(default_factory=_default_headers)
+
+    def create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=self.connect_timeout,
+            sock_read=self.read_timeout,
+        )
+        return aiohttp.ClientSession(
+            connector=connector, timeout=timeout, headers=dict(self.headers)
+        )
+
+
+_config = ClientSessionConfig()
+_config_version = 0
+
+# aiohttp sessions are bound to the event loop that created them, so the pool
+# keeps one session per loop. Each entry also holds the async generator that
+# closes the session when asyncio.run() shuts that loop down.
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[aiohttp.ClientSession, int, AsyncGenerator[None, None]]]" = weakref.WeakKeyDictionary()
+
+_loop_lock = threading.Lock()
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
+_loop_pid: int | None = None
+
+
+def configure_client_session(**settings: Any) -> ClientSessionConfig:
+    """Change the settings of the shared Savant client pool.
+
+    Accepts the fields of :class:`ClientSessionConfig` as keyword arguments.
+    Sessions created before the call are closed and replaced the next time
+    they are requested.
+
+    Returns:
+        ClientSessionConfig: The settings now in effect.
+    """
+    global _config, _config_version
+    _config = replace(_config, **settings)
+    _config_version += 1
+    return _config
+
+
+async def _close_on_loop_shutdown(
+    session: aiohttp.ClientSession,
+) -> AsyncGenerator[None, None]:
+    # Parked on its first yield; loop.shutdown_asyncgens() (called by
+    # asyncio.run before closing the loop) resumes it so the session is closed
+    # on its own loop.
+    try:
+        yield
+    finally:
+        await session.close()
+
+
+async def get_client_session() -> aiohttp.ClientSession:
+    """Return the shared keep-alive session for the running event loop.
+
+    The session is created on first use and reused by every later call on the
+    same loop, so connections (and their DNS/TLS setup) are reused across
+    requests and across calls.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _sessions.get(loop)
+    if entry is not None:
+        session, version, closer = entry
+        if not session.closed and version == _config_version:
+            return session
+        await closer.aclose()
+
+    session = _config.create_session()
+    closer = _close_on_loop_shutdown(session)
+    await closer.__anext__()
+    _sessions[loop] = (session, _config_version, closer)
+    return session
+
+
+async def close_client_session() -> None:
+    """Close the shared session of the running event loop, if any."""
+    entry = _sessions.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[2].aclose()
+
+
+def _background_loop() -> Tuple[asyncio.AbstractEventLoop, threading.Thread]:
+    global _loop, _loop_thread, _loop_pid
+    with _loop_lock:
+        # A forked child inherits the loop object but not its thread.
+        if _loop is None or _loop_thread is None or _loop_pid != os.getpid():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="pybaseballstats-io", daemon=True
+            )
+            thread.start()
+            _loop, _loop_thread, _loop_pid = loop, thread, os.getpid()
+        return _loop, _loop_thread
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` on the shared background event loop and wait for it.
+
+    Synchronous entry points use this instead of ``asyncio.run`` so they keep
+    reusing one loop, and therefore one connection pool, across calls. It works
+    the same whether or not the calling thread already runs an event loop
+    (e.g. in a notebook).
+    """
+    loop, thread = _background_loop()
+    if threading.current_thread() is thread:
+        coro.close()
+        raise RuntimeError(
+            "Synchronous pybaseballstats functions cannot be called from the "
+            "library's own event loop; await the *_async variant instead."
+        )
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result()
+    except BaseException:
+        # e.g. KeyboardInterrupt while waiting: stop the work in the background.
+        future.cancel()
+        raise
+
+
+def iterate_sync(iterator: AsyncIterator[T]) -> Iterator[T]:
+    """Iterate an async iterator from synchronous code.
+
+    Each item is awaited on the shared background event loop via
+    :func:`run_sync`, so work the iterator started (e.g. downloads still in
+    flight) keeps running between items. Closing the returned generator
+    early closes ``iterator`` on that loop too.
+    """
+
+    async def _next() -> T:
+        return await iterator.__anext__()
+
+    try:
+        while True:
+            try:
+                item = run_sync(_next())
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            run_sync(aclose())
+
+
+def close_client_sessions() -> None:
+    """Close the shared sessions and stop the background event loop.
+
+    Registered with ``atexit``; call it directly to release connections
+    earlier. The pool is recreated on the next request.
+    """
+    global _loop, _loop_thread, _loop_pid
+    with _loop_lock:
+        loop, thread = _loop, _loop_thread
+        _loop = _loop_thread = _loop_pid = None
+
+    for other_loop, (_, _, closer) in list(_sessions.items()):
+        if other_loop is loop or other_loop.is_closed() or other_loop.is_running():
+            continue
+        other_loop.run_until_complete(closer.aclose())
+
+    if loop is not None and thread is not None and thread.is_alive():
+        try:
+            asyncio.run_coroutine_threadsafe(close_client_session(), loop).result(
+                timeout=5
+            )
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.close()
+
+
+atexit.register(close_client_sessions)
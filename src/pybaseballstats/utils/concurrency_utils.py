@@ -0,0 +1,202 @@
+import asyncio
+import functools
+import math
+import time
+from collections import deque
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Tuple,
+    TypeVar,
+)
+
+R = TypeVar("R")
+K = TypeVar("K", bound=Hashable)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on the number of requests in flight.
+
+    Used as ``async with limiter as generation:`` around a single request.
+    The limit grows while responses stay healthy and is halved when the
+    server signals overload (HTTP 429, 5xx or a timeout):
+
+    * Until the first overload signal the limit grows by one per success,
+      which doubles it every round trip (slow start).
+    * After that it grows by one per ``limit`` successes, i.e. one per
+      round trip, and only while time to first byte stays within
+      ``latency_tolerance`` times the fastest response seen.
+    * An overload signal multiplies the limit by ``decrease_factor``. Only
+      requests admitted since the last decrease can trigger another one, so a
+      burst of failures from one overloaded window halves the limit once.
+      Increases do not start a new window, so failures of requests admitted
+      before a slow-start increase still count.
+
+    With ``fixed=True`` the limit never changes, which is how an explicit
+    concurrency from the caller is honored.
+
+    Every change is appended to :attr:`history` as ``(seconds since start,
+    limit)``.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        *,
+        min_limit: int = 1,
+        max_limit: int | None = None,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 3.0,
+        fixed: bool = False,
+    ) -> None:
+        if initial < 1:
+            raise ValueError("initial concurrency must be at least 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit if max_limit is not None else initial
+        self.limit = max(min_limit, min(initial, self.max_limit))
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.fixed = fixed
+
+        self.history: List[Tuple[float, int]] = [(0.0, self.limit)]
+        self.decreases = 0
+        self._started = time.monotonic()
+        self._in_flight = 0
+        self._generation = 0
+        self._successes = 0
+        self._slow_start = True
+        self._min_latency = math.inf
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    async def __aenter__(self) -> int:
+        while self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                raise
+        self._in_flight += 1
+        return self._generation
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def _set_limit(self, limit: int) -> None:
+        limit = max(self.min_limit, min(limit, self.max_limit))
+        if limit == self.limit:
+            return
+        self.limit = limit
+        self._successes = 0
+        self.history.append((round(time.monotonic() - self._started, 3), limit))
+        self._wake()
+
+    def record_success(self, latency_s: float) -> None:
+        """Record a healthy response whose headers arrived after ``latency_s``."""
+        if self.fixed:
+            return
+        self._min_latency = min(self._min_latency, latency_s)
+        if latency_s > self._min_latency * self.latency_tolerance:
+            return
+        self._successes += 1
+        if self._slow_start or self._successes >= self.limit:
+            self._set_limit(self.limit + 1)
+
+    def record_failure(self, generation: int) -> None:
+        """Record an overload signal for a request admitted under ``generation``."""
+        if self.fixed or generation != self._generation:
+            return
+        self._slow_start = False
+        self.decreases += 1
+        self._set_limit(math.floor(self.limit * self.decrease_factor))
+        # Start a new window even when the limit was already at its floor, so
+        # requests admitted before this signal cannot trigger another decrease.
+        self._generation += 1
+
+    def summary(self) -> str:
+        """Describe the limits used, e.g. ``4 -> 32 -> 16 (peak 32, 1 backoff)``."""
+        if self.fixed:
+            return f"fixed at {self.limit}"
+        limits = [limit for _, limit in self.history]
+        # Collapse runs of increases to show turning points only.
+        points = [limits[0]]
+        for prev, cur, nxt in zip(limits, limits[1:], limits[2:] + [None]):
+            if nxt is None or (cur > prev) != (nxt > cur):
+                points.append(cur)
+        backoffs = f"{self.decreases} backoff{'s' if self.decreases != 1 else ''}"
+        return (
+            " -> ".join(str(p) for p in points) + f" (peak {max(limits)}, {backoffs})"
+        )
+
+
+class SingleFlight(Generic[K, R]):
+    """Coalesces concurrent calls for the same key into one shared call.
+
+    ``await flight.run(key, factory)`` starts ``factory()`` as a task unless a
+    call for ``key`` is already in flight, in which case it waits for that
+    call instead, and every waiter receives the same result (or exception).
+    Finished calls are forgotten, so this deduplicates only overlapping work;
+    it is not a cache.
+
+    A waiter that is cancelled does not cancel the shared call while others
+    still wait for it; the call is cancelled once its last waiter is gone.
+    Tasks are bound to the event loop that created them, so use one instance
+    per loop.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[K, _Flight[R]] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def run(self, key: K, factory: Callable[[], Awaitable[R]]) -> R:
+        flight = self._calls.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(factory()))
+            self._calls[key] = flight
+            flight.task.add_done_callback(functools.partial(self._forget, key, flight))
+            self.started += 1
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+                # A later caller must start afresh, not join the cancelled call.
+                self._forget(key, flight)
+
+    def _forget(
+        self, key: K, flight: "_Flight[R]", _: "asyncio.Future[R] | None" = None
+    ) -> None:
+        if self._calls.get(key) is flight:
+            del self._calls[key]
+
+
+class _Flight(Generic[R]):
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[R]") -> None:
+        self.task = task
+        self.waiters = 0
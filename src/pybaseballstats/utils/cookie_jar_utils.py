@@ -0,0 +1,129 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Iterable, List, Tuple
+
+from playwright.async_api import Cookie
+
+from pybaseballstats.utils.statcast_cache_utils import default_cache_dir
+
+CLEARANCE_COOKIE_NAME = "cf_clearance"
+CLEARANCE_JAR_FORMAT_VERSION = 1
+
+# Cookies this close to expiring are treated as expired, so a request is not
+# sent with a clearance that lapses on its way to Cloudflare.
+CLEARANCE_EXPIRY_MARGIN_SECONDS = 60.0
+
+
+def default_clearance_jar_path() -> Path:
+    """Return where Cloudflare clearance cookies are persisted by default."""
+    return default_cache_dir() / "cloudflare" / "clearance.json"
+
+
+class ClearanceCookieJar:
+    """Cloudflare clearance cookies persisted across processes.
+
+    Cloudflare binds a ``cf_clearance`` cookie to the user agent that solved
+    the challenge, so the jar records that user agent next to the cookies and
+    only hands them back to a session using the same one. Cookies are kept
+    with their expiry; a jar whose ``cf_clearance`` has expired loads as
+    empty. The file holds credentials and is created readable by its owner
+    only.
+
+    Args:
+        path (str | os.PathLike | None, optional): JSON file backing the jar.
+            Defaults to :func:`default_clearance_jar_path`.
+        user_agent (str): User agent the cookies were (or will be) issued to.
+        clock (Callable[[], float], optional): Wall-clock time source, in
+            seconds since the epoch.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        user_agent: str,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path) if path is not None else default_clearance_jar_path()
+        self.user_agent = user_agent
+        self._clock = clock
+        # Cookies this jar last loaded or saved, to tell when another process
+        # has stored a newer clearance.
+        self._seen: Tuple[Tuple[str, str], ...] = ()
+
+    def load(self) -> List[Cookie]:
+        """Return the stored cookies, or ``[]`` if none are usable.
+
+        Cookies are unusable when the file is missing or unreadable, was
+        written for another user agent, or holds no live ``cf_clearance``.
+        Expired cookies are dropped.
+        """
+        try:
+            stored = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return []
+        if (
+            not isinstance(stored, dict)
+            or stored.get("version") != CLEARANCE_JAR_FORMAT_VERSION
+            or stored.get("user_agent") != self.user_agent
+        ):
+            return []
+
+        expire_before = self._clock() + CLEARANCE_EXPIRY_MARGIN_SECONDS
+        cookies: List[Cookie] = [
+            cookie
+            for cookie in stored.get("cookies", [])
+            # Playwright reports session cookies with ``expires == -1``.
+            if not 0 <= cookie.get("expires", -1) < expire_before
+        ]
+        if not any(cookie["name"] == CLEARANCE_COOKIE_NAME for cookie in cookies):
+            return []
+        self._seen = _identity(cookies)
+        return cookies
+
+    def load_if_changed(self) -> List[Cookie]:
+        """Like :meth:`load`, but ``[]`` unless the cookies differ from the
+        ones this jar last loaded or saved.
+
+        Lets a session that just hit a challenge adopt a clearance another
+        process stored in the meantime, without retrying its own stale one.
+        """
+        seen = self._seen
+        cookies = self.load()
+        return cookies if _identity(cookies) != seen else []
+
+    def save(self, cookies: Iterable[Cookie]) -> None:
+        """Persist ``cookies`` for :attr:`user_agent`, replacing the jar."""
+        cookies = list(cookies)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(
+                    {
+                        "version": CLEARANCE_JAR_FORMAT_VERSION,
+                        "user_agent": self.user_agent,
+                        "saved_at": self._clock(),
+                        "cookies": cookies,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, self.path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        self._seen = _identity(cookies)
+
+    def invalidate(self) -> None:
+        """Delete the stored cookies, e.g. after Cloudflare rejected them."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _identity(cookies: Iterable[Cookie]) -> Tuple[Tuple[str, str], ...]:
+    return tuple(sorted((cookie["name"], cookie["value"]) for cookie in cookies))
@@ -0,0 +1,267 @@
+import json
+import os
+import re
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Sequence
+
+from curl_cffi import requests
+from curl_cffi.requests.headers import Headers
+
+from pybaseballstats.consts.bref_consts import BREF_CURRENT_SEASON_CACHE_TTL_SECONDS
+from pybaseballstats.consts.fangraphs_consts import (
+    FANGRAPHS_CURRENT_SEASON_CACHE_TTL_SECONDS,
+)
+from pybaseballstats.utils.statcast_cache_utils import default_cache_dir
+
+# Bumped when the table layout changes; older tables are left unused.
+HTTP_CACHE_TABLE = "responses_v1"
+
+
+def _season_at(timestamp: float) -> int:
+    """Return the MLB season in progress (or last played) at ``timestamp``."""
+    moment = datetime.fromtimestamp(timestamp)
+    return moment.year if moment.month >= 3 else moment.year - 1
+
+
+@dataclass(frozen=True)
+class HttpCacheRule:
+    """How long responses for matching URLs are served without a request.
+
+    Attributes:
+        pattern: Regular expression searched for in the URL.
+        ttl_seconds: Seconds a stored response stays fresh; None never
+            expires.
+        past_seasons_only: Only match when the pattern's ``season`` group
+            names a season that had ended when the response was stored, so a
+            page fetched mid-season is not kept forever.
+    """
+
+    pattern: str
+    ttl_seconds: float | None
+    past_seasons_only: bool = False
+
+    def __post_init__(self) -> None:
+        if (
+            self.past_seasons_only
+            and "season" not in re.compile(self.pattern).groupindex
+        ):
+            raise ValueError("past_seasons_only rules need a 'season' group")
+
+    def matches(self, url: str, stored_at: float) -> bool:
+        """Whether the rule applies to ``url`` as stored at ``stored_at``."""
+        match = re.search(self.pattern, url)
+        if match is None:
+            return False
+        if self.past_seasons_only:
+            return int(match.group("season")) < _season_at(stored_at)
+        return True
+
+
+_SEASON = r"(?<!\d)(?P<season>(?:18|19|20)\d{2})(?!\d)"
+
+DEFAULT_HTTP_CACHE_RULES: tuple[HttpCacheRule, ...] = (
+    # Team, league and draft pages carry their season in the URL.
+    HttpCacheRule(rf"baseball-reference\.com/.*?{_SEASON}", None, True),
+    HttpCacheRule(r"baseball-reference\.com/", BREF_CURRENT_SEASON_CACHE_TTL_SECONDS),
+    HttpCacheRule(rf"fangraphs\.com/boxscore\.aspx\?date={_SEASON}-", None, True),
+    HttpCacheRule(
+        r"fangraphs\.com/boxscore\.aspx", FANGRAPHS_CURRENT_SEASON_CACHE_TTL_SECONDS
+    ),
+)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A response stored by :class:`HttpResponseCache`.
+
+    Attributes:
+        url: Requested URL.
+        status_code: HTTP status of the stored response.
+        headers: Response headers.
+        content: Response body.
+        stored_at: When the response was fetched or last revalidated.
+        fresh: Whether it may be served without asking the server.
+    """
+
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    stored_at: float
+    fresh: bool
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers asking the server to answer 304 if the body is unchanged."""
+        headers = {}
+        etag = self.headers.get("etag")
+        if etag:
+            headers["If-None-Match"] = etag
+        last_modified = self.headers.get("last-modified")
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def to_response(self) -> requests.Response:
+        """Rebuild a curl_cffi ``Response`` that callers can use as usual."""
+        response = requests.Response()
+        response.url = self.url
+        response.status_code = self.status_code
+        response.headers = Headers(self.headers)
+        response.content = self.content
+        response.encoding = response.charset_encoding or "utf-8"
+        return response
+
+
+class HttpResponseCache:
+    """SQLite-backed cache of scraped pages with conditional revalidation.
+
+    Only URLs matched by a rule are cached; the first matching rule decides
+    how long a stored response stays fresh. Stale responses that came with an
+    ``ETag`` or ``Last-Modified`` header are revalidated with a conditional
+    request, so an unchanged page costs a bodyless 304 instead of a full
+    download. The database may be shared by several processes.
+
+    Args:
+        path (str | os.PathLike | None, optional): SQLite database file.
+            Defaults to ``~/.cache/pybaseballstats/http/responses.sqlite``.
+        rules (Sequence[HttpCacheRule], optional): TTL policies, tried in
+            order. Defaults to :data:`DEFAULT_HTTP_CACHE_RULES`.
+        clock (Callable[[], float], optional): Wall-clock time source, in
+            seconds since the epoch.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        rules: Sequence[HttpCacheRule] = DEFAULT_HTTP_CACHE_RULES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = (
+            Path(path)
+            if path is not None
+            else default_cache_dir() / "http" / "responses.sqlite"
+        )
+        self.rules = tuple(rules)
+        self._clock = clock
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as db, db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                f"CREATE TABLE IF NOT EXISTS {HTTP_CACHE_TABLE} ("
+                "url TEXT PRIMARY KEY, status INTEGER NOT NULL, "
+                "headers TEXT NOT NULL, body BLOB NOT NULL, stored_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def rule_for(
+        self, url: str, stored_at: float | None = None
+    ) -> HttpCacheRule | None:
+        """Return the rule governing ``url`` (as stored at ``stored_at``)."""
+        stored_at = self._clock() if stored_at is None else stored_at
+        for rule in self.rules:
+            if rule.matches(url, stored_at):
+                return rule
+        return None
+
+    def lookup(self, url: str) -> CachedResponse | None:
+        """Return the stored response for ``url``, fresh or not, if any."""
+        with closing(self._connect()) as db:
+            row = db.execute(
+                f"SELECT status, headers, body, stored_at FROM {HTTP_CACHE_TABLE} "
+                "WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        status, headers, body, stored_at = row
+        rule = self.rule_for(url, stored_at)
+        if rule is None:
+            return None
+        return CachedResponse(
+            url=url,
+            status_code=status,
+            headers=json.loads(headers),
+            content=body,
+            stored_at=stored_at,
+            fresh=rule.ttl_seconds is None
+            or self._clock() - stored_at < rule.ttl_seconds,
+        )
+
+    def store(self, url: str, response: requests.Response) -> None:
+        """Store a successful response if a rule covers ``url``."""
+        if response.status_code != 200 or self.rule_for(url) is None:
+            return
+        if "no-store" in response.headers.get("cache-control", "").lower():
+            return
+        headers = {
+            name.lower(): value
+            for name, value in response.headers.items()
+            if value is not None
+            and name.lower() in ("content-type", "etag", "last-modified")
+        }
+        self._put(url, response.status_code, headers, response.content)
+
+    def revalidated(
+        self, cached: CachedResponse, response: requests.Response
+    ) -> requests.Response:
+        """Record that the server confirmed ``cached`` (HTTP 304) and return it."""
+        headers = dict(cached.headers)
+        for name in ("etag", "last-modified"):
+            value = response.headers.get(name)
+            if value:
+                headers[name] = value
+        self._put(cached.url, cached.status_code, headers, cached.content)
+        return cached.to_response()
+
+    def _put(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> None:
+        with closing(self._connect()) as db, db:
+            db.execute(
+                f"INSERT OR REPLACE INTO {HTTP_CACHE_TABLE} "
+                "(url, status, headers, body, stored_at) VALUES (?, ?, ?, ?, ?)",
+                (url, status, json.dumps(headers), body, self._clock()),
+            )
+
+    def clear(self) -> None:
+        """Delete every stored response."""
+        with closing(self._connect()) as db, db:
+            db.execute(f"DELETE FROM {HTTP_CACHE_TABLE}")
+
+
+_http_cache: HttpResponseCache | None = None
+
+
+def configure_http_cache(
+    enabled: bool = True,
+    *,
+    path: str | os.PathLike[str] | None = None,
+    rules: Sequence[HttpCacheRule] = DEFAULT_HTTP_CACHE_RULES,
+) -> HttpResponseCache | None:
+    """Turn the response cache of the BREF and FanGraphs scrapers on or off.
+
+    The cache is off by default. Once enabled, ``PBSSessionManager`` and
+    ``AsyncPBSSessionManager`` serve covered pages from it and store the
+    pages they download.
+
+    Args:
+        enabled (bool, optional): Enable (True) or disable (False) the cache.
+        path (str | os.PathLike | None, optional): SQLite database file.
+        rules (Sequence[HttpCacheRule], optional): TTL policies.
+
+    Returns:
+        HttpResponseCache | None: The cache now in effect.
+    """
+    global _http_cache
+    _http_cache = HttpResponseCache(path, rules) if enabled else None
+    return _http_cache
+
+
+def get_http_cache() -> HttpResponseCache | None:
+    """Return the cache configured with :func:`configure_http_cache`, if any."""
+    return _http_cache
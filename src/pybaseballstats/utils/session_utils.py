@@ -1,18 +1,437 @@
+import asyncio
 import random
 import time
-from collections import deque
-from datetime import datetime, timedelta
+import warnings
+import weakref
+from dataclasses import dataclass
 from threading import Lock
-from typing import Any, Generic, TypeVar
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Tuple,
+    TypeVar,
+)
+from urllib.parse import urlsplit
 
 from curl_cffi import requests
-from playwright.sync_api import (
+from playwright.async_api import (
+    Cookie,
+)
+from playwright.async_api import (
     TimeoutError as PlaywrightTimeoutError,
 )
-from playwright.sync_api import (
-    sync_playwright,
+
+from pybaseballstats.consts.bref_consts import (
+    BREF_HOST,
+    BREF_MAX_REQUESTS_PER_MINUTE,
+    BREF_MIN_REQUEST_INTERVAL_SECONDS,
+)
+from pybaseballstats.consts.fangraphs_consts import (
+    FANGRAPHS_HOST,
+    FANGRAPHS_MAX_REQUESTS_PER_MINUTE,
+    FANGRAPHS_REQUEST_BURST,
+)
+from pybaseballstats.consts.statcast_consts import (
+    SAVANT_HOST,
+    SAVANT_MAX_REQUESTS_PER_MINUTE,
+    SAVANT_REQUEST_BURST,
+)
+from pybaseballstats.utils.browser_pool_utils import (
+    BrowserContextProfile,
+    get_browser_pool,
 )
-from playwright_stealth import Stealth  # type: ignore[import-untyped]
+from pybaseballstats.utils.client_session_utils import run_sync
+from pybaseballstats.utils.cookie_jar_utils import ClearanceCookieJar
+from pybaseballstats.utils.http_cache_utils import (
+    CachedResponse,
+    HttpResponseCache,
+    get_http_cache,
+)
+
+
+@dataclass(frozen=True)
+class HostRateLimit:
+    """How often requests to one host may be made.
+
+    Args:
+        requests_per_minute (float): Sustained request rate.
+        burst (int, optional): Requests that may be made back to back after
+            an idle period. Defaults to 1.
+        min_interval_seconds (float, optional): Minimum gap between two
+            consecutive requests, whatever the burst. Defaults to 0.
+        jitter_seconds (float, optional): Random extra gap, drawn uniformly
+            from ``[0, jitter_seconds]``, added after every request so that
+            traffic does not look machine-timed. Defaults to 0.
+    """
+
+    requests_per_minute: float
+    burst: int = 1
+    min_interval_seconds: float = 0.0
+    jitter_seconds: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1")
+
+
+DEFAULT_HOST_RATE_LIMITS: Dict[str, HostRateLimit] = {
+    BREF_HOST: HostRateLimit(
+        BREF_MAX_REQUESTS_PER_MINUTE,
+        min_interval_seconds=BREF_MIN_REQUEST_INTERVAL_SECONDS,
+        jitter_seconds=1.0,
+    ),
+    FANGRAPHS_HOST: HostRateLimit(
+        FANGRAPHS_MAX_REQUESTS_PER_MINUTE, burst=FANGRAPHS_REQUEST_BURST
+    ),
+    SAVANT_HOST: HostRateLimit(
+        SAVANT_MAX_REQUESTS_PER_MINUTE, burst=SAVANT_REQUEST_BURST
+    ),
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket that hands out send times instead of sleeping.
+
+    :meth:`reserve` books the earliest slot that respects the rate, burst
+    and minimum interval, and returns how long the caller must wait for it.
+    The lock only guards that arithmetic; callers sleep after releasing it,
+    so concurrent callers queue up in order without blocking each other
+    while they wait.
+    """
+
+    def __init__(
+        self, limit: HostRateLimit, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.limit = limit
+        self._clock = clock
+        self._interval = 60.0 / limit.requests_per_minute
+        # Time at which the bucket is full again (GCRA's theoretical arrival
+        # time) and the earliest time the next request may be sent.
+        self._full_at = clock()
+        self._next_allowed = self._full_at
+        self._lock = Lock()
+
+    def reserve(self) -> float:
+        """Book the next send slot and return the seconds to wait for it."""
+        with self._lock:
+            now = self._clock()
+            slot = max(
+                now,
+                self._full_at - (self.limit.burst - 1) * self._interval,
+                self._next_allowed,
+            )
+            self._full_at = max(self._full_at, slot) + self._interval
+            self._next_allowed = (
+                slot
+                + self.limit.min_interval_seconds
+                + random.uniform(0, self.limit.jitter_seconds)
+            )
+            return slot - now
+
+    def penalize(self, seconds: float) -> None:
+        """Send nothing for ``seconds``, e.g. after an HTTP 429."""
+        with self._lock:
+            resume_at = self._clock() + seconds
+            self._next_allowed = max(self._next_allowed, resume_at)
+            self._full_at = max(
+                self._full_at, resume_at + (self.limit.burst - 1) * self._interval
+            )
+
+
+class RateLimiterRegistry:
+    """Per-host token buckets shared by every request made through a session.
+
+    A URL is matched to the bucket of its host or of the closest parent
+    domain with a limit (``www.baseball-reference.com`` uses the
+    ``baseball-reference.com`` bucket). Hosts without a limit are never
+    delayed, so they do not queue behind slower hosts.
+    """
+
+    def __init__(self, limits: Mapping[str, HostRateLimit] | None = None) -> None:
+        self._limits: Dict[str, HostRateLimit] = dict(
+            DEFAULT_HOST_RATE_LIMITS if limits is None else limits
+        )
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = Lock()
+
+    def set_limit(self, host: str, limit: HostRateLimit | None) -> None:
+        """Set (or with ``None`` remove) the rate limit of ``host``."""
+        with self._lock:
+            self._buckets.pop(host, None)
+            if limit is None:
+                self._limits.pop(host, None)
+            else:
+                self._limits[host] = limit
+
+    def bucket_for(self, url: str) -> TokenBucket | None:
+        """Return the bucket that paces requests to ``url``, if any."""
+        host = (urlsplit(url).hostname or url).lower()
+        labels = host.split(".")
+        with self._lock:
+            for i in range(len(labels) - 1):
+                domain = ".".join(labels[i:])
+                limit = self._limits.get(domain)
+                if limit is not None:
+                    bucket = self._buckets.get(domain)
+                    if bucket is None:
+                        bucket = self._buckets[domain] = TokenBucket(limit)
+                    return bucket
+        return None
+
+    def reserve(self, url: str) -> float:
+        """Book a send slot for ``url`` and return the seconds to wait for it."""
+        bucket = self.bucket_for(url)
+        return 0.0 if bucket is None else bucket.reserve()
+
+    def wait(self, url: str) -> float:
+        """Block until a request to ``url`` may be sent; return seconds slept."""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def wait_async(self, url: str) -> float:
+        """Await until a request to ``url`` may be sent; return seconds waited.
+
+        Only the awaiting task is suspended, so the event loop keeps serving
+        requests to other hosts (e.g. Statcast downloads) in the meantime.
+        """
+        delay = self.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def penalize(self, url: str, seconds: float) -> None:
+        """Pause requests to the host of ``url`` for ``seconds``."""
+        bucket = self.bucket_for(url)
+        if bucket is not None:
+            bucket.penalize(seconds)
+
+
+# Shared by the synchronous and asynchronous session managers, so requests
+# made through either count against the same per-host limits.
+shared_rate_limits = RateLimiterRegistry()
+
+
+# curl_cffi impersonates the same browser that clears challenges, so the
+# clearance cookies it receives match the user agent of the requests.
+_IMPERSONATE = "chrome120"
+_CHALLENGE_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+
+def _set_cookies(jar: requests.Cookies, cookies: List[Cookie]) -> None:
+    for cookie in cookies:
+        jar.set(cookie["name"], cookie["value"], domain=cookie["domain"])
+
+
+def _is_cloudflare_challenge(response: requests.Response) -> bool:
+    """Check if the response is a Cloudflare block/challenge."""
+    if response.status_code in (403, 503):
+        return True
+    # Cloudflare challenges often return 200 but contain specific text
+    text = response.text.lower()
+    if "just a moment" in text or "attention required" in text or "cloudflare" in text:
+        return True
+    return False
+
+
+async def _clear_cloudflare_challenge(url: str, verbose: bool = False) -> List[Cookie]:
+    """Clear a Cloudflare challenge in a stealthed page of the browser pool.
+
+    Runs on the async Playwright API, so waiting for the challenge only
+    suspends the calling task, and reuses the pool's warm browser instead of
+    launching one per challenge.
+
+    Returns:
+        List[Cookie]: The browser's cookies once the target page loaded, or an
+            empty list if the challenge could not be cleared.
+    """
+    if verbose:
+        print(f"\n[DEBUG] === Initiating Cloudflare Bypass for {url} ===")
+
+    profile = BrowserContextProfile(
+        user_agent=_CHALLENGE_USER_AGENT,
+        viewport_width=1280,
+        viewport_height=720,
+        stealth=True,
+    )
+    try:
+        pool = await get_browser_pool()
+        async with pool.page(profile) as page:
+            if verbose:
+                print("[DEBUG] Navigating to target URL...")
+            await page.goto(url, wait_until="domcontentloaded")
+
+            max_clicks = 5
+            num_clicks = 0
+
+            while num_clicks < max_clicks:
+                # 1. Victory Check
+                if await page.locator("table, #footer").count() > 0:
+                    if verbose:
+                        print("\n[SUCCESS] Clearance achieved! Target page loaded.")
+                    break
+
+                # 2. Element Scans
+                cf_iframes = page.frame_locator(
+                    "iframe[src*='challenges'], iframe[src*='turnstile']"
+                )
+                shadow_turnstile = page.locator("input[name='cf-turnstile-response']")
+
+                iframe_count = await page.locator(
+                    "iframe[src*='challenges'], iframe[src*='turnstile']"
+                ).count()
+                shadow_count = await shadow_turnstile.count()
+
+                if verbose:
+                    print(
+                        f"[DEBUG] Scan -> Iframes found: {iframe_count} | Hidden Shadow inputs found: {shadow_count}"
+                    )
+
+                try:
+                    target_x, target_y = None, None
+
+                    # Scenario A: Closed Shadow DOM
+                    if shadow_count > 0:
+                        parent_div = shadow_turnstile.first.locator("..")
+                        box = await parent_div.bounding_box()
+                        if verbose:
+                            print(f"[DEBUG] Shadow DOM parent bounding box: {box}")
+
+                        if box and box["width"] > 0:
+                            target_x = box["x"] + 30 + random.uniform(-5, 5)
+                            target_y = (
+                                box["y"] + (box["height"] / 2) + random.uniform(-5, 5)
+                            )
+                            if verbose:
+                                print(
+                                    f"[DEBUG] Calculated Shadow Target: X={target_x:.1f}, Y={target_y:.1f}"
+                                )
+
+                    # Scenario B: Standard iframe
+                    elif iframe_count > 0:
+                        checkbox = cf_iframes.locator(
+                            ".cb-c, input[type='checkbox']"
+                        ).first
+                        if await checkbox.is_visible(timeout=2000):
+                            box = await checkbox.bounding_box()
+                            if verbose:
+                                print(
+                                    f"[DEBUG] Standard Iframe checkbox bounding box: {box}"
+                                )
+                            if box:
+                                target_x = (
+                                    box["x"]
+                                    + (box["width"] / 2)
+                                    + random.uniform(-5, 5)
+                                )
+                                target_y = (
+                                    box["y"]
+                                    + (box["height"] / 2)
+                                    + random.uniform(-5, 5)
+                                )
+                                if verbose:
+                                    print(
+                                        f"[DEBUG] Calculated Iframe Target: X={target_x:.1f}, Y={target_y:.1f}"
+                                    )
+
+                    # 3. Execution
+                    if target_x is not None and target_y is not None:
+                        if verbose:
+                            print(
+                                "\n[ACTION] Target locked. Simulating human-like mouse movement and click..."
+                            )
+                        await page.wait_for_timeout(random.randint(1000, 2000))
+
+                        if verbose:
+                            print("[ACTION] Moving mouse...")
+                        await page.mouse.move(
+                            target_x, target_y, steps=random.randint(15, 30)
+                        )
+                        await page.wait_for_timeout(random.randint(200, 500))
+
+                        if verbose:
+                            print("[ACTION] Clicking...")
+                        await page.mouse.down()
+                        await page.wait_for_timeout(random.randint(40, 120))
+                        await page.mouse.up()
+                        num_clicks += 1
+                        await page.mouse.move(
+                            target_x + random.randint(100, 300),
+                            target_y + random.randint(100, 300),
+                            steps=random.randint(10, 20),
+                        )
+
+                        if verbose:
+                            print(
+                                "[ACTION] Click complete. Waiting ~5 seconds for Cloudflare response...\n"
+                            )
+                        await page.wait_for_timeout(5000 + random.randint(500, 1500))
+                        continue
+
+                except Exception as e:
+                    if verbose:
+                        print(f"[DEBUG] Exception during targeting/clicking: {e}")
+
+                await page.wait_for_timeout(1500)
+
+            if await page.locator("table, #footer").count() == 0:
+                if verbose:
+                    if num_clicks >= max_clicks:
+                        print(
+                            f"\n[WARNING] Maximum click attempts ({max_clicks}) reached without success."
+                        )
+                    else:
+                        print(
+                            "\n[WARNING] Bypass attempts exhausted without detecting success. Proceeding to extract cookies anyway."
+                        )
+                return []
+            if verbose:
+                print("[DEBUG] Extracting cookies...")
+            cookies = await page.context.cookies()
+            if verbose:
+                print("[DEBUG] === Bypass Process Complete ===\n")
+            return cookies
+
+    except PlaywrightTimeoutError:
+        print("\n[ERROR] Playwright timed out completely.")
+    except Exception as e:
+        print(f"\n[ERROR] Critical failure: {e}")
+    return []
+
+
+def _cache_lookup(
+    url: str, kwargs: Dict[str, Any]
+) -> Tuple[HttpResponseCache | None, CachedResponse | None]:
+    """Return the configured response cache and its entry for ``url``.
+
+    Requests with extra arguments (params, headers, ...) bypass the cache,
+    since the URL alone does not identify their response.
+    """
+    cache = get_http_cache()
+    if cache is None or kwargs:
+        return None, None
+    return cache, cache.lookup(url)
+
+
+def _report_http_error(
+    rate_limits: RateLimiterRegistry, url: str, error: requests.exceptions.HTTPError
+) -> None:
+    """Print a failed request and back off from its host after an HTTP 429."""
+    if error.response.status_code == 429:
+        print(f"Received 429 Too Many Requests for {url}. Backing off.")
+        retry_after = error.response.headers.get("Retry-After", "")
+        rate_limits.penalize(url, float(retry_after) if retry_after.isdigit() else 60.0)
+    else:
+        print(f"HTTP Error fetching {url}: {error}")
+
 
 # https://stackoverflow.com/questions/31875/is-there-a-simple-elegant-way-to-define-singletons
 T = TypeVar("T")
@@ -38,15 +457,29 @@ class Singleton(Generic[T]):
         self._decorated = decorated
         self._instance: T | None = None
 
-    def instance(self, max_req_per_minute: int | None = 5) -> T:
+    def instance(self, max_req_per_minute: int | None = None) -> T:
         """
         Returns the singleton instance. Upon its first call, it creates a
         new instance of the decorated class and calls its `__init__` method.
         On all subsequent calls, the already created instance is returned.
 
+        Args:
+            max_req_per_minute (int | None, optional): Deprecated. Requests
+                are paced per host by ``shared_rate_limits`` now; a value
+                given here becomes Baseball Reference's limit. Use
+                ``shared_rate_limits.set_limit`` instead.
+
         """
+        if max_req_per_minute is not None:
+            warnings.warn(
+                "max_req_per_minute is deprecated; use "
+                "shared_rate_limits.set_limit(BREF_HOST, HostRateLimit(...)) instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            shared_rate_limits.set_limit(BREF_HOST, HostRateLimit(max_req_per_minute))
         if self._instance is None:
-            self._instance = self._decorated(max_req_per_minute=max_req_per_minute)  # type: ignore
+            self._instance = self._decorated()
         return self._instance
 
     def __call__(self) -> None:
@@ -62,20 +495,31 @@ class PBSSessionManager:
     A singleton class to manage requests, rate limiting, and automated
     Cloudflare bypassing via Playwright.
     Used in both Baseball Reference and FanGraphs scrapers to ensure all requests go through a single, well-managed session with built-in protections against blocks and rate limits.
+
+    Requests are paced per host by ``rate_limits`` (see
+    :class:`RateLimiterRegistry`), so Baseball Reference's limit never slows
+    down requests to other sites. Use ``rate_limits.set_limit`` to change the
+    limit of a host. The registry is shared with
+    :class:`AsyncPBSSessionManager`, so both count against the same limits.
+
+    Cloudflare clearance cookies are persisted in ``cookie_jar`` (see
+    :class:`ClearanceCookieJar`) and loaded when the session is created, so
+    later processes skip the browser until the clearance expires or is
+    rejected. Set ``cookie_jar`` to None to keep them in memory only.
     """
 
-    def __init__(
-        self,
-        max_req_per_minute: int | None = 5,
-    ) -> None:
-        self.max_req_per_minute: int = (
-            max_req_per_minute if max_req_per_minute is not None else 5
-        )
-        self.request_timestamps: deque[datetime] = deque(maxlen=5)
+    def __init__(self) -> None:
+        self.rate_limits = shared_rate_limits
 
         # Initialize pure curl_cffi session with no manual headers
         self.session: requests.Session = requests.Session()
 
+        # Clearance from an earlier process spares this one the browser.
+        self.cookie_jar: ClearanceCookieJar | None = ClearanceCookieJar(
+            user_agent=_CHALLENGE_USER_AGENT
+        )
+        _set_cookies(self.session.cookies, self.cookie_jar.load())
+
         self._lock = Lock()
         self.verbose = False
 
@@ -83,264 +527,224 @@ class PBSSessionManager:
         """Enable or disable verbose logging for debugging."""
         self.verbose = verbose
 
-    def _rate_limit(self) -> None:
-        """Block until it's safe to make another request."""
-        if self.max_req_per_minute is None:
-            return  # No rate limiting if max_req_per_minute is None
-        with self._lock:
-            current_time = datetime.now()
-            window_start = current_time - timedelta(minutes=1)
-
-            # loop to remove timestamps older than 1 minute
-            while self.request_timestamps and self.request_timestamps[0] < window_start:
-                self.request_timestamps.popleft()
-            # ensures no more than max_req_per_minute requests are made in any rolling 1-minute window
-            if len(self.request_timestamps) >= self.max_req_per_minute:
-                oldest_request_time = self.request_timestamps[0]
-                wait_time = 60 - (current_time - oldest_request_time).total_seconds()
-                wait_time = max(wait_time, 0)
-                if wait_time > 0:
-                    if self.verbose:
-                        print(f"Rate limit reached, sleeping {wait_time:.2f}s")
-                    time.sleep(
-                        wait_time + random.uniform(0.5, 1.5)
-                    )  # add a bit of jitter
-                # After sleeping, update current_time and clean up old timestamps again
-
-                current_time = datetime.now()
-                window_start = current_time - timedelta(minutes=1)
-                while (
-                    self.request_timestamps
-                    and self.request_timestamps[0] < window_start
-                ):
-                    self.request_timestamps.popleft()
-            # ensure it has been at least 3 seconds since the last request to avoid hitting Baseball References's rate limits
-            if (
-                self.request_timestamps
-                and (current_time - self.request_timestamps[-1]).total_seconds() < 3
-            ):
-                wait_time = (
-                    3 - (current_time - self.request_timestamps[-1]).total_seconds()
-                )
-                if self.verbose:
-                    print(
-                        f"Enforcing 3-second gap between requests, sleeping ~{wait_time:.2f}s"
-                    )
-                time.sleep(wait_time + random.uniform(0.5, 1.5))  # add a bit of jitter
-            self.request_timestamps.append(current_time)
-
-    def _is_cloudflare_challenge(self, response: requests.Response) -> bool:
-        """Check if the response is a Cloudflare block/challenge."""
-        if response.status_code in (403, 503):
-            return True
-        # Cloudflare challenges often return 200 but contain specific text
-        text = response.text.lower()
-        if (
-            "just a moment" in text
-            or "attention required" in text
-            or "cloudflare" in text
-        ):
-            return True
-        return False
+    def _rate_limit(self, url: str) -> None:
+        """Block until it's safe to make another request to ``url``'s host."""
+        waited = self.rate_limits.wait(url)
+        if self.verbose and waited > 0:
+            print(f"Rate limit for {urlsplit(url).hostname}, slept {waited:.2f}s")
 
     def _solve_cloudflare_challenge(self, url: str) -> None:
-        """Spin up an ephemeral, stealthed Playwright instance to bypass Cloudflare."""
-        if self.verbose:
-            print(f"\n[DEBUG] === Initiating Cloudflare Bypass for {url} ===")
+        """Clear a Cloudflare challenge and adopt its cookies.
 
-        try:
-            with Stealth().use_sync(sync_playwright()) as p:
-                if self.verbose:
-                    print(
-                        "[DEBUG] Launching visible browser with automation flags disabled..."
-                    )
-                browser = p.chromium.launch(
-                    headless=True,
-                    args=[
-                        "--disable-blink-features=AutomationControlled",
-                        "--disable-popup-blocking",
-                    ],
-                )
+        A clearance another process stored since this session loaded the
+        jar is used as is; otherwise the stored cookies are stale, so they
+        are dropped and a browser clears the challenge.
+        """
+        jar = self.cookie_jar
+        if jar is not None:
+            stored = jar.load_if_changed()
+            if stored:
+                _set_cookies(self.session.cookies, stored)
+                return
+            jar.invalidate()
+        cookies = run_sync(_clear_cloudflare_challenge(url, self.verbose))
+        _set_cookies(self.session.cookies, cookies)
+        if jar is not None and cookies:
+            jar.save(cookies)
 
-                context = browser.new_context(
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    viewport={"width": 1280, "height": 720},
-                )
-                page = context.new_page()
+    def get(self, url: str, **kwargs: Any) -> requests.Response | None:
+        """Make an HTTP request with automatic Waterfall escalation.
 
-                if self.verbose:
-                    print("[DEBUG] Navigating to target URL...")
-                page.goto(url, wait_until="domcontentloaded")
+        When the response cache is enabled (see
+        :func:`~pybaseballstats.utils.http_cache_utils.configure_http_cache`),
+        fresh cached pages are returned without a request, and stale ones
+        are revalidated with a conditional request.
+        """
+        cache, cached = _cache_lookup(url, kwargs)
+        if cached is not None and cached.fresh:
+            if self.verbose:
+                print(f"HTTP cache hit for {url}")
+            return cached.to_response()
+        if cached is not None:
+            kwargs["headers"] = cached.conditional_headers()
 
-                max_clicks = 5
-                num_clicks = 0
+        self._rate_limit(url)
 
-                while num_clicks < max_clicks:
-                    # 1. Victory Check
-                    if page.locator("table, #footer").count() > 0:
-                        if self.verbose:
-                            print("\n[SUCCESS] Clearance achieved! Target page loaded.")
-                        break
+        try:
+            # ATTEMPT 1: Fast curl_cffi
+            resp = self.session.get(url, impersonate=_IMPERSONATE, **kwargs)
 
-                    # 2. Element Scans
-                    cf_iframes = page.frame_locator(
-                        "iframe[src*='challenges'], iframe[src*='turnstile']"
-                    )
-                    shadow_turnstile = page.locator(
-                        "input[name='cf-turnstile-response']"
-                    )
+            # Check for block
+            if _is_cloudflare_challenge(resp):
+                # ATTEMPT 2: The Waterfall Escalation
+                with self._lock:
+                    self._solve_cloudflare_challenge(url)
 
-                    iframe_count = page.locator(
-                        "iframe[src*='challenges'], iframe[src*='turnstile']"
-                    ).count()
-                    shadow_count = shadow_turnstile.count()
+                # Retry the fast request now that our session has the cf_clearance cookie
+                self._rate_limit(url)
+                resp = self.session.get(url, impersonate=_IMPERSONATE, **kwargs)
 
-                    if self.verbose:
-                        print(
-                            f"[DEBUG] Scan -> Iframes found: {iframe_count} | Hidden Shadow inputs found: {shadow_count}"
-                        )
+            if cache is not None and cached is not None and resp.status_code == 304:
+                return cache.revalidated(cached, resp)
+            resp.raise_for_status()
+            if cache is not None and not _is_cloudflare_challenge(resp):
+                cache.store(url, resp)
+            return resp
 
-                    try:
-                        target_x, target_y = None, None
+        except requests.exceptions.HTTPError as e:
+            _report_http_error(self.rate_limits, url, e)
+        except Exception as e:
+            print(f"Error fetching {url}: {e}")
 
-                        # Scenario A: Closed Shadow DOM
-                        if shadow_count > 0:
-                            parent_div = shadow_turnstile.first.locator("..")
-                            box = parent_div.bounding_box()
-                            if self.verbose:
-                                print(f"[DEBUG] Shadow DOM parent bounding box: {box}")
+        return None
 
-                            if box and box["width"] > 0:
-                                target_x = box["x"] + 30 + random.uniform(-5, 5)
-                                target_y = (
-                                    box["y"]
-                                    + (box["height"] / 2)
-                                    + random.uniform(-5, 5)
-                                )
-                                if self.verbose:
-                                    print(
-                                        f"[DEBUG] Calculated Shadow Target: X={target_x:.1f}, Y={target_y:.1f}"
-                                    )
 
-                        # Scenario B: Standard iframe
-                        elif iframe_count > 0:
-                            checkbox = cf_iframes.locator(
-                                ".cb-c, input[type='checkbox']"
-                            ).first
-                            if checkbox.is_visible(timeout=2000):
-                                box = checkbox.bounding_box()
-                                if self.verbose:
-                                    print(
-                                        f"[DEBUG] Standard Iframe checkbox bounding box: {box}"
-                                    )
-                                if box:
-                                    target_x = (
-                                        box["x"]
-                                        + (box["width"] / 2)
-                                        + random.uniform(-5, 5)
-                                    )
-                                    target_y = (
-                                        box["y"]
-                                        + (box["height"] / 2)
-                                        + random.uniform(-5, 5)
-                                    )
-                                    if self.verbose:
-                                        print(
-                                            f"[DEBUG] Calculated Iframe Target: X={target_x:.1f}, Y={target_y:.1f}"
-                                        )
-
-                        # 3. Execution
-                        if target_x is not None and target_y is not None:
-                            if self.verbose:
-                                print(
-                                    "\n[ACTION] Target locked. Simulating human-like mouse movement and click..."
-                                )
-                            page.wait_for_timeout(random.randint(1000, 2000))
+class AsyncPBSSessionManager:
+    """Asyncio counterpart of :class:`PBSSessionManager`.
 
-                            if self.verbose:
-                                print("[ACTION] Moving mouse...")
-                            page.mouse.move(
-                                target_x, target_y, steps=random.randint(15, 30)
-                            )
-                            page.wait_for_timeout(random.randint(200, 500))
-
-                            if self.verbose:
-                                print("[ACTION] Clicking...")
-                            page.mouse.down()
-                            page.wait_for_timeout(random.randint(40, 120))
-                            page.mouse.up()
-                            num_clicks += 1
-                            page.mouse.move(
-                                target_x + random.randint(100, 300),
-                                target_y + random.randint(100, 300),
-                                steps=random.randint(10, 20),
-                            )
+    Requests go through curl_cffi's ``AsyncSession``, rate limits are awaited
+    instead of slept, and Cloudflare challenges are cleared with the async
+    Playwright API, so scraping Baseball Reference or FanGraphs only suspends
+    the calling task and can share an event loop with other work such as the
+    Statcast downloader. Use :func:`get_async_session_manager` to get the
+    shared manager of the running event loop. Clearance cookies are persisted
+    in ``cookie_jar`` as for :class:`PBSSessionManager`.
 
-                            if self.verbose:
-                                print(
-                                    "[ACTION] Click complete. Waiting ~5 seconds for Cloudflare response...\n"
-                                )
-                            page.wait_for_timeout(5000 + random.randint(500, 1500))
-                            continue
+    Args:
+        rate_limits (RateLimiterRegistry | None, optional): Per-host limits.
+            Defaults to the registry shared with :class:`PBSSessionManager`.
+    """
 
-                    except Exception as e:
-                        if self.verbose:
-                            print(f"[DEBUG] Exception during targeting/clicking: {e}")
+    def __init__(self, rate_limits: RateLimiterRegistry | None = None) -> None:
+        self.rate_limits = shared_rate_limits if rate_limits is None else rate_limits
+        self.session: requests.AsyncSession = requests.AsyncSession()
+        self.cookie_jar: ClearanceCookieJar | None = ClearanceCookieJar(
+            user_agent=_CHALLENGE_USER_AGENT
+        )
+        _set_cookies(self.session.cookies, self.cookie_jar.load())
+        self.verbose = False
+        # One browser at a time clears a challenge; tasks that were blocked
+        # by the same challenge reuse its cookies instead of opening another.
+        self._challenge_lock = asyncio.Lock()
+        self._clearances = 0
 
-                    page.wait_for_timeout(1500)
+    def set_verbose(self, verbose: bool) -> None:
+        """Enable or disable verbose logging for debugging."""
+        self.verbose = verbose
 
-                if page.locator("table, #footer").count() == 0:
-                    if self.verbose:
-                        if num_clicks >= max_clicks:
-                            print(
-                                f"\n[WARNING] Maximum click attempts ({max_clicks}) reached without success."
-                            )
-                        else:
-                            print(
-                                "\n[WARNING] Bypass attempts exhausted without detecting success. Proceeding to extract cookies anyway."
-                            )
-                else:
-                    if self.verbose:
-                        print("[DEBUG] Extracting cookies...")
-                    for cookie in context.cookies():
-                        self.session.cookies.set(
-                            cookie["name"], cookie["value"], domain=cookie["domain"]
-                        )
-                    if self.verbose:
-                        print("[DEBUG] === Bypass Process Complete ===\n")
+    async def _rate_limit(self, url: str, verbose: bool) -> None:
+        """Wait until it's safe to make another request to ``url``'s host."""
+        waited = await self.rate_limits.wait_async(url)
+        if verbose and waited > 0:
+            print(f"Rate limit for {urlsplit(url).hostname}, waited {waited:.2f}s")
 
-        except PlaywrightTimeoutError:
-            print("\n[ERROR] Playwright timed out completely.")
-        except Exception as e:
-            print(f"\n[ERROR] Critical failure: {e}")
+    async def _solve_cloudflare_challenge(
+        self, url: str, seen_clearances: int, verbose: bool
+    ) -> None:
+        """Clear a challenge unless another task cleared one since ``seen_clearances``."""
+        async with self._challenge_lock:
+            if self._clearances != seen_clearances:
+                return
+            jar = self.cookie_jar
+            stored = jar.load_if_changed() if jar is not None else []
+            if stored:
+                _set_cookies(self.session.cookies, stored)
+            else:
+                if jar is not None:
+                    jar.invalidate()
+                cookies = await _clear_cloudflare_challenge(url, verbose)
+                _set_cookies(self.session.cookies, cookies)
+                if jar is not None and cookies:
+                    jar.save(cookies)
+            self._clearances += 1
+
+    async def get(
+        self, url: str, *, verbose: bool | None = None, **kwargs: Any
+    ) -> requests.Response | None:
+        """Make an HTTP request with automatic Waterfall escalation.
+
+        Uses the response cache like :meth:`PBSSessionManager.get`.
+
+        Args:
+            url (str): URL to fetch.
+            verbose (bool | None, optional): Print debug information for this
+                request. Defaults to the manager's ``verbose`` setting.
+            **kwargs: Passed on to ``AsyncSession.get``.
+
+        Returns:
+            requests.Response | None: The response, or None if the request
+                failed.
+        """
+        verbose = self.verbose if verbose is None else verbose
+        cache, cached = await asyncio.to_thread(_cache_lookup, url, kwargs)
+        if cached is not None and cached.fresh:
+            if verbose:
+                print(f"HTTP cache hit for {url}")
+            return cached.to_response()
+        if cached is not None:
+            kwargs["headers"] = cached.conditional_headers()
 
-    def get(self, url: str, **kwargs: Any) -> requests.Response | None:
-        """Make an HTTP request with automatic Waterfall escalation."""
-        self._rate_limit()
+        await self._rate_limit(url, verbose)
 
         try:
-            # ATTEMPT 1: Fast curl_cffi
-            resp = self.session.get(url, impersonate="chrome120", **kwargs)
+            seen_clearances = self._clearances
+            resp = await self.session.get(url, impersonate=_IMPERSONATE, **kwargs)
 
-            # Check for block
-            if self._is_cloudflare_challenge(resp):
-                # ATTEMPT 2: The Waterfall Escalation
-                with self._lock:
-                    self._solve_cloudflare_challenge(url)
-
-                # Retry the fast request now that our session has the cf_clearance cookie
-                self._rate_limit()
-                resp = self.session.get(url, impersonate="chrome120", **kwargs)
+            if _is_cloudflare_challenge(resp):
+                await self._solve_cloudflare_challenge(url, seen_clearances, verbose)
+                await self._rate_limit(url, verbose)
+                resp = await self.session.get(url, impersonate=_IMPERSONATE, **kwargs)
 
+            if cache is not None and cached is not None and resp.status_code == 304:
+                return await asyncio.to_thread(cache.revalidated, cached, resp)
             resp.raise_for_status()
+            if cache is not None and not _is_cloudflare_challenge(resp):
+                await asyncio.to_thread(cache.store, url, resp)
             return resp
 
         except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 429:
-                print(f"Received 429 Too Many Requests for {url}. Backing off.")
-            else:
-                print(f"HTTP Error fetching {url}: {e}")
+            _report_http_error(self.rate_limits, url, e)
         except Exception as e:
             print(f"Error fetching {url}: {e}")
 
         return None
+
+    async def close(self) -> None:
+        """Close the underlying ``AsyncSession``."""
+        await self.session.close()
+
+
+# curl_cffi's AsyncSession is bound to the event loop it first runs on, so
+# there is one manager per loop, closed when asyncio.run() shuts it down (see
+# ``client_session_utils._sessions``).
+_async_managers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[AsyncPBSSessionManager, AsyncGenerator[None, None]]]" = weakref.WeakKeyDictionary()
+
+
+async def _close_on_loop_shutdown(
+    manager: AsyncPBSSessionManager,
+) -> AsyncGenerator[None, None]:
+    try:
+        yield
+    finally:
+        await manager.close()
+
+
+async def get_async_session_manager() -> AsyncPBSSessionManager:
+    """Return the shared :class:`AsyncPBSSessionManager` of the running loop."""
+    loop = asyncio.get_running_loop()
+    entry = _async_managers.get(loop)
+    if entry is not None:
+        return entry[0]
+
+    manager = AsyncPBSSessionManager()
+    closer = _close_on_loop_shutdown(manager)
+    await closer.__anext__()
+    _async_managers[loop] = (manager, closer)
+    return manager
+
+
+async def close_async_session_manager() -> None:
+    """Close the shared manager of the running event loop, if any."""
+    entry = _async_managers.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[1].aclose()
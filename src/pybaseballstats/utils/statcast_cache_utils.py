@@ -0,0 +1,311 @@
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from contextlib import asynccontextmanager
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, Sequence
+
+import polars as pl
+
+from pybaseballstats.consts.statcast_consts import (
+    STATCAST_CACHE_LOCK_TIMEOUT_SECONDS,
+    STATCAST_CACHE_RECENT_DAYS,
+    STATCAST_CACHE_RECENT_TTL_SECONDS,
+    STATCAST_CACHE_SCHEMA_VERSION,
+    STATCAST_CHECKPOINT_TTL_SECONDS,
+)
+
+
+def default_cache_dir() -> Path:
+    """Return the root directory used for pybaseballstats on-disk caches.
+
+    Honors ``XDG_CACHE_HOME`` and falls back to ``~/.cache/pybaseballstats``.
+    """
+    base = os.environ.get("XDG_CACHE_HOME")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "pybaseballstats"
+
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _try_lock_file(fd: int) -> bool:
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    def _unlock_file(fd: int) -> None:
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _try_lock_file(fd: int) -> bool:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    def _unlock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def _atomic_write_parquet(df: pl.DataFrame, path: Path) -> None:
+    """Write ``df`` to ``path`` via a temporary file and an atomic rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        df.write_parquet(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+class StatcastChunkCache:
+    """Content-addressed Parquet cache for Statcast date-range chunks.
+
+    Each chunk is stored under a hash of its request URL (which encodes the
+    chunk start/end dates and every search filter), the column projection and
+    the cache schema version, so a schema bump invalidates every entry without
+    touching the files.
+
+    Chunks that ended more than ``recent_days`` before they were written are
+    treated as immutable; this covers every completed season. Chunks written
+    while they overlapped the most recent days expire after
+    ``recent_ttl_seconds``, even once those days are long past, because
+    Savant was still backfilling and correcting those games when they were
+    downloaded.
+
+    Processes sharing a cache directory coordinate through per-entry lock
+    files (see :meth:`lock`): the first process to miss a chunk downloads it
+    while the others wait, then read it from disk.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | os.PathLike[str] | None = None,
+        *,
+        recent_days: int = STATCAST_CACHE_RECENT_DAYS,
+        recent_ttl_seconds: float = STATCAST_CACHE_RECENT_TTL_SECONDS,
+        columns: Sequence[str] | None = None,
+        lock_timeout_seconds: float = STATCAST_CACHE_LOCK_TIMEOUT_SECONDS,
+    ) -> None:
+        self.cache_dir = (
+            Path(cache_dir)
+            if cache_dir is not None
+            else default_cache_dir() / "statcast"
+        )
+        self.recent_days = recent_days
+        self.recent_ttl_seconds = recent_ttl_seconds
+        self.columns = list(columns) if columns is not None else None
+        self.lock_timeout_seconds = lock_timeout_seconds
+
+    def key(self, url: str) -> str:
+        """Return the content address for a chunk URL."""
+        payload = f"v{STATCAST_CACHE_SCHEMA_VERSION}|{url}"
+        if self.columns is not None:
+            payload += f"|columns={','.join(self.columns)}"
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def path(self, url: str) -> Path:
+        """Return the Parquet path that stores the chunk for ``url``."""
+        key = self.key(url)
+        return self.cache_dir / key[:2] / f"{key}.parquet"
+
+    def is_immutable(self, chunk_end: date, written_on: date) -> bool:
+        """Return True when a chunk ending on ``chunk_end`` and stored on
+        ``written_on`` was downloaded after its games had settled."""
+        return chunk_end <= written_on - timedelta(days=self.recent_days)
+
+    def get(self, url: str, chunk_end: date) -> pl.DataFrame | None:
+        """Return the cached chunk for ``url`` or None when missing or stale."""
+        path = self.path(url)
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+        expired = time.time() - mtime > self.recent_ttl_seconds
+        if expired and not self.is_immutable(chunk_end, date.fromtimestamp(mtime)):
+            return None
+
+        try:
+            return pl.read_parquet(path)
+        except Exception:
+            # A corrupt entry is treated as a miss and overwritten on the next put.
+            return None
+
+    def put(self, url: str, df: pl.DataFrame) -> None:
+        """Store the parsed chunk for ``url``."""
+        _atomic_write_parquet(df, self.path(url))
+
+    @asynccontextmanager
+    async def lock(self, url: str) -> AsyncIterator[bool]:
+        """Hold the cross-process lock of the entry for ``url``.
+
+        Waits (without blocking the event loop) while another process or task
+        holds it, for at most ``lock_timeout_seconds``. The lock is an OS file
+        lock, so it is released even if its holder crashes.
+
+        Yields:
+            bool: Whether the lock was acquired. False after a timeout, or
+            when the lock file cannot be created (e.g. a read-only cache).
+        """
+        lock_path = self.path(url).with_suffix(".lock")
+        try:
+            lock_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError:
+            yield False
+            return
+
+        acquired = False
+        try:
+            deadline = time.monotonic() + self.lock_timeout_seconds
+            delay = 0.05
+            while not (acquired := _try_lock_file(fd)):
+                if time.monotonic() >= deadline:
+                    break
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 1.0)
+            yield acquired
+        finally:
+            if acquired:
+                _unlock_file(fd)
+            os.close(fd)
+
+    def clear(self) -> None:
+        """Remove every cached chunk and its lock file.
+
+        Entries locked by a pull that is still running lose their lock, so
+        only clear a cache that no other process is using.
+        """
+        if not self.cache_dir.exists():
+            return
+        for pattern in ("*.parquet", "*.lock"):
+            for path in self.cache_dir.rglob(pattern):
+                path.unlink(missing_ok=True)
+
+
+class StatcastCheckpoint:
+    """Manifest of the chunks a multi-chunk Statcast pull has completed.
+
+    A checkpoint is identified by the full list of chunk URLs the pull
+    requested and its column projection, so re-running the same call finds the checkpoint of the earlier
+    attempt. Every completed chunk is written to a Parquet file next to a
+    ``manifest.json`` that maps chunk URLs to those files and lists the chunks
+    that were split because they hit the Savant row cap. A resumed pull loads
+    completed chunks from here and only requests the rest.
+
+    Checkpoints older than ``ttl_seconds`` are discarded rather than resumed,
+    and are pruned whenever a new checkpoint is opened.
+    """
+
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        root_dir: str | os.PathLike[str] | None = None,
+        *,
+        ttl_seconds: float = STATCAST_CHECKPOINT_TTL_SECONDS,
+        columns: Sequence[str] | None = None,
+    ) -> None:
+        self.root_dir = (
+            Path(root_dir)
+            if root_dir is not None
+            else default_cache_dir() / "checkpoints"
+        )
+        header = f"v{STATCAST_CACHE_SCHEMA_VERSION}"
+        if columns is not None:
+            header += f"|columns={','.join(columns)}"
+        payload = "\n".join([header, *sorted(urls)]).encode()
+        self.key = hashlib.sha256(payload).hexdigest()[:32]
+        self.checkpoint_dir = self.root_dir / self.key
+        self.ttl_seconds = ttl_seconds
+
+        self._prune_expired()
+        self._manifest = self._read_manifest()
+
+    @property
+    def completed_count(self) -> int:
+        return len(self._manifest["completed"])
+
+    def _manifest_path(self) -> Path:
+        return self.checkpoint_dir / self.MANIFEST_NAME
+
+    def _empty_manifest(self) -> Dict[str, Any]:
+        return {"completed": {}, "split": []}
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        try:
+            manifest = json.loads(self._manifest_path().read_text())
+        except (OSError, ValueError):
+            return self._empty_manifest()
+        if (
+            not isinstance(manifest, dict)
+            or not {"completed", "split"} <= manifest.keys()
+        ):
+            return self._empty_manifest()
+        return manifest
+
+    def _write_manifest(self) -> None:
+        path = self._manifest_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self._manifest))
+        os.replace(tmp_path, path)
+
+    def _prune_expired(self) -> None:
+        if not self.root_dir.exists():
+            return
+        cutoff = time.time() - self.ttl_seconds
+        for entry in self.root_dir.iterdir():
+            manifest = entry / self.MANIFEST_NAME
+            try:
+                expired = manifest.stat().st_mtime < cutoff
+            except OSError:
+                continue
+            if expired:
+                shutil.rmtree(entry, ignore_errors=True)
+
+    def get(self, url: str) -> pl.DataFrame | None:
+        """Return the checkpointed chunk for ``url`` if it completed earlier."""
+        file_name = self._manifest["completed"].get(url)
+        if file_name is None:
+            return None
+        try:
+            return pl.read_parquet(self.checkpoint_dir / file_name)
+        except Exception:
+            # A missing or corrupt file just means the chunk is fetched again.
+            return None
+
+    def is_split(self, url: str) -> bool:
+        """Return True when ``url`` was split into halves by an earlier attempt."""
+        return url in self._manifest["split"]
+
+    def record(self, url: str, df: pl.DataFrame) -> None:
+        """Persist a completed chunk and add it to the manifest."""
+        file_name = f"{hashlib.sha256(url.encode()).hexdigest()[:32]}.parquet"
+        _atomic_write_parquet(df, self.checkpoint_dir / file_name)
+        self._manifest["completed"][url] = file_name
+        self._write_manifest()
+
+    def record_split(self, url: str) -> None:
+        """Note that ``url`` hit the row cap and was replaced by its halves."""
+        if url not in self._manifest["split"]:
+            self._manifest["split"].append(url)
+            self._write_manifest()
+
+    def clear(self) -> None:
+        """Remove the checkpoint once the pull has completed."""
+        shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
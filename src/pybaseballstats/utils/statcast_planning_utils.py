@@ -0,0 +1,228 @@
+from abc import ABC, abstractmethod
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Iterator, List, Mapping, Optional, Tuple
+
+import requests
+
+from pybaseballstats.consts.statcast_consts import (
+    MLB_SCHEDULE_URL,
+    STATCAST_BALANCED_TARGET_ROWS,
+    STATCAST_DATE_FORMAT,
+    STATCAST_EST_PITCHES_PER_GAME,
+    STATCAST_PER_TEAM_CHUNK_DAYS,
+    STATCAST_YEAR_RANGES,
+    StatcastTeams,
+)
+from pybaseballstats.utils.statcast_utils import (
+    _create_date_ranges,
+    _estimate_games_on,
+    _merge_small_ranges,
+)
+
+
+@dataclass(frozen=True)
+class StatcastChunk:
+    """One statcast_search request: an inclusive date range and team filter."""
+
+    start: date
+    end: date
+    team: Optional[StatcastTeams] = None
+
+
+class StatcastChunkPlanner(ABC):
+    """Decides how a Statcast date-range pull is split into requests.
+
+    Every chunk a planner returns becomes one statcast_search request. Chunks
+    that still come back at Savant's row cap are bisected by the downloader,
+    so a planner only needs to keep most chunks under it.
+    """
+
+    @abstractmethod
+    def plan(
+        self, start: date, end: date, team: Optional[StatcastTeams] = None
+    ) -> List[StatcastChunk]:
+        """Return the chunks covering ``[start, end]``, skipping offseasons.
+
+        Args:
+            start (date): First game date of the pull.
+            end (date): Last game date of the pull (inclusive).
+            team (StatcastTeams | None, optional): Team filter of the pull.
+
+        Returns:
+            List[StatcastChunk]: Chunks to request, in date order.
+        """
+
+
+class FixedDaysPlanner(StatcastChunkPlanner):
+    """Chunks of ``chunk_size_days`` days, with small adjacent chunks merged.
+
+    This is the default planner of ``pitch_by_pitch_data``.
+
+    With ``align=True`` chunk boundaries instead fall on a fixed grid of
+    ``chunk_size_days`` counted from each season's first day, and nothing is
+    merged. Overlapping pulls (e.g. "last 7 days" and "last 14 days") then
+    request identical URLs for the chunks they share, so concurrent pulls can
+    share those downloads and the chunk cache can serve them.
+    """
+
+    def __init__(self, chunk_size_days: int = 5, *, align: bool = False) -> None:
+        if chunk_size_days <= 0:
+            raise ValueError("chunk_size_days must be a positive integer")
+        self.chunk_size_days = chunk_size_days
+        self.align = align
+
+    def plan(
+        self, start: date, end: date, team: Optional[StatcastTeams] = None
+    ) -> List[StatcastChunk]:
+        if self.align:
+            return [
+                StatcastChunk(s, e, team)
+                for s, e in _aligned_date_ranges(start, end, self.chunk_size_days)
+            ]
+        date_ranges = _merge_small_ranges(
+            list(_create_date_ranges(start, end, step=self.chunk_size_days))
+        )
+        return [StatcastChunk(s, e, team) for s, e in date_ranges]
+
+
+class PerTeamPlanner(StatcastChunkPlanner):
+    """One series of ``chunk_size_days`` chunks per team.
+
+    Savant's ``team`` filter selects the pitching team, so the per-team
+    chunks partition the pull without overlap. A team throws roughly 150
+    pitches a day, so the default window of ``STATCAST_PER_TEAM_CHUNK_DAYS``
+    (133) days stays under the row cap and a whole Statcast year, spring
+    training through the postseason, takes two requests per team.
+
+    With a ``team`` filter only that team is planned, which is where this
+    planner pays off: a team-season takes 2 requests instead of one every
+    few days. A league-wide pull still needs 2 requests per team-season (60
+    in total), more than the default planner's 5-day chunks, so use it there
+    only when many smaller responses suit the connection better.
+    """
+
+    def __init__(self, chunk_size_days: int = STATCAST_PER_TEAM_CHUNK_DAYS) -> None:
+        if chunk_size_days <= 0:
+            raise ValueError("chunk_size_days must be a positive integer")
+        self.chunk_size_days = chunk_size_days
+
+    def plan(
+        self, start: date, end: date, team: Optional[StatcastTeams] = None
+    ) -> List[StatcastChunk]:
+        teams = [team] if team is not None else list(StatcastTeams)
+        date_ranges = list(_create_date_ranges(start, end, step=self.chunk_size_days))
+        return [StatcastChunk(s, e, t) for s, e in date_ranges for t in teams]
+
+
+class BalancedPlanner(StatcastChunkPlanner):
+    """Chunks sized to an estimated row budget from the games on each date.
+
+    Consecutive dates are packed into one request until their estimated
+    pitches reach ``target_rows``, so a week of one-game postseason days is a
+    single request while a full regular-season slate gets only a few days.
+    Game counts come from the MLB Stats API schedule (one request per plan)
+    unless ``games_per_date`` is given. If the schedule cannot be fetched, a
+    conservative estimate of 15 games a day (4 in October) is used instead.
+
+    Args:
+        target_rows (int, optional): Estimated rows to aim for per request.
+            Defaults to ``STATCAST_BALANCED_TARGET_ROWS``.
+        games_per_date (Mapping[date, int] | None, optional): Known number of
+            games on each date. Dates not in the mapping have no games.
+    """
+
+    def __init__(
+        self,
+        target_rows: int = STATCAST_BALANCED_TARGET_ROWS,
+        games_per_date: Optional[Mapping[date, int]] = None,
+    ) -> None:
+        if target_rows <= 0:
+            raise ValueError("target_rows must be a positive integer")
+        self.target_rows = target_rows
+        self.games_per_date = games_per_date
+
+    def plan(
+        self, start: date, end: date, team: Optional[StatcastTeams] = None
+    ) -> List[StatcastChunk]:
+        if start == end:
+            return [StatcastChunk(start, end, team)]
+        games = self.games_per_date
+        if games is None:
+            games = _fetch_games_per_date(start, end)
+
+        chunks: List[StatcastChunk] = []
+        for window_start, window_end in _season_windows(start, end):
+            chunk_start: date | None = None
+            rows = 0
+            day = window_start
+            while day <= window_end:
+                day_games = (
+                    games.get(day, 0) if games is not None else _estimate_games_on(day)
+                )
+                # A team filter keeps only that team's pitches: about half a
+                # game's worth, so count one full game per date to cover
+                # doubleheaders.
+                if team is not None:
+                    day_games = min(day_games, 1)
+                day_rows = day_games * STATCAST_EST_PITCHES_PER_GAME
+                if chunk_start is not None and rows + day_rows > self.target_rows:
+                    chunks.append(StatcastChunk(chunk_start, day - timedelta(1), team))
+                    chunk_start, rows = None, 0
+                if chunk_start is None:
+                    chunk_start = day
+                rows += day_rows
+                day += timedelta(days=1)
+            if chunk_start is not None:
+                chunks.append(StatcastChunk(chunk_start, window_end, team))
+        return chunks
+
+
+def _season_windows(start: date, end: date) -> Iterator[Tuple[date, date]]:
+    """Yield the parts of ``[start, end]`` inside each year's Statcast season."""
+    for year in range(start.year, end.year + 1):
+        season_start, season_end = STATCAST_YEAR_RANGES.get(
+            year, (date(year, 3, 15), date(year, 11, 15))
+        )
+        window_start, window_end = max(start, season_start), min(end, season_end)
+        if window_start <= window_end:
+            yield window_start, window_end
+
+
+def _aligned_date_ranges(
+    start: date, end: date, step: int
+) -> Iterator[Tuple[date, date]]:
+    """Yield ``[start, end]`` cut on a ``step``-day grid anchored at each
+    season's first day."""
+    windows = list(_season_windows(start, end))
+    if not windows and start == end:
+        windows = [(start, end)]
+    for window_start, window_end in windows:
+        season_start, _ = STATCAST_YEAR_RANGES.get(
+            window_start.year, (date(window_start.year, 3, 15), None)
+        )
+        offset = (window_start - season_start).days % step
+        chunk_start = window_start
+        chunk_end = window_start + timedelta(days=step - 1 - offset)
+        while chunk_start <= window_end:
+            yield chunk_start, min(chunk_end, window_end)
+            chunk_start = chunk_end + timedelta(days=1)
+            chunk_end = chunk_start + timedelta(days=step - 1)
+
+
+def _fetch_games_per_date(start: date, end: date) -> Counter[date] | None:
+    """Return the number of scheduled MLB games on each date, or None on failure."""
+    try:
+        resp = requests.get(
+            MLB_SCHEDULE_URL.format(start_date=start, end_date=end), timeout=30
+        )
+        resp.raise_for_status()
+        games: Counter[date] = Counter()
+        for day in resp.json().get("dates", []):
+            game_date = datetime.strptime(day["date"], STATCAST_DATE_FORMAT).date()
+            games[game_date] = int(day.get("totalGames", len(day.get("games", []))))
+        return games
+    except Exception as e:
+        print(f"Unable to load the MLB schedule, estimating games per date: {e}")
+        return None
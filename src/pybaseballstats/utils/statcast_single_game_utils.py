@@ -1,51 +1,31 @@
 import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime
+from typing import AsyncIterator
 
-from playwright.async_api import async_playwright
+from playwright.async_api import Page
 
+from pybaseballstats.utils.browser_pool_utils import (
+    BrowserContextProfile,
+    get_browser_pool,
+)
 
-@asynccontextmanager
-async def get_page_async():
-    """Async context manager for Playwright page."""
-    async with async_playwright() as playwright:
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=[
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-blink-features=AutomationControlled",
-                "--disable-web-security",
-                "--disable-features=VizDisplayCompositor",
-                "--disable-background-networking",
-                "--disable-sync",
-                "--disable-translate",
-                "--disable-logging",
-                "--memory-pressure-off",
-            ],
-        )
-
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            viewport={"width": 1920, "height": 1080},
-        )
+_GAMEFEED_PROFILE = BrowserContextProfile(
+    user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    viewport_width=1920,
+    viewport_height=1080,
+    block_resources=True,
+)
 
-        # Block unnecessary resources
-        await context.route(
-            "**/*.{png,jpg,jpeg,gif,svg,woff,woff2,ttf,css}",
-            lambda route: route.abort(),
-        )
 
-        page = await context.new_page()
+@asynccontextmanager
+async def get_page_async() -> AsyncIterator[Page]:
+    """Async context manager for a page of the shared browser pool."""
+    pool = await get_browser_pool()
+    async with pool.page(_GAMEFEED_PROFILE) as page:
         page.set_default_navigation_timeout(30000)
         page.set_default_timeout(15000)
-
-        try:
-            yield page
-        finally:
-            await page.close()
-            await context.close()
-            await browser.close()
+        yield page
 
 
 def _handle_single_game_date(game_date: str):
@@ -0,0 +1,237 @@
+import hashlib
+import json
+import os
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+import polars as pl
+
+from pybaseballstats.consts.statcast_consts import (
+    STATCAST_DATE_FORMAT,
+    STATCAST_PITCH_KEY_COLUMNS,
+    STATCAST_SYNC_MANIFEST_NAME,
+)
+from pybaseballstats.utils.statcast_cache_utils import _atomic_write_parquet
+from pybaseballstats.utils.statcast_utils import _align_to_schema
+
+
+def _partition_dir(root: Path, year: int, month: int) -> Path:
+    return root / f"year={year}" / f"month={month:02d}"
+
+
+class StatcastParquetSink:
+    """Write Statcast chunks to a ``year=/month=`` partitioned Parquet dataset.
+
+    Every chunk is split by ``game_date`` and written to one file per
+    partition as soon as it arrives, so the caller never holds more than the
+    chunks that are still being downloaded. File names are derived from the
+    chunk URL, which makes re-running the same pull overwrite rather than
+    duplicate its files.
+    """
+
+    def __init__(self, sink_dir: str | os.PathLike[str]) -> None:
+        self.sink_dir = Path(sink_dir)
+        self.files: List[Path] = []
+        self.schema: dict[str, pl.DataType] | None = None
+
+    def write(self, url: str, df: pl.DataFrame) -> None:
+        """Partition ``df`` by game month and write each part to the dataset."""
+        if df.height == 0:
+            return
+        if self.schema is None:
+            self.schema = dict(df.schema)
+        else:
+            df = _align_to_schema(df, self.schema)
+
+        part_name = f"part-{hashlib.sha256(url.encode()).hexdigest()[:16]}.parquet"
+        partitions = df.with_columns(
+            pl.col("game_date").str.slice(0, 4).cast(pl.Int32).alias("_year"),
+            pl.col("game_date").str.slice(5, 2).cast(pl.Int32).alias("_month"),
+        ).partition_by(["_year", "_month"], as_dict=True)
+
+        for (year, month), part in partitions.items():
+            partition_dir = _partition_dir(self.sink_dir, int(year), int(month))
+            self._write_partition(
+                partition_dir / part_name, part.drop(["_year", "_month"])
+            )
+
+    def _write_partition(self, path: Path, part: pl.DataFrame) -> None:
+        _atomic_write_parquet(part, path)
+        self.files.append(path)
+
+    def scan(self) -> pl.LazyFrame:
+        """Return a LazyFrame over the files written by this sink."""
+        if not self.files:
+            return pl.LazyFrame()
+        return pl.scan_parquet(self.files, hive_partitioning=True)
+
+
+class StatcastParquetStore(StatcastParquetSink):
+    """A persistent ``year=/month=`` Statcast dataset that grows incrementally.
+
+    Unlike :class:`StatcastParquetSink`, writes are de-duplicated against the
+    rows already stored in the target partition on
+    ``(game_pk, at_bat_number, pitch_number)``, so appending the same pitches
+    twice is a no-op.
+
+    Games played on or after ``replace_from`` are still being corrected
+    upstream, so a write that contains them replaces every stored row of those
+    games instead, keeping the corrected values.
+
+    The dates each sync covered, including dates without games, are recorded
+    in a manifest next to the partitions, per team filter (``scope``).
+    """
+
+    def __init__(
+        self, store_dir: str | os.PathLike[str], replace_from: date | None = None
+    ) -> None:
+        super().__init__(store_dir)
+        self.replace_from = replace_from
+        existing = self.existing_files()
+        if existing:
+            self.schema = dict(pl.read_parquet_schema(existing[0]))
+
+    def existing_files(self, partition_dir: Path | None = None) -> List[Path]:
+        """Return the Parquet files in the store, or in one partition of it."""
+        if partition_dir is not None:
+            return sorted(partition_dir.glob("*.parquet"))
+        return sorted(self.sink_dir.glob("year=*/month=*/*.parquet"))
+
+    def present_dates(self) -> Set[date]:
+        """Return every ``game_date`` that already has rows in the store."""
+        files = self.existing_files()
+        if not files:
+            return set()
+        dates = (
+            pl.scan_parquet(files, hive_partitioning=True)
+            .select(pl.col("game_date").unique())
+            .collect()
+            .to_series()
+        )
+        return {
+            datetime.strptime(str(d), STATCAST_DATE_FORMAT).date()
+            for d in dates
+            if d is not None
+        }
+
+    @property
+    def manifest_path(self) -> Path:
+        """JSON file recording the date ranges synced into the store."""
+        return self.sink_dir / STATCAST_SYNC_MANIFEST_NAME
+
+    def _synced_ranges(self) -> Dict[str, List[Tuple[date, date]]] | None:
+        try:
+            stored = json.loads(self.manifest_path.read_text())
+        except FileNotFoundError:
+            return None
+        return {
+            scope: [
+                (date.fromisoformat(start), date.fromisoformat(end))
+                for start, end in ranges
+            ]
+            for scope, ranges in stored["synced"].items()
+        }
+
+    def synced_dates(self, scope: str = "") -> Set[date]:
+        """Return every date a sync with ``scope`` has covered.
+
+        Stores written before the manifest existed have none; until the first
+        :meth:`record_synced`, which carries them over to its own scope, the
+        dates that have rows (:meth:`present_dates`) count as synced.
+        """
+        synced = self._synced_ranges()
+        if synced is None:
+            return self.present_dates()
+        return {
+            start + timedelta(days=offset)
+            for start, end in synced.get(scope, [])
+            for offset in range((end - start).days + 1)
+        }
+
+    def record_synced(self, start: date, end: date, scope: str = "") -> None:
+        """Record that every date in ``[start, end]`` has been synced."""
+        synced = self._synced_ranges() or {}
+        days = (end - start).days + 1
+        synced[scope] = _date_runs(
+            self.synced_dates(scope)
+            | {start + timedelta(days=offset) for offset in range(days)}
+        )
+
+        self.sink_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_name(
+            f".{self.manifest_path.name}.{os.getpid()}.tmp"
+        )
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "synced": {
+                        name: [[a.isoformat(), b.isoformat()] for a, b in runs]
+                        for name, runs in synced.items()
+                    }
+                }
+            )
+        )
+        os.replace(tmp_path, self.manifest_path)
+
+    def _write_partition(self, path: Path, part: pl.DataFrame) -> None:
+        existing = self.existing_files(path.parent)
+        if existing and self.replace_from is not None:
+            refreshed = (
+                part.filter(
+                    pl.col("game_date")
+                    >= self.replace_from.strftime(STATCAST_DATE_FORMAT)
+                )
+                .get_column("game_pk")
+                .unique()
+                .to_list()
+            )
+            if refreshed:
+                self._drop_games(existing, refreshed)
+                existing = self.existing_files(path.parent)
+        if existing:
+            stored_keys = (
+                pl.scan_parquet(existing).select(STATCAST_PITCH_KEY_COLUMNS).collect()
+            )
+            part = part.join(stored_keys, on=STATCAST_PITCH_KEY_COLUMNS, how="anti")
+        if part.height == 0:
+            return
+        # Re-syncing a chunk only ever adds new pitches, so never overwrite the
+        # file an earlier sync wrote for the same chunk.
+        stem, suffix, n = path.stem, path.suffix, 1
+        while path.exists():
+            path = path.with_name(f"{stem}-{n}{suffix}")
+            n += 1
+        super()._write_partition(path, part)
+
+    def _drop_games(self, files: List[Path], game_pks: List[int]) -> None:
+        """Remove every row of ``game_pks`` from ``files``, in place."""
+        for file in files:
+            stored = pl.read_parquet(file, columns=["game_pk"]).get_column("game_pk")
+            if not stored.is_in(game_pks).any():
+                continue
+            kept = pl.read_parquet(file).filter(~pl.col("game_pk").is_in(game_pks))
+            if kept.height:
+                _atomic_write_parquet(kept, file)
+            else:
+                file.unlink()
+                if file in self.files:
+                    self.files.remove(file)
+
+    def scan_all(self) -> pl.LazyFrame:
+        """Return a LazyFrame over every file in the store."""
+        files = self.existing_files()
+        if not files:
+            return pl.LazyFrame()
+        return pl.scan_parquet(files, hive_partitioning=True)
+
+
+def _date_runs(dates: Set[date]) -> List[Tuple[date, date]]:
+    """Group ``dates`` into inclusive runs of consecutive days."""
+    runs: List[Tuple[date, date]] = []
+    for day in sorted(dates):
+        if runs and runs[-1][1] + timedelta(days=1) == day:
+            runs[-1] = (runs[-1][0], day)
+        else:
+            runs.append((day, day))
+    return runs
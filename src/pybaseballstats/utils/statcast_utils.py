@@ -1,159 +1,697 @@
 import asyncio
 import io
-from dataclasses import dataclass
+import math
+import os
+import re
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import date, datetime, timedelta
-from typing import Iterator, List, Optional, Tuple
+from typing import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Collection,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from urllib.parse import parse_qs, urlencode, urlsplit
 
 import aiohttp
 import polars as pl
 from rich.progress import MofNCompleteColumn, Progress, SpinnerColumn, TimeElapsedColumn
 
 from pybaseballstats.consts.statcast_consts import (
+    STATCAST_DATE_FORMAT,
+    STATCAST_EST_PITCHES_PER_GAME,
+    STATCAST_INITIAL_CONCURRENCY,
+    STATCAST_MAX_CONCURRENCY,
+    STATCAST_PITCH_BY_PITCH_SCHEMA,
+    STATCAST_SEARCH_ROW_CAP,
     STATCAST_YEAR_RANGES,
+    StatcastGameTypes,
+    StatcastPitchTypes,
+)
+from pybaseballstats.utils.client_session_utils import get_client_session
+from pybaseballstats.utils.concurrency_utils import (
+    AdaptiveConcurrencyLimiter,
+    SingleFlight,
+)
+from pybaseballstats.utils.statcast_cache_utils import (
+    StatcastCheckpoint,
+    StatcastChunkCache,
 )
 
 
 @dataclass
 class ChunkFetchResult:
+    """Outcome of one chunk request, with where its time was spent.
+
+    Timings are in seconds. ``queue_wait_seconds`` covers every wait for a
+    network slot, a parse slot or a cache lock; ``ttfb_seconds`` and
+    ``download_seconds`` are those of the final attempt, and
+    ``body_bytes`` is its decompressed body size. ``total_seconds`` is the
+    time from the first attempt to the result, including retry back-off.
+    """
+
     url: str
     dataframe: Optional[pl.DataFrame]
     error: Optional[str] = None
+    # Set when the chunk was read from the cache instead of downloaded.
+    cached: bool = False
+    # Set when a downloaded chunk has already been written to the cache.
+    stored: bool = False
+    queue_wait_seconds: float = 0.0
+    ttfb_seconds: float = 0.0
+    download_seconds: float = 0.0
+    body_bytes: int = 0
+    parse_seconds: float = 0.0
+    align_seconds: float = 0.0
+    retries: int = 0
+    total_seconds: float = 0.0
+
+
+@dataclass
+class StatcastFetchReport:
+    """Per-chunk timings and aggregate throughput of one Statcast pull.
+
+    Pass ``on_report`` to a pull to receive it once the pull ends, including
+    when it fails. Comparing the stage totals shows whether a slow pull is
+    bound by the network (``ttfb_seconds`` + ``download_seconds``), by
+    parsing (``parse_seconds`` and parse-slot waits in ``queue_wait_seconds``)
+    or by retries.
+
+    Attributes:
+        chunks (List[ChunkFetchResult]): One entry per chunk request, cached
+            chunks included, without its data frame.
+        rows (int): Rows parsed or read from the cache.
+        elapsed_seconds (float): Wall time of the pull.
+    """
+
+    chunks: List[ChunkFetchResult] = field(default_factory=list)
+    rows: int = 0
+    elapsed_seconds: float = 0.0
+
+    def record(self, result: ChunkFetchResult) -> None:
+        """Add a finished chunk, keeping its timings but not its data."""
+        if result.dataframe is not None:
+            self.rows += result.dataframe.height
+        self.chunks.append(replace(result, dataframe=None))
+
+    @property
+    def downloaded(self) -> List[ChunkFetchResult]:
+        """Chunks that were requested from Savant rather than read from disk."""
+        return [c for c in self.chunks if not c.cached]
+
+    @property
+    def failed(self) -> List[ChunkFetchResult]:
+        return [c for c in self.chunks if c.error is not None]
+
+    @property
+    def body_bytes(self) -> int:
+        return sum(c.body_bytes for c in self.chunks)
+
+    @property
+    def retries(self) -> int:
+        return sum(c.retries for c in self.chunks)
+
+    def stage_seconds(self) -> dict[str, float]:
+        """Seconds spent in each stage, summed over chunks."""
+        return {
+            stage: sum(getattr(c, f"{stage}_seconds") for c in self.chunks)
+            for stage in ("queue_wait", "ttfb", "download", "parse", "align")
+        }
+
+    def latency_percentile(self, q: float) -> float:
+        """Nearest-rank ``q`` percentile (0-100) of downloaded chunk latency."""
+        latencies = sorted(c.total_seconds for c in self.downloaded)
+        if not latencies:
+            return 0.0
+        return latencies[max(0, math.ceil(q / 100 * len(latencies)) - 1)]
+
+    @property
+    def p50_latency_seconds(self) -> float:
+        return self.latency_percentile(50)
+
+    @property
+    def p95_latency_seconds(self) -> float:
+        return self.latency_percentile(95)
+
+    @property
+    def megabytes_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.body_bytes / 1e6 / self.elapsed_seconds
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.rows / self.elapsed_seconds
+
+    def summary(self) -> str:
+        """Describe the pull in one line, e.g. for ``verbose`` output."""
+        stages = ", ".join(
+            f"{stage} {seconds:.1f}s" for stage, seconds in self.stage_seconds().items()
+        )
+        cached = len(self.chunks) - len(self.downloaded)
+        return (
+            f"{len(self.chunks)} chunks ({cached} cached, {len(self.failed)} failed, "
+            f"{self.retries} retries) in {self.elapsed_seconds:.1f}s; "
+            f"latency p50 {self.p50_latency_seconds:.2f}s "
+            f"p95 {self.p95_latency_seconds:.2f}s; "
+            f"{self.megabytes_per_second:.1f} MB/s, "
+            f"{self.rows_per_second:,.0f} rows/s; {stages}"
+        )
+
+
+def _parse_statcast_csv(
+    body: bytes | io.BytesIO, columns: Sequence[str] | None = None
+) -> pl.DataFrame:
+    """Parse a statcast_search CSV body into the declared Statcast schema.
+
+    ``body`` is handed to Polars as is: a ``BytesIO`` filled by
+    :func:`_read_body` is read through its own buffer without being copied.
+    When ``columns`` is given only those columns are materialized, in that
+    order; any the body does not contain are returned as nulls.
+    """
+    return _parse_statcast_csv_timed(body, columns)[0]
+
+
+def _parse_statcast_csv_timed(
+    body: bytes | io.BytesIO, columns: Sequence[str] | None = None
+) -> Tuple[pl.DataFrame, float, float]:
+    """:func:`_parse_statcast_csv`, also returning the seconds spent reading
+    the CSV and aligning the result to ``columns``."""
+
+    def _read(projection: Sequence[str] | None) -> pl.DataFrame:
+        if isinstance(body, io.BytesIO):
+            body.seek(0)
+        return pl.read_csv(
+            body,
+            columns=projection,
+            null_values=["null", "NULL", "NA"],
+            ignore_errors=True,
+            schema_overrides=STATCAST_PITCH_BY_PITCH_SCHEMA,
+            infer_schema=False,
+            # The empty check exports the buffer, which makes Polars copy it.
+            # Callers reject empty bodies before parsing.
+            raise_if_empty=False,
+        )
+
+    started = time.perf_counter()
+    if columns is None:
+        return _read(None), time.perf_counter() - started, 0.0
+    try:
+        df = _read(list(columns))
+        parsed = time.perf_counter()
+    except pl.exceptions.ColumnNotFoundError:
+        df = _read(None)
+        parsed = time.perf_counter()
+        df = df.with_columns(
+            pl.lit(None).cast(STATCAST_PITCH_BY_PITCH_SCHEMA.get(c, pl.String)).alias(c)
+            for c in columns
+            if c not in df.columns
+        )
+    df = df.select(columns)
+    return df, parsed - started, time.perf_counter() - parsed
+
+
+def _statcast_search_filters(
+    pitch_types: Sequence[StatcastPitchTypes] | None = None,
+    pitchers: Sequence[int] | None = None,
+    batters: Sequence[int] | None = None,
+    game_types: Sequence[StatcastGameTypes] | None = None,
+    seasons: Sequence[int] | None = None,
+) -> str:
+    """Encode optional filters as extra statcast_search query parameters.
+
+    Returns an ``&``-prefixed query fragment, or an empty string when no
+    filter is set. Multi-valued ``hf*`` filters use Savant's pipe-terminated
+    list format (``hfPT=FF|SL|``) and player filters repeat the lookup key.
+    """
+    params: List[Tuple[str, str]] = []
+    if pitch_types:
+        params.append(("hfPT", "".join(f"{p.value}|" for p in pitch_types)))
+    if game_types:
+        params.append(("hfGT", "".join(f"{g.value}|" for g in game_types)))
+    if seasons:
+        params.append(("hfSea", "".join(f"{s}|" for s in seasons)))
+    params.extend(("pitchers_lookup[]", str(p)) for p in pitchers or [])
+    params.extend(("batters_lookup[]", str(b)) for b in batters or [])
+    return f"&{urlencode(params)}" if params else ""
+
+
+async def _read_body(response: aiohttp.ClientResponse) -> io.BytesIO | None:
+    """Stream an (already decompressed) response body into one buffer.
+
+    ``response.read()`` keeps every received block and joins them at the end,
+    briefly holding the body twice. Writing blocks into a ``BytesIO`` as they
+    arrive keeps a single copy that :func:`_parse_statcast_csv` can parse in
+    place. Returns ``None`` for an empty body.
+    """
+    buffer = io.BytesIO()
+    async for block in response.content.iter_any():
+        buffer.write(block)
+    if buffer.tell() == 0:
+        return None
+    return buffer
+
+
+class _CsvParseStage:
+    """Thread-pool stage that parses downloaded CSV bodies off the event loop.
+
+    Download coroutines hand response bodies to this stage through a bounded number
+    of slots. ``pl.read_csv`` releases the GIL, so while one chunk is being
+    parsed the event loop keeps reading other response bodies.
+    """
+
+    def __init__(self, workers: int, max_pending: int | None = None) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="pybaseballstats-csv"
+        )
+        self._slots = asyncio.Semaphore(max_pending or workers * 2)
+        self._closed = False
+
+    async def reserve(self) -> None:
+        """Wait for room in the stage before handing it a body."""
+        await self._slots.acquire()
+
+    async def parse(
+        self, body: bytes | io.BytesIO, columns: Sequence[str] | None = None
+    ) -> Tuple[pl.DataFrame, float, float]:
+        """Parse a body in the pool. Must follow a successful :meth:`reserve`.
+
+        Returns the frame with its parse and align seconds, as
+        :func:`_parse_statcast_csv_timed` does.
+        """
+        try:
+            if self._closed:
+                # A download coalesced with another pull can outlive the pull
+                # that owns this stage.
+                return await asyncio.to_thread(_parse_statcast_csv_timed, body, columns)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, _parse_statcast_csv_timed, body, columns
+            )
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        self._closed = True
+        # Parses already queued may belong to downloads that another pull is
+        # awaiting through a coalesced flight, so they are left to finish.
+        self._executor.shutdown(wait=False)
+
+
+# Chunk downloads in flight on each event loop, keyed by URL and column
+# projection, so concurrent pulls over overlapping ranges share them.
+_chunk_flights: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SingleFlight[Tuple[str, Tuple[str, ...] | None], ChunkFetchResult]]" = weakref.WeakKeyDictionary()
+
+
+def _chunk_flights_for_loop() -> SingleFlight[
+    Tuple[str, Tuple[str, ...] | None], ChunkFetchResult
+]:
+    loop = asyncio.get_running_loop()
+    flights = _chunk_flights.get(loop)
+    if flights is None:
+        flights = _chunk_flights[loop] = SingleFlight()
+    return flights
+
+
+def _default_parse_workers() -> int:
+    return max(1, min(4, (os.cpu_count() or 2) // 2))
+
+
+def _make_concurrency_limiter(concurrency: int | None) -> AdaptiveConcurrencyLimiter:
+    """Return a fixed limiter for an explicit ``concurrency``, else an adaptive one."""
+    if concurrency is not None:
+        return AdaptiveConcurrencyLimiter(concurrency, fixed=True)
+    return AdaptiveConcurrencyLimiter(
+        STATCAST_INITIAL_CONCURRENCY, max_limit=STATCAST_MAX_CONCURRENCY
+    )
 
 
 async def _fetch_and_parse_chunk(
     session: aiohttp.ClientSession,
     url: str,
-    semaphore: asyncio.Semaphore,
+    limiter: AdaptiveConcurrencyLimiter,
     max_retries: int = 3,
+    *,
+    parser: _CsvParseStage | None = None,
+    columns: Sequence[str] | None = None,
 ) -> ChunkFetchResult:
-    async with semaphore:
-        last_error = "Unknown error"
-
-        for attempt in range(1, max_retries + 1):
+    """Download one chunk and parse it, retrying on any failure.
+
+    The slot from ``limiter`` is only held while the body is being downloaded.
+    Time to first byte is reported to the limiter as a success, and 429/5xx
+    responses and timeouts as overload. When ``parser`` is given, parsing
+    happens in its thread pool, and a parse slot is reserved before the
+    network slot is released so that downloads stall rather than pile up
+    bodies when parsing falls behind.
+    """
+    last_error = "Unknown error"
+    started = time.monotonic()
+    queue_wait = 0.0
+
+    for attempt in range(1, max_retries + 1):
+        body: io.BytesIO | None = None
+        retry_delay = 1.0 * attempt
+        ttfb = download = 0.0
+
+        waiting_since = time.monotonic()
+        async with limiter as generation:
+            queue_wait += time.monotonic() - waiting_since
             try:
+                requested_at = time.monotonic()
                 async with session.get(url) as response:
+                    ttfb = time.monotonic() - requested_at
                     if response.status == 200:
-                        raw_bytes = await response.read()
-                        if not raw_bytes:
+                        limiter.record_success(ttfb)
+                        body = await _read_body(response)
+                        download = time.monotonic() - requested_at - ttfb
+                        if body is None:
                             last_error = "Empty response body"
-                            if attempt < max_retries:
-                                await asyncio.sleep(1 * attempt)
-                                continue
-                            return ChunkFetchResult(
-                                url=url, dataframe=None, error=last_error
-                            )
-                        try:
-                            df = pl.read_csv(
-                                io.BytesIO(raw_bytes),
-                                null_values=["null", "NULL", "NA"],
-                                ignore_errors=True,
-                                infer_schema_length=10000,
-                            )
-                            if df.height > 0:
-                                return ChunkFetchResult(url=url, dataframe=df)
-                            elif df.height == 0:
-                                return ChunkFetchResult(
-                                    url=url, dataframe=pl.DataFrame(), error=None
-                                )
-
-                            last_error = "Parsed CSV contained zero rows"
-                            if attempt < max_retries:
-                                await asyncio.sleep(1 * attempt)
-                                continue
-                            return ChunkFetchResult(
-                                url=url, dataframe=None, error=last_error
-                            )
-                        except Exception as e:
-                            # Sometimes empty or malformed CSVs come back
-                            last_error = f"CSV parse error: {type(e).__name__}: {e}"
-                            if attempt < max_retries:
-                                await asyncio.sleep(1 * attempt)
-                                continue
-                            return ChunkFetchResult(
-                                url=url, dataframe=None, error=last_error
-                            )
-                    # Handle Non-200
                     else:
+                        if response.status == 429 or response.status >= 500:
+                            limiter.record_failure(generation)
                         # Retry all HTTP errors for data integrity guarantees.
                         last_error = f"HTTP {response.status}"
-                        if attempt < max_retries:
-                            await asyncio.sleep(1.5 * attempt)
-                            continue
-                        return ChunkFetchResult(
-                            url=url, dataframe=None, error=last_error
-                        )
-
+                        retry_delay = 1.5 * attempt
             except Exception as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    limiter.record_failure(generation)
                 # Retry all transport/runtime errors for data integrity guarantees.
                 last_error = f"{type(e).__name__}: {e}"
-                if attempt < max_retries:
-                    await asyncio.sleep(1 * attempt)
-                    continue
-                return ChunkFetchResult(url=url, dataframe=None, error=last_error)
-
-        return ChunkFetchResult(
-            url=url,
-            dataframe=None,
-            error=f"Failed after {max_retries} retries. Last error: {last_error}",
-        )
+
+            if body is not None and parser is not None:
+                waiting_since = time.monotonic()
+                await parser.reserve()
+                queue_wait += time.monotonic() - waiting_since
+
+        if body is not None:
+            # _read_body leaves the position at the end of what it wrote.
+            body_bytes = body.tell()
+            try:
+                if parser is not None:
+                    df, parse_seconds, align_seconds = await parser.parse(body, columns)
+                else:
+                    df, parse_seconds, align_seconds = _parse_statcast_csv_timed(
+                        body, columns
+                    )
+                if df.height == 0:
+                    df = pl.DataFrame()
+                return ChunkFetchResult(
+                    url=url,
+                    dataframe=df,
+                    queue_wait_seconds=queue_wait,
+                    ttfb_seconds=ttfb,
+                    download_seconds=download,
+                    body_bytes=body_bytes,
+                    parse_seconds=parse_seconds,
+                    align_seconds=align_seconds,
+                    retries=attempt - 1,
+                    total_seconds=time.monotonic() - started,
+                )
+            except Exception as e:
+                # Sometimes empty or malformed CSVs come back
+                last_error = f"CSV parse error: {type(e).__name__}: {e}"
+
+        if attempt < max_retries:
+            await asyncio.sleep(retry_delay)
+
+    return ChunkFetchResult(
+        url=url,
+        dataframe=None,
+        error=f"Failed after {max_retries} attempts. Last error: {last_error}",
+        queue_wait_seconds=queue_wait,
+        retries=max_retries - 1,
+        total_seconds=time.monotonic() - started,
+    )
 
 
 async def _fetch_all_data(
     urls: List[str],
-    date_range_total_days: int,
     *,
     concurrency: int | None = None,
+    limiter: AdaptiveConcurrencyLimiter | None = None,
     show_progress: bool = True,
+    cache: StatcastChunkCache | None = None,
+    checkpoint: StatcastCheckpoint | None = None,
+    on_chunk: Callable[[str, pl.DataFrame], None] | None = None,
+    row_cap: int | None = STATCAST_SEARCH_ROW_CAP,
+    parse_workers: int | None = None,
+    columns: Sequence[str] | None = None,
+    session: aiohttp.ClientSession | None = None,
+    coalesce: bool = True,
+    report: StatcastFetchReport | None = None,
 ) -> List[pl.DataFrame]:
     """
-    Orchestrates the fetching of all URLs.
-    """
-    # Tuning concurrency (caller may override).
-    if concurrency is None:
-        concurrency = 25 if date_range_total_days <= 30 else 15
+    Fetch every URL and return the parsed chunks.
 
-    connector = aiohttp.TCPConnector(limit=0, ttl_dns_cache=300)
-    timeout = aiohttp.ClientTimeout(total=None, sock_connect=15, sock_read=45)
+    See :func:`_iter_chunks` for how chunks are downloaded, cached,
+    checkpointed and split; this collects what it yields.
 
-    semaphore = asyncio.Semaphore(concurrency)
+    When ``on_chunk`` is provided, each chunk is handed to it as soon as it is
+    parsed and is not retained, so the returned list is empty and peak memory
+    is bounded by the chunks still in flight. The callback runs in a worker
+    thread, one chunk at a time, so sinks that write to disk do not stall the
+    downloads still running on the event loop.
+    """
     results: List[pl.DataFrame] = []
+    async for url, df in _iter_chunks(
+        urls,
+        concurrency=concurrency,
+        limiter=limiter,
+        show_progress=show_progress,
+        cache=cache,
+        checkpoint=checkpoint,
+        row_cap=row_cap,
+        parse_workers=parse_workers,
+        columns=columns,
+        session=session,
+        coalesce=coalesce,
+        report=report,
+    ):
+        if on_chunk is not None:
+            await asyncio.to_thread(on_chunk, url, df)
+        else:
+            results.append(df)
+    return results
+
+
+async def _iter_chunks(
+    urls: List[str],
+    *,
+    concurrency: int | None = None,
+    limiter: AdaptiveConcurrencyLimiter | None = None,
+    show_progress: bool = True,
+    cache: StatcastChunkCache | None = None,
+    checkpoint: StatcastCheckpoint | None = None,
+    row_cap: int | None = STATCAST_SEARCH_ROW_CAP,
+    parse_workers: int | None = None,
+    columns: Sequence[str] | None = None,
+    session: aiohttp.ClientSession | None = None,
+    coalesce: bool = True,
+    report: StatcastFetchReport | None = None,
+) -> AsyncGenerator[Tuple[str, pl.DataFrame], None]:
+    """
+    Fetch all URLs and yield ``(url, chunk)`` pairs as each chunk completes.
+
+    Chunks are yielded in completion order, not URL order. Downloads keep
+    running while the consumer handles a yielded chunk, so the first chunk is
+    available after roughly one request rather than after the whole pull.
+
+    Requests go through ``session``, by default the shared keep-alive session
+    for the running loop, so connections to Savant are reused across calls.
+    Requests in flight are bounded by ``limiter``. Without one, an explicit
+    ``concurrency`` is used as a fixed limit; otherwise the limit adapts (AIMD)
+    to how Savant is responding.
+
+    When ``cache`` is provided, chunks already on disk are served from it and
+    only the remaining URLs are requested from Savant. Newly downloaded chunks
+    are written back to the cache.
+
+    When ``checkpoint`` is provided, every completed chunk is recorded in it
+    before it is yielded, chunks completed by an earlier attempt of the same
+    pull are loaded from it instead of requested, and it is cleared once every
+    chunk has been retrieved. A failed pull therefore loses nothing: running
+    it again only requests the chunks that are still missing.
+
+    statcast_search silently truncates large result sets, so any chunk that
+    comes back with ``row_cap`` rows is discarded and re-requested as two
+    half-length date ranges, recursively, down to single days.
+
+    CSV parsing runs in a pool of ``parse_workers`` threads (default: up to 4)
+    fed through a bounded hand-off, so parsing one chunk never blocks other
+    downloads. ``parse_workers=0`` parses inline on the event loop. Only
+    ``columns`` are materialized when given; ``cache`` and ``checkpoint``
+    must then have been created with the same projection.
+
+    With ``coalesce`` (the default), a chunk that another pull on the same
+    event loop is already downloading (same URL and ``columns``) is not
+    requested again: both pulls await the one download and parse, and each
+    receives the parsed chunk.
+
+    When ``report`` is provided, every chunk result (cached, downloaded or
+    failed) is recorded in it as it completes, and its elapsed time is set
+    when the generator finishes or is closed.
+
+    If any chunk still fails after retries, RuntimeError is raised once every
+    other chunk has been yielded. Closing the generator early cancels the
+    requests still in flight.
+    """
+    started = time.monotonic()
+    ready: List[Tuple[str, pl.DataFrame]] = []
+
+    def _load_from_cache(url: str) -> bool:
+        cached = checkpoint.get(url) if checkpoint is not None else None
+        if cached is None and cache is not None:
+            cached = cache.get(url, _chunk_dates_from_url(url)[1])
+        if cached is None:
+            return False
+        if report is not None:
+            report.record(ChunkFetchResult(url=url, dataframe=cached, cached=True))
+        ready.append((url, cached))
+        return True
+
+    def _pending(url: str) -> List[str]:
+        # Chunks an earlier attempt split at the row cap go straight to halves.
+        halves = (
+            _split_chunk_url(url)
+            if checkpoint is not None and checkpoint.is_split(url)
+            else None
+        )
+        if halves is not None:
+            return [pending for half in halves for pending in _pending(half)]
+        return [] if _load_from_cache(url) else [url]
+
+    pending_urls = [pending for url in urls for pending in _pending(url)]
+    if show_progress and ready:
+        source = "cache" if checkpoint is None else "checkpoint/cache"
+        print(f"Loaded {len(ready)} chunks from {source}.")
+    if not pending_urls:
+        try:
+            for item in ready:
+                yield item
+        finally:
+            if report is not None:
+                report.elapsed_seconds = time.monotonic() - started
+        if checkpoint is not None:
+            checkpoint.clear()
+        return
+
+    if session is None:
+        session = await get_client_session()
+    if limiter is None:
+        limiter = _make_concurrency_limiter(concurrency)
+    if parse_workers is None:
+        parse_workers = _default_parse_workers()
+    parser = _CsvParseStage(parse_workers) if parse_workers > 0 else None
     failed_chunks: List[ChunkFetchResult] = []
+    requested_count = len(pending_urls)
 
     if show_progress:
-        print(
-            f"Starting download of {len(urls)} chunks with {concurrency} concurrent workers..."
+        workers = (
+            f"{limiter.limit} concurrent workers"
+            if limiter.fixed
+            else f"adaptive concurrency (starting at {limiter.limit})"
         )
+        print(f"Starting download of {len(pending_urls)} chunks with {workers}...")
 
-    async with aiohttp.ClientSession(
-        connector=connector,
-        timeout=timeout,
-        headers={
-            "User-Agent": "pybaseballstats (https://github.com/nico671/pybaseballstats)",
-        },
-    ) as session:
-        tasks = [_fetch_and_parse_chunk(session, url, semaphore) for url in urls]
-
-        if show_progress:
-            with Progress(
-                SpinnerColumn(),
-                *Progress.get_default_columns(),
-                MofNCompleteColumn(),
-                TimeElapsedColumn(),
-            ) as progress:
-                task_id = progress.add_task("Downloading & Parsing...", total=len(urls))
-
-                # as_completed yields futures as they finish, allowing us to update progress
-                for future in asyncio.as_completed(tasks):
-                    result = await future
-                    if result.dataframe is not None:
-                        results.append(result.dataframe)
-                    else:
-                        failed_chunks.append(result)
+    flights = _chunk_flights_for_loop() if coalesce else None
+    in_flight: set[asyncio.Task[ChunkFetchResult]] = set()
+    try:
+
+        def _start(url: str) -> asyncio.Task[ChunkFetchResult]:
+            def _download() -> Awaitable[ChunkFetchResult]:
+                return _fetch_and_parse_chunk(
+                    session, url, limiter, parser=parser, columns=columns
+                )
+
+            def _fetch() -> Awaitable[ChunkFetchResult]:
+                if cache is None:
+                    return _download()
+                return _fetch_through_cache(cache, url, _download, row_cap)
+
+            if flights is None:
+                return asyncio.ensure_future(_fetch())
+            key = (url, tuple(columns) if columns is not None else None)
+            return asyncio.ensure_future(flights.run(key, _fetch))
+
+        in_flight = {_start(url) for url in pending_urls}
+
+        with Progress(
+            SpinnerColumn(),
+            *Progress.get_default_columns(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            disable=not show_progress,
+        ) as progress:
+            task_id = progress.add_task(
+                "Downloading & Parsing...", total=len(pending_urls)
+            )
+
+            # Chunks served from disk are handed over while the first
+            # downloads are in flight.
+            while ready:
+                yield ready.pop(0)
+
+            # Handle chunks as they finish, so each one can be handed off
+            # (and released) before the slower ones arrive. Chunks that hit
+            # the Savant row cap are split in half and re-queued.
+            while in_flight:
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    result = task.result()
                     progress.update(task_id, advance=1)
-        else:
-            gathered = await asyncio.gather(*tasks)
-            results.extend([r.dataframe for r in gathered if r.dataframe is not None])
-            failed_chunks.extend([r for r in gathered if r.dataframe is None])
+                    if report is not None:
+                        report.record(result)
+                    if result.dataframe is None:
+                        failed_chunks.append(result)
+                        continue
+
+                    capped = row_cap is not None and result.dataframe.height >= row_cap
+                    halves = _split_chunk_url(result.url) if capped else None
+                    if halves is None:
+                        if capped:
+                            print(
+                                f"Warning: single-day chunk {result.url} returned "
+                                f"{result.dataframe.height} rows, the Savant row cap. "
+                                "Results for that day may be truncated."
+                            )
+                        if not (result.cached or result.stored):
+                            await asyncio.to_thread(_store_in_cache, cache, result)
+                        if checkpoint is not None:
+                            await asyncio.to_thread(
+                                checkpoint.record, result.url, result.dataframe
+                            )
+                        yield result.url, result.dataframe
+                        continue
+
+                    if checkpoint is not None:
+                        checkpoint.record_split(result.url)
+                    for half_url in halves:
+                        if _load_from_cache(half_url):
+                            continue
+                        requested_count += 1
+                        progress.update(task_id, total=requested_count)
+                        in_flight.add(_start(half_url))
+                while ready:
+                    yield ready.pop(0)
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if parser is not None:
+            parser.close()
+        if report is not None:
+            report.elapsed_seconds = time.monotonic() - started
 
     if failed_chunks:
         failed_count = len(failed_chunks)
@@ -165,101 +703,177 @@ async def _fetch_all_data(
         if failed_count > 5:
             details += f"\n  - ... and {failed_count - 5} more failed chunk(s)."
 
+        resume_hint = ""
+        if checkpoint is not None:
+            resume_hint = (
+                f"{checkpoint.completed_count} completed chunk(s) were saved to "
+                f"{checkpoint.checkpoint_dir}; re-run the same call to download "
+                "only the missing chunks. "
+            )
         raise RuntimeError(
             "Statcast download failed to retrieve all requested chunks after retries. "
-            f"{failed_count}/{len(urls)} chunk(s) failed. "
+            f"{failed_count}/{requested_count} chunk(s) failed. "
             "Data integrity policy prevented returning partial data. "
+            f"{resume_hint}"
             f"\nFailure details:\n{details}"
         )
 
-    return results
+    if checkpoint is not None:
+        checkpoint.clear()
+
+
+async def _fetch_through_cache(
+    cache: StatcastChunkCache,
+    url: str,
+    download: Callable[[], Awaitable[ChunkFetchResult]],
+    row_cap: int | None,
+) -> ChunkFetchResult:
+    """Download a chunk missing from ``cache`` while holding its entry lock.
+
+    Processes sharing the cache directory take the same lock, so only the
+    first one to miss a chunk downloads it. The others wait, find the entry
+    written when the lock is released, and read it from disk instead. The
+    lock is only waited for, never held, while a concurrency slot is taken.
+    """
+    chunk_end = _chunk_dates_from_url(url)[1]
+    waiting_since = time.monotonic()
+    async with cache.lock(url):
+        lock_wait = time.monotonic() - waiting_since
+        cached = await asyncio.to_thread(cache.get, url, chunk_end)
+        if cached is not None:
+            return ChunkFetchResult(
+                url=url,
+                dataframe=cached,
+                cached=True,
+                queue_wait_seconds=lock_wait,
+                total_seconds=time.monotonic() - waiting_since,
+            )
+        result = await download()
+        result.queue_wait_seconds += lock_wait
+        result.total_seconds += lock_wait
+        df = result.dataframe
+        if df is None:
+            return result
+        # Chunks at the row cap are re-requested in halves, not cached.
+        capped = row_cap is not None and df.height >= row_cap
+        if not capped or _split_chunk_url(url) is None:
+            await asyncio.to_thread(_store_in_cache, cache, result)
+            result.stored = True
+        return result
+
+
+def _store_in_cache(cache: StatcastChunkCache | None, result: ChunkFetchResult) -> None:
+    """Persist a successfully fetched chunk, ignoring cache write failures."""
+    if cache is None or result.dataframe is None:
+        return
+    try:
+        cache.put(result.url, result.dataframe)
+    except OSError as e:
+        print(f"Unable to write Statcast chunk to cache: {e}")
+
+
+def _split_chunk_url(url: str) -> Tuple[str, str] | None:
+    """Split a Statcast search URL into two URLs covering each half of its dates.
+
+    Returns None when the chunk covers a single day and cannot be split further.
+    """
+    start, end = _chunk_dates_from_url(url)
+    if start >= end:
+        return None
+    mid = start + (end - start) // 2
+
+    def _with_dates(chunk_start: date, chunk_end: date) -> str:
+        out = re.sub(r"game_date_gt=[^&#]*", f"game_date_gt={chunk_start}", url)
+        return re.sub(r"game_date_lt=[^&#]*", f"game_date_lt={chunk_end}", out)
+
+    return _with_dates(start, mid), _with_dates(mid + timedelta(days=1), end)
+
+
+def _chunk_dates_from_url(url: str) -> Tuple[date, date]:
+    """Return the ``(start, end)`` game dates encoded in a Statcast search URL."""
+    query = parse_qs(urlsplit(url).query)
+    start = datetime.strptime(query["game_date_gt"][0], STATCAST_DATE_FORMAT).date()
+    end = datetime.strptime(query["game_date_lt"][0], STATCAST_DATE_FORMAT).date()
+    return start, end
+
+
+def _align_to_schema(df: pl.DataFrame, schema: dict[str, pl.DataType]) -> pl.DataFrame:
+    """Conform ``df`` to ``schema`` (adds missing cols, drops extras, casts)."""
+    schema_cols = list(schema)
+
+    # Add missing columns as nulls with the expected dtype
+    missing = [c for c in schema_cols if c not in df.columns]
+    if missing:
+        df = df.with_columns([pl.lit(None).cast(schema[c]).alias(c) for c in missing])
+
+    # Drop any unexpected columns
+    extras = [c for c in df.columns if c not in schema]
+    if extras:
+        df = df.drop(extras)
+
+    # Reorder and cast to match schema
+    df = df.select(schema_cols)
+    casts = []
+    for c in schema_cols:
+        try:
+            current = df.schema.get(c)
+            expected = schema[c]
+            if current != expected:
+                casts.append(pl.col(c).cast(expected, strict=False))
+        except Exception:
+            # If schema lookup/cast fails for a column, keep it as-is.
+            continue
+    if casts:
+        df = df.with_columns(casts)
+
+    return df
 
 
 def _load_all_data(
     responses: List[pl.DataFrame], *, show_progress: bool = True
 ) -> List[pl.LazyFrame]:
-    """Convert fetched DataFrames into LazyFrames with a consistent schema.
+    """Convert fetched DataFrames into LazyFrames.
 
-    The download step returns parsed DataFrames for reliability. This function:
-    - chooses a reference schema from the first successful chunk
-    - aligns subsequent chunks to that schema (adds missing cols, drops extras, casts)
-    - returns LazyFrames to preserve the public behavior of statcast.pitch_by_pitch_data
+    Every chunk is parsed with the declared STATCAST_PITCH_BY_PITCH_SCHEMA, so
+    no per-chunk alignment is needed here; empty chunks (days without games)
+    are dropped.
     """
     data_list: List[pl.LazyFrame] = []
-    schema: dict[str, pl.DataType] | None = None
-    schema_cols: List[str] = []
-
-    def _align_df(df: pl.DataFrame) -> pl.DataFrame:
-        assert schema is not None
-        assert schema_cols
-
-        # Add missing columns as nulls with the expected dtype
-        missing = [c for c in schema_cols if c not in df.columns]
-        if missing:
-            df = df.with_columns(
-                [pl.lit(None).cast(schema[c]).alias(c) for c in missing]
-            )
+    with Progress(
+        SpinnerColumn(),
+        *Progress.get_default_columns(),
+        TimeElapsedColumn(),
+        MofNCompleteColumn(),
+        disable=not show_progress,
+    ) as progress:
+        process_task = progress.add_task("Processing data...", total=len(responses))
+        for response in responses:
+            if response.width > 0:
+                data_list.append(response.lazy())
+            progress.update(process_task, advance=1)
+    return data_list
 
-        # Drop any unexpected columns
-        extras = [c for c in df.columns if c not in schema]
-        if extras:
-            df = df.drop(extras)
 
-        # Reorder and cast to match schema
-        df = df.select(schema_cols)
-        casts = []
-        for c in schema_cols:
-            try:
-                current = df.schema.get(c)
-                expected = schema[c]
-                if current != expected:
-                    casts.append(pl.col(c).cast(expected, strict=False))
-            except Exception:
-                # If schema lookup/cast fails for a column, keep it as-is.
-                continue
-        if casts:
-            df = df.with_columns(casts)
+def _concat_chunks(data_list: List[pl.LazyFrame]) -> pl.LazyFrame:
+    """Lazily concatenate chunk frames without copying them into one buffer."""
+    if not data_list:
+        return pl.LazyFrame()
+    # diagonal concat only matters if Savant changes its columns mid-range
+    return pl.concat(data_list, how="diagonal", rechunk=False)
 
-        return df
 
-    if show_progress:
-        with Progress(
-            SpinnerColumn(),
-            *Progress.get_default_columns(),
-            TimeElapsedColumn(),
-            MofNCompleteColumn(),
-        ) as progress:
-            process_task = progress.add_task("Processing data...", total=len(responses))
-
-            for response in responses:
-                try:
-                    if schema is None:
-                        schema = dict(response.schema)
-                        schema_cols = list(response.columns)
-                        data_list.append(response.lazy())
-                        continue
+def _collect_streaming(lf: pl.LazyFrame, *, rechunk: bool = False) -> pl.DataFrame:
+    """Collect ``lf`` with Polars' streaming engine.
 
-                    aligned = _align_df(response)
-                    data_list.append(aligned.lazy())
-                except Exception as e:
-                    progress.log(f"Error processing data: {e}")
-                    continue
-                finally:
-                    progress.update(process_task, advance=1)
-    else:
-        for response in responses:
-            try:
-                if schema is None:
-                    schema = dict(response.schema)
-                    schema_cols = list(response.columns)
-                    data_list.append(response.lazy())
-                    continue
-
-                aligned = _align_df(response)
-                data_list.append(aligned.lazy())
-            except Exception:
-                continue
-    return data_list
+    The streaming engine works through its inputs in batches instead of
+    materializing every intermediate at once, so collecting hundreds of
+    chunks, or a scan over a sink directory, peaks close to the size of the
+    result. The result reuses the buffers of the parsed chunks unless
+    ``rechunk`` is set, which copies it into contiguous columns and briefly holds the
+    data twice.
+    """
+    df = lf.collect(engine="streaming")
+    return df.rechunk() if rechunk else df
 
 
 def _handle_dates(start_date_str: str, end_date_str: str) -> Tuple[date, date]:
@@ -319,3 +933,81 @@ def _create_date_ranges(
         high = min(low + timedelta(step - 1), stop)
         yield low, high
         low += timedelta(days=step)
+
+
+def _season_date_range(season: int) -> Tuple[date, date] | None:
+    """Return the Statcast ``(start, end)`` dates for ``season``.
+
+    The end is clamped to today for a season in progress, and None is returned
+    for a season that has not started yet.
+    """
+    start, end = STATCAST_YEAR_RANGES.get(
+        season, (date(season, 3, 15), date(season, 11, 15))
+    )
+    end = min(end, date.today())
+    if start > end:
+        return None
+    return start, end
+
+
+def _missing_date_runs(
+    start: date, stop: date, present: Collection[date]
+) -> Iterator[Tuple[date, date]]:
+    """
+    Yield inclusive ``(start, end)`` runs of consecutive dates in ``[start, stop]``
+    that are not in ``present``. Offseason days are not filtered here; pass each
+    run through _create_date_ranges to plan the actual request chunks.
+    """
+    run_start: date | None = None
+    day = start
+    while day <= stop:
+        if day in present:
+            if run_start is not None:
+                yield run_start, day - timedelta(days=1)
+                run_start = None
+        elif run_start is None:
+            run_start = day
+        day += timedelta(days=1)
+    if run_start is not None:
+        yield run_start, stop
+
+
+def _estimate_chunk_rows(start: date, end: date) -> int:
+    """Rough upper bound on the pitches Savant returns for ``[start, end]``.
+
+    Assumes a full regular-season slate each day, and at most four games a day
+    from October 4th on, when only the postseason is left.
+    """
+    rows = 0
+    day = start
+    while day <= end:
+        rows += _estimate_games_on(day) * STATCAST_EST_PITCHES_PER_GAME
+        day += timedelta(days=1)
+    return rows
+
+
+def _estimate_games_on(day: date) -> int:
+    """Rough upper bound on the MLB games played on ``day``."""
+    return 4 if (day.month, day.day) >= (10, 4) else 15
+
+
+def _merge_small_ranges(
+    date_ranges: List[Tuple[date, date]], row_cap: int = STATCAST_SEARCH_ROW_CAP
+) -> List[Tuple[date, date]]:
+    """
+    Merge adjacent date ranges whose combined estimated size is clearly below
+    ``row_cap`` (at most half of it), so low-volume stretches such as the
+    postseason need fewer requests. Ranges that are not contiguous (e.g. across
+    an offseason) are never merged.
+    """
+    merged: List[Tuple[date, date]] = []
+    for chunk_start, chunk_end in date_ranges:
+        if merged:
+            prev_start, prev_end = merged[-1]
+            if chunk_start == prev_end + timedelta(days=1) and _estimate_chunk_rows(
+                prev_start, chunk_end
+            ) <= (row_cap // 2):
+                merged[-1] = (prev_start, chunk_end)
+                continue
+        merged.append((chunk_start, chunk_end))
+    return merged
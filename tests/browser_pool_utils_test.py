@@ -0,0 +1,191 @@
+import asyncio
+
+import pytest
+
+import pybaseballstats.utils.browser_pool_utils as bpu
+from pybaseballstats.utils.browser_pool_utils import BrowserContextProfile, BrowserPool
+
+pytestmark = pytest.mark.unit
+
+
+class _FakePage:
+    def __init__(self, browser):
+        self._browser = browser
+        browser.open_pages += 1
+        browser.peak_pages = max(browser.peak_pages, browser.open_pages)
+
+    async def close(self):
+        self._browser.open_pages -= 1
+
+
+class _FakeContext:
+    def __init__(self, browser, options):
+        self._browser = browser
+        self.options = options
+        self.closed = False
+
+    async def new_page(self):
+        return _FakePage(self._browser)
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.open_pages = 0
+        self.peak_pages = 0
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        context = _FakeContext(self, options)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+
+class _FakePlaywright:
+    stopped = False
+
+    async def stop(self):
+        self.stopped = True
+
+
+def _pool(**kwargs):
+    browsers = []
+
+    async def _launch(args):
+        await asyncio.sleep(0.01)
+        browsers.append(_FakeBrowser())
+        return _FakePlaywright(), browsers[-1]
+
+    return BrowserPool(launch=_launch, **kwargs), browsers
+
+
+def test_pool_launches_once_and_reuses_contexts_per_profile():
+    async def _run():
+        pool, browsers = _pool(max_pages=2, idle_timeout_seconds=None)
+        mobile = BrowserContextProfile(viewport_width=390, viewport_height=844)
+
+        async def _use(profile):
+            async with pool.page(profile) as page:
+                await asyncio.sleep(0.02)
+                return page
+
+        await asyncio.gather(*(_use(BrowserContextProfile()) for _ in range(5)))
+        await _use(mobile)
+        assert pool.launches == 1 and len(browsers) == 1
+        (browser,) = browsers
+        assert browser.peak_pages == 2 and browser.open_pages == 0
+        assert [c.options["viewport"]["width"] for c in browser.contexts] == [
+            1280,
+            390,
+        ]
+
+        await pool.close()
+        assert not pool.is_running
+        assert all(c.closed for c in browser.contexts)
+        async with pool.page():
+            pass
+        assert pool.launches == 2
+        await pool.close()
+
+    asyncio.run(_run())
+
+
+def test_pool_shuts_down_when_idle_and_relaunches_a_crashed_browser():
+    async def _run():
+        pool, browsers = _pool(idle_timeout_seconds=0.05)
+        async with pool.page():
+            pass
+        async with pool.page():
+            # In use: the idle timer of the previous page must not fire.
+            await asyncio.sleep(0.1)
+            assert pool.is_running
+        await asyncio.sleep(0.1)
+        assert not pool.is_running and pool.launches == 1
+
+        async with pool.page():
+            pass
+        browsers[-1].connected = False
+        async with pool.page():
+            pass
+        assert pool.launches == 3
+        await pool.close()
+
+    asyncio.run(_run())
+
+
+def test_sandbox_is_only_disabled_for_root_in_a_container(monkeypatch, tmp_path):
+    marker = tmp_path / ".dockerenv"
+    monkeypatch.setattr(bpu, "_CONTAINER_MARKERS", (str(marker),))
+    monkeypatch.delenv("container", raising=False)
+    monkeypatch.setattr(bpu.os, "geteuid", lambda: 0, raising=False)
+    assert "--no-sandbox" not in BrowserPool().launch_args
+
+    marker.touch()
+    assert BrowserPool().launch_args[-1] == "--no-sandbox"
+    monkeypatch.setattr(bpu.os, "geteuid", lambda: 1000, raising=False)
+    assert "--no-sandbox" not in bpu.default_launch_args()
+
+
+def test_configure_browser_pool_replaces_the_shared_pool(monkeypatch):
+    monkeypatch.setattr(bpu, "_pool_settings", {})
+    monkeypatch.setattr(bpu, "_pool_settings_version", 0)
+
+    async def _run():
+        first = await bpu.get_browser_pool()
+        assert await bpu.get_browser_pool() is first
+        bpu.configure_browser_pool(launch_args=("--no-sandbox",), max_pages=2)
+        second = await bpu.get_browser_pool()
+        return first, second
+
+    first, second = asyncio.run(_run())
+    assert second is not first
+    assert second.launch_args == ("--no-sandbox",) and second.max_pages == 2
+    with pytest.raises(ValueError):
+        bpu.configure_browser_pool(headless=False)
+
+
+_PARK_FACTORS_HTML = """
+<table>
+  <thead><tr class="tr-component-row">
+    <th>Rk.</th><th>Team</th><th>Venue</th><th>Year</th><th>PA</th><th>Park Factor</th>
+  </tr></thead>
+  <tbody><tr class="default-table-row">
+    <td class="tr-data">NYY</td><td class="tr-data">Yankee Stadium</td>
+    <td class="tr-data">2021-2023</td><td class="tr-data">18,000</td>
+    <td class="tr-data">101</td>
+  </tr></tbody>
+</table>
+"""
+
+
+def test_park_factor_async_variants_render_on_the_callers_loop(monkeypatch):
+    import pybaseballstats.statcast_leaderboards as sl
+
+    rendered_on = []
+
+    async def _fake_table_html(url, wait_until="load"):
+        rendered_on.append(asyncio.get_running_loop())
+        return _PARK_FACTORS_HTML
+
+    monkeypatch.setattr(sl, "_park_factors_table_html", _fake_table_html)
+
+    async def _run():
+        df = await sl.park_factor_yearly_leaderboard_async(2023)
+        return asyncio.get_running_loop(), df
+
+    loop, df = asyncio.run(_run())
+    assert rendered_on == [loop]
+    assert df["Park Factor"].to_list() == [101]
+
+    # The sync function awaits the same coroutine on the background loop.
+    assert sl.park_factor_yearly_leaderboard(2023).equals(df)
+    assert rendered_on[1] is not loop
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+import pybaseballstats.utils.client_session_utils as csu
+
+pytestmark = pytest.mark.unit
+
+
+def test_run_sync_reuses_one_session_across_calls():
+    first = csu.run_sync(csu.get_client_session())
+    second = csu.run_sync(csu.get_client_session())
+    assert first is second
+    assert not first.closed
+
+    csu.close_client_sessions()
+    assert first.closed
+    assert csu.run_sync(csu.get_client_session()) is not first
+    csu.close_client_sessions()
+
+
+def test_run_sync_works_inside_a_running_loop():
+    async def _caller():
+        # e.g. a notebook cell: the sync API is called while a loop is running
+        return csu.run_sync(asyncio.sleep(0, result="done"))
+
+    assert asyncio.run(_caller()) == "done"
+
+
+def test_loop_session_is_closed_when_asyncio_run_finishes():
+    async def _get():
+        session = await csu.get_client_session()
+        assert await csu.get_client_session() is session
+        return session
+
+    session = asyncio.run(_get())
+    assert session.closed
+
+
+def test_configure_replaces_existing_sessions(monkeypatch):
+    monkeypatch.setattr(csu, "_config", csu.ClientSessionConfig())
+
+    async def _run():
+        before = await csu.get_client_session()
+        config = csu.configure_client_session(limit_per_host=8)
+        after = await csu.get_client_session()
+        assert config.limit_per_host == 8
+        assert after is not before and before.closed
+        assert after.connector.limit_per_host == 8
+
+    asyncio.run(_run())
@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+
+from pybaseballstats.utils.concurrency_utils import AdaptiveConcurrencyLimiter
+
+pytestmark = pytest.mark.unit
+
+
+def test_limiter_slow_starts_then_halves_once_per_window():
+    limiter = AdaptiveConcurrencyLimiter(2, max_limit=8)
+    for _ in range(10):
+        limiter.record_success(0.1)
+    assert limiter.limit == 8
+
+    generation = limiter._generation
+    limiter.record_failure(generation)
+    # A second failure from a request admitted under the old limit is ignored.
+    limiter.record_failure(generation)
+    assert limiter.limit == 4
+    assert limiter.decreases == 1
+
+    # After a backoff the limit grows by one per `limit` successes.
+    for _ in range(3):
+        limiter.record_success(0.1)
+    assert limiter.limit == 4
+    limiter.record_success(0.1)
+    assert limiter.limit == 5
+    assert limiter.summary() == "2 -> 8 -> 4 -> 5 (peak 8, 1 backoff)"
+
+
+def test_limiter_backs_off_on_throttling_after_a_slow_start_increase():
+    limiter = AdaptiveConcurrencyLimiter(4, max_limit=32)
+    # Four requests are admitted, then the first one succeeds...
+    generations = [limiter._generation for _ in range(4)]
+    limiter.record_success(0.1)
+    assert limiter.limit == 5
+
+    # ...and the other three are throttled: the limit is halved once.
+    for generation in generations[1:]:
+        limiter.record_failure(generation)
+    assert limiter.limit == 2
+    assert limiter.decreases == 1
+
+
+def test_limiter_holds_when_latency_degrades():
+    limiter = AdaptiveConcurrencyLimiter(2, max_limit=8)
+    limiter.record_success(0.1)
+    assert limiter.limit == 3
+    limiter.record_success(1.0)
+    assert limiter.limit == 3
+
+
+def test_fixed_limiter_never_changes():
+    limiter = AdaptiveConcurrencyLimiter(3, fixed=True)
+    limiter.record_success(0.1)
+    limiter.record_failure(limiter._generation)
+    assert limiter.limit == 3
+    assert limiter.summary() == "fixed at 3"
+
+
+def test_limiter_bounds_requests_in_flight():
+    limiter = AdaptiveConcurrencyLimiter(2, fixed=True)
+    active = 0
+    peak = 0
+
+    async def _request():
+        nonlocal active, peak
+        async with limiter:
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    async def _run():
+        await asyncio.gather(*(_request() for _ in range(10)))
+
+    asyncio.run(_run())
+    assert peak == 2
+
+
+def test_single_flight_shares_one_call_between_concurrent_waiters():
+    from pybaseballstats.utils.concurrency_utils import SingleFlight
+
+    calls = []
+
+    async def _fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.05)
+        return object()
+
+    async def _run():
+        flight = SingleFlight()
+        first, second, other = await asyncio.gather(
+            flight.run("a", lambda: _fetch("a")),
+            flight.run("a", lambda: _fetch("a")),
+            flight.run("b", lambda: _fetch("b")),
+        )
+        assert len(flight) == 0
+        # Finished calls are not cached.
+        again = await flight.run("a", lambda: _fetch("a"))
+        return first, second, other, again, flight
+
+    first, second, other, again, flight = asyncio.run(_run())
+    assert first is second
+    assert other is not first and again is not first
+    assert calls == ["a", "b", "a"]
+    assert (flight.started, flight.coalesced) == (3, 1)
+
+
+def test_single_flight_cancels_shared_call_only_with_its_last_waiter():
+    from pybaseballstats.utils.concurrency_utils import SingleFlight
+
+    async def _run():
+        flight = SingleFlight()
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def _fetch():
+            started.set()
+            await release.wait()
+            return "chunk"
+
+        first = asyncio.ensure_future(flight.run("a", _fetch))
+        second = asyncio.ensure_future(flight.run("a", _fetch))
+        await started.wait()
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        assert await second == "chunk"
+
+        started.clear()
+        release.clear()
+        lone = asyncio.ensure_future(flight.run("b", _fetch))
+        await started.wait()
+        shared = flight._calls["b"].task
+        lone.cancel()
+        await asyncio.gather(lone, return_exceptions=True)
+        await asyncio.sleep(0)
+        return shared
+
+    shared = asyncio.run(_run())
+    assert shared.cancelled()
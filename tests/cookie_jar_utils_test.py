@@ -0,0 +1,63 @@
+import stat
+
+import pytest
+
+from pybaseballstats.utils.cookie_jar_utils import ClearanceCookieJar
+
+pytestmark = pytest.mark.unit
+
+UA = "Mozilla/5.0 test"
+
+
+def _cookie(name, value, expires):
+    return {"name": name, "value": value, "domain": ".example.com", "expires": expires}
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_jar_round_trips_live_cookies_for_the_same_user_agent(tmp_path):
+    clock = _Clock()
+    path = tmp_path / "cf" / "clearance.json"
+    jar = ClearanceCookieJar(path, user_agent=UA, clock=clock)
+    assert jar.load() == []
+
+    cookies = [
+        _cookie("cf_clearance", "abc", clock.now + 3600),
+        _cookie("__cf_bm", "old", clock.now - 1),
+        _cookie("session", "s", -1),
+    ]
+    jar.save(cookies)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    loaded = ClearanceCookieJar(path, user_agent=UA, clock=clock).load()
+    assert [c["name"] for c in loaded] == ["cf_clearance", "session"]
+    # Bound to the user agent that solved the challenge.
+    assert ClearanceCookieJar(path, user_agent="other", clock=clock).load() == []
+
+    # An expired (or nearly expired) clearance makes the whole jar unusable.
+    clock.now += 3600 - 30
+    assert jar.load() == []
+
+    jar.invalidate()
+    assert not path.exists()
+    jar.invalidate()
+
+
+def test_load_if_changed_only_returns_another_process_clearance(tmp_path):
+    clock = _Clock()
+    path = tmp_path / "clearance.json"
+    ours = ClearanceCookieJar(path, user_agent=UA, clock=clock)
+    theirs = ClearanceCookieJar(path, user_agent=UA, clock=clock)
+
+    ours.save([_cookie("cf_clearance", "v1", clock.now + 3600)])
+    assert ours.load_if_changed() == []
+
+    theirs.save([_cookie("cf_clearance", "v2", clock.now + 3600)])
+    assert [c["value"] for c in ours.load_if_changed()] == ["v2"]
+    assert ours.load_if_changed() == []
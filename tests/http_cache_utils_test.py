@@ -0,0 +1,94 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+import pybaseballstats.utils.http_cache_utils as hc
+import pybaseballstats.utils.session_utils as su
+
+pytestmark = pytest.mark.unit
+
+
+class _Clock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now.timestamp()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _response(body: bytes, **headers: str):
+    return hc.CachedResponse("", 200, headers, body, 0, True).to_response()
+
+
+def test_default_rules_keep_past_seasons_and_expire_the_current_one(tmp_path):
+    clock = _Clock(datetime(2025, 7, 1))
+    cache = hc.HttpResponseCache(tmp_path / "http.sqlite", clock=clock)
+    past = "https://www.baseball-reference.com/teams/NYY/2023-batting.shtml"
+    current = "https://www.baseball-reference.com/teams/NYY/2025-batting.shtml"
+    career = "https://www.baseball-reference.com/players/t/troutmi01.shtml"
+    elsewhere = "https://example.com/2023.html"
+    for url in (past, current, career, elsewhere):
+        cache.store(url, _response(b"<table></table>"))
+
+    assert cache.lookup(elsewhere) is None
+    clock.now += 7 * 60 * 60
+    assert cache.lookup(past).fresh
+    assert not cache.lookup(current).fresh
+    assert not cache.lookup(career).fresh
+
+    # A page fetched mid-season is not promoted to "never expires" when the
+    # season ends; the copy fetched after it is.
+    clock.now = datetime(2026, 4, 1).timestamp()
+    assert not cache.lookup(current).fresh
+    cache.store(current, _response(b"<table>final</table>"))
+    clock.now += 365 * 24 * 60 * 60
+    cached = cache.lookup(current)
+    assert cached.fresh and cached.content == b"<table>final</table>"
+    assert cached.to_response().text == "<table>final</table>"
+
+
+def test_session_revalidates_stale_pages_with_conditional_requests(
+    monkeypatch, tmp_path
+):
+    from aiohttp import web
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    seen = []
+
+    async def _handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+        return web.Response(
+            text="<table>1</table>", content_type="text/html", headers={"ETag": '"v1"'}
+        )
+
+    async def _run(ttl):
+        app = web.Application()
+        app.router.add_get("/{page}", _handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        url = f"http://127.0.0.1:{runner.addresses[0][1]}/team"
+        hc.configure_http_cache(
+            path=tmp_path / "http.sqlite",
+            rules=[hc.HttpCacheRule(r"127\.0\.0\.1", ttl)],
+        )
+        manager = su.AsyncPBSSessionManager(su.RateLimiterRegistry({}))
+        try:
+            return [(await manager.get(url)).text for _ in range(2)]
+        finally:
+            await manager.close()
+            await runner.cleanup()
+
+    try:
+        assert asyncio.run(_run(ttl=0)) == ["<table>1</table>"] * 2
+        assert seen == [None, '"v1"']
+
+        # Fresh responses are served without a request at all (the new
+        # server's port makes it a new URL, downloaded once).
+        assert asyncio.run(_run(ttl=60)) == ["<table>1</table>"] * 2
+        assert seen == [None, '"v1"', None]
+    finally:
+        hc.configure_http_cache(enabled=False)
@@ -0,0 +1,286 @@
+import asyncio
+import threading
+import time
+from itertools import pairwise
+
+import pytest
+
+import pybaseballstats.utils.session_utils as su
+from pybaseballstats.utils.session_utils import (
+    HostRateLimit,
+    RateLimiterRegistry,
+    TokenBucket,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_allows_a_burst_then_paces_at_the_rate():
+    clock = _Clock()
+    bucket = TokenBucket(HostRateLimit(60, burst=3), clock=clock)
+    assert [bucket.reserve() for _ in range(5)] == [0, 0, 0, 1, 2]
+
+    # Idle time refills the bucket, but never beyond the burst.
+    clock.now += 10
+    assert [bucket.reserve() for _ in range(4)] == [0, 0, 0, 1]
+
+
+def test_token_bucket_enforces_min_interval_and_penalties():
+    clock = _Clock()
+    bucket = TokenBucket(
+        HostRateLimit(20, min_interval_seconds=3.0, jitter_seconds=1.0), clock=clock
+    )
+    waits = [bucket.reserve() for _ in range(4)]
+    assert waits[0] == 0
+    # Each request waits for the previous one's slot plus 3-4 seconds.
+    gaps = [b - a for a, b in pairwise(waits)]
+    assert all(3.0 <= gap <= 4.0 for gap in gaps)
+
+    clock.now += 60
+    bucket.penalize(30)
+    assert bucket.reserve() == pytest.approx(30)
+
+
+def test_registry_matches_parent_domains_and_skips_unlimited_hosts():
+    registry = RateLimiterRegistry()
+    bref = registry.bucket_for("https://www.baseball-reference.com/teams/NYY/")
+    assert bref is not None
+    assert bref is registry.bucket_for("https://baseball-reference.com/draft/")
+    assert bref.limit.requests_per_minute == 20
+    assert registry.bucket_for("https://www.fangraphs.com/api/x") is not bref
+    assert registry.bucket_for("https://example.com/") is None
+
+    registry.set_limit("example.com", HostRateLimit(30))
+    assert registry.bucket_for("https://api.example.com/") is not None
+    registry.set_limit("baseball-reference.com", None)
+    assert registry.bucket_for("https://www.baseball-reference.com/") is None
+
+
+def test_waiting_for_one_host_does_not_delay_another():
+    registry = RateLimiterRegistry(
+        {"slow.test": HostRateLimit(60, min_interval_seconds=0.5)}
+    )
+    registry.wait("https://slow.test/a")
+    waiter = threading.Thread(target=registry.wait, args=("https://slow.test/b",))
+    waiter.start()
+    time.sleep(0.05)
+
+    # The slow host's caller is asleep, holding no lock other hosts need.
+    started = time.monotonic()
+    assert registry.wait("https://fast.test/") == 0
+    assert registry.bucket_for("https://slow.test/c") is not None
+    assert time.monotonic() - started < 0.1
+    waiter.join()
+
+
+def _serve(handler):
+    from aiohttp import web
+
+    async def _start():
+        app = web.Application()
+        app.router.add_get("/{page}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        return runner, runner.addresses[0][1]
+
+    return _start()
+
+
+def test_async_manager_awaits_rate_limits_without_blocking_the_loop(
+    monkeypatch, tmp_path
+):
+    from aiohttp import web
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    async def _handler(request):
+        return web.Response(text=request.match_info["page"])
+
+    async def _run():
+        runner, port = await _serve(_handler)
+        manager = su.AsyncPBSSessionManager(
+            RateLimiterRegistry(
+                {"127.0.0.1": HostRateLimit(600, min_interval_seconds=0.3)}
+            )
+        )
+        done: dict[str, float] = {}
+
+        async def _get(url):
+            resp = await manager.get(url)
+            assert resp is not None
+            done[resp.text] = time.monotonic() - started
+
+        started = time.monotonic()
+        try:
+            await asyncio.gather(
+                *(_get(f"http://127.0.0.1:{port}/slow{i}") for i in range(3)),
+                _get(f"http://localhost:{port}/fast"),
+            )
+        finally:
+            await manager.close()
+            await runner.cleanup()
+        return done
+
+    done = asyncio.run(_run())
+    # The limited host is paced 0.3s apart; the other host does not queue.
+    assert done["slow0"] < 0.3 <= done["slow1"] < 0.6 <= done["slow2"]
+    assert done["fast"] < 0.3
+
+
+def test_async_manager_clears_a_shared_challenge_once(monkeypatch, tmp_path):
+    from aiohttp import web
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    solves = []
+
+    async def _fake_clear(url, verbose=False):
+        solves.append(url)
+        await asyncio.sleep(0.05)
+        return [
+            {
+                "name": "cf_clearance",
+                "value": "ok",
+                "domain": "127.0.0.1",
+                "expires": time.time() + 3600,
+            }
+        ]
+
+    async def _handler(request):
+        if request.cookies.get("cf_clearance") != "ok":
+            return web.Response(status=403, text="Just a moment...")
+        return web.Response(text="<table></table>")
+
+    monkeypatch.setattr(su, "_clear_cloudflare_challenge", _fake_clear)
+
+    async def _run():
+        runner, port = await _serve(_handler)
+        manager = await su.get_async_session_manager()
+        assert await su.get_async_session_manager() is manager
+        try:
+            return await asyncio.gather(
+                *(manager.get(f"http://127.0.0.1:{port}/p{i}") for i in range(4))
+            )
+        finally:
+            await runner.cleanup()
+
+    responses = asyncio.run(_run())
+    assert all(
+        resp is not None and resp.text == "<table></table>" for resp in responses
+    )
+    assert len(solves) == 1
+
+
+def test_stored_clearance_spares_the_next_session_the_browser(monkeypatch, tmp_path):
+    from aiohttp import web
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    solves = []
+    valid = {"token": "first"}
+
+    async def _fake_clear(url, verbose=False):
+        solves.append(url)
+        return [
+            {
+                "name": "cf_clearance",
+                "value": valid["token"],
+                "domain": "127.0.0.1",
+                "expires": time.time() + 3600,
+            }
+        ]
+
+    async def _handler(request):
+        if request.cookies.get("cf_clearance") != valid["token"]:
+            return web.Response(status=403, text="Just a moment...")
+        return web.Response(text="<table></table>")
+
+    monkeypatch.setattr(su, "_clear_cloudflare_challenge", _fake_clear)
+
+    async def _get_with_new_session(port):
+        manager = su.AsyncPBSSessionManager()
+        try:
+            return await manager.get(f"http://127.0.0.1:{port}/p")
+        finally:
+            await manager.close()
+
+    async def _run():
+        runner, port = await _serve(_handler)
+        try:
+            first = await _get_with_new_session(port)
+            second = await _get_with_new_session(port)
+            # Cloudflare rejects the stored clearance: the jar is replaced.
+            valid["token"] = "second"
+            third = await _get_with_new_session(port)
+            return first, second, third
+        finally:
+            await runner.cleanup()
+
+    responses = asyncio.run(_run())
+    assert all(resp is not None and resp.status_code == 200 for resp in responses)
+    assert len(solves) == 2
+    jar = su.ClearanceCookieJar(user_agent=su._CHALLENGE_USER_AGENT)
+    assert [c["value"] for c in jar.load()] == ["second"]
+
+
+def test_leaderboards_fetch_through_the_shared_session_manager(monkeypatch):
+    import pybaseballstats.statcast_leaderboards as sl
+
+    requested: list[str] = []
+
+    class _Response:
+        text = "entity_name,entity_id,infractions\nDoe,1,3\n"
+
+    class _FakeManager:
+        def __init__(self, ok: bool) -> None:
+            self.ok = ok
+
+        async def get(self, url, **kwargs):
+            requested.append(url)
+            return _Response() if self.ok else None
+
+    manager = _FakeManager(ok=True)
+
+    async def _get_manager():
+        return manager
+
+    monkeypatch.setattr(sl, "get_async_session_manager", _get_manager)
+
+    df = asyncio.run(sl.timer_infractions_leaderboard_async(2023, perspective="Pit"))
+    assert df.columns == ["player_name", "player_id", "infractions"]
+    assert "season=2023" in requested[0]
+    assert sl.timer_infractions_leaderboard(2023).equals(df)
+
+    # A failed request (e.g. an HTTP error status) raises instead of parsing.
+    manager.ok = False
+    with pytest.raises(RuntimeError, match="Failed to fetch"):
+        sl.timer_infractions_leaderboard(2023)
+
+
+def test_singleton_maps_deprecated_request_limit_onto_bref_host(monkeypatch):
+    registry = RateLimiterRegistry()
+    monkeypatch.setattr(su, "shared_rate_limits", registry)
+
+    @su.Singleton
+    class _Manager:
+        pass
+
+    first = _Manager.instance()
+    assert (
+        registry.bucket_for("https://www.baseball-reference.com").limit
+        == (su.DEFAULT_HOST_RATE_LIMITS[su.BREF_HOST])
+    )
+
+    with pytest.warns(DeprecationWarning, match="max_req_per_minute"):
+        second = _Manager.instance(max_req_per_minute=10)
+    assert second is first
+    bucket = registry.bucket_for("https://www.baseball-reference.com/teams/")
+    assert bucket.limit == HostRateLimit(10)
@@ -0,0 +1,282 @@
+import asyncio
+import os
+import time
+from datetime import date, timedelta
+
+import polars as pl
+import pytest
+
+import pybaseballstats.utils.statcast_cache_utils as scu
+import pybaseballstats.utils.statcast_utils as su
+from pybaseballstats.consts.statcast_consts import STATCAST_DATE_RANGE_URL
+
+pytestmark = pytest.mark.unit
+
+
+def _url(start: date, end: date, team: str = "") -> str:
+    return STATCAST_DATE_RANGE_URL.format(
+        player_type="pitcher", start_date=start, end_date=end, team=team
+    )
+
+
+def test_cache_roundtrip_for_completed_season(tmp_path):
+    cache = scu.StatcastChunkCache(tmp_path)
+    url = _url(date(2019, 7, 1), date(2019, 7, 3))
+    df = pl.DataFrame({"game_pk": [1, 2], "pitch_type": ["FF", "SL"]})
+
+    assert cache.get(url, date(2019, 7, 3)) is None
+    cache.put(url, df)
+
+    # Chunks written after their games settled are immutable, so even an
+    # old mtime is still a hit.
+    path = cache.path(url)
+    settled = time.mktime(date(2020, 1, 1).timetuple())
+    os.utime(path, (settled, settled))
+    cached = cache.get(url, date(2019, 7, 3))
+    assert cached is not None
+    assert cached.equals(df)
+
+
+def test_cache_expires_recent_chunks(tmp_path):
+    cache = scu.StatcastChunkCache(tmp_path, recent_days=3, recent_ttl_seconds=60)
+    today = date.today()
+    url = _url(today - timedelta(days=1), today)
+    cache.put(url, pl.DataFrame({"game_pk": [1]}))
+    assert cache.get(url, today) is not None
+
+    stale = time.time() - 120
+    os.utime(cache.path(url), (stale, stale))
+    assert cache.get(url, today) is None
+
+
+def test_cache_expires_chunks_written_while_recent_after_they_age(tmp_path):
+    cache = scu.StatcastChunkCache(tmp_path, recent_days=3, recent_ttl_seconds=60)
+    url = _url(date(2023, 7, 1), date(2023, 7, 3))
+    cache.put(url, pl.DataFrame({"game_pk": [1]}))
+
+    # Written the day after the chunk ended: the games may not have settled,
+    # so the entry still expires although July 2023 is long past.
+    written = time.mktime(date(2023, 7, 4).timetuple())
+    os.utime(cache.path(url), (written, written))
+    assert cache.get(url, date(2023, 7, 3)) is None
+
+    settled = time.mktime(date(2023, 7, 6).timetuple())
+    os.utime(cache.path(url), (settled, settled))
+    assert cache.get(url, date(2023, 7, 3)) is not None
+
+
+def test_cache_key_depends_on_team_and_schema_version(tmp_path, monkeypatch):
+    cache = scu.StatcastChunkCache(tmp_path)
+    start, end = date(2019, 7, 1), date(2019, 7, 3)
+    assert cache.key(_url(start, end)) != cache.key(_url(start, end, "NYY"))
+
+    key_v1 = cache.key(_url(start, end))
+    monkeypatch.setattr(scu, "STATCAST_CACHE_SCHEMA_VERSION", 999)
+    assert cache.key(_url(start, end)) != key_v1
+
+
+def test_fetch_all_data_serves_cached_chunks_without_network(tmp_path, monkeypatch):
+    cache = scu.StatcastChunkCache(tmp_path)
+    urls = [
+        _url(date(2019, 7, 1), date(2019, 7, 3)),
+        _url(date(2019, 7, 4), date(2019, 7, 6)),
+    ]
+    for i, url in enumerate(urls):
+        cache.put(url, pl.DataFrame({"game_pk": [i]}))
+
+    async def _fail(*args, **kwargs):
+        raise AssertionError("network should not be used for cached chunks")
+
+    monkeypatch.setattr(su, "_fetch_and_parse_chunk", _fail)
+    results = asyncio.run(su._fetch_all_data(urls, show_progress=False, cache=cache))
+    assert sorted(df.item() for df in results) == [0, 1]
+
+
+def test_cache_lock_waits_for_the_current_holder(tmp_path):
+    url = _url(date(2019, 7, 1), date(2019, 7, 3))
+    first = scu.StatcastChunkCache(tmp_path)
+    second = scu.StatcastChunkCache(tmp_path, lock_timeout_seconds=0.2)
+    events: list[str] = []
+
+    async def _hold():
+        async with first.lock(url) as acquired:
+            events.append(f"first {acquired}")
+            await asyncio.sleep(0.15)
+            events.append("first released")
+
+    async def _wait():
+        await asyncio.sleep(0.01)
+        async with second.lock(url) as acquired:
+            events.append(f"second {acquired}")
+
+    async def _run():
+        await asyncio.gather(_hold(), _wait())
+        # A holder that never releases makes waiters give up at the timeout.
+        async with first.lock(url), second.lock(url) as acquired:
+            events.append(f"timed out {not acquired}")
+
+    asyncio.run(_run())
+    assert events == [
+        "first True",
+        "first released",
+        "second True",
+        "timed out True",
+    ]
+
+
+def test_pulls_sharing_a_cache_download_each_chunk_once(tmp_path, monkeypatch):
+    urls = [_url(date(2019, 7, d), date(2019, 7, d)) for d in range(1, 6)]
+    requested: list[str] = []
+
+    async def _fake_fetch(session, url, limiter, max_retries=3, **kwargs):
+        requested.append(url)
+        await asyncio.sleep(0.05)
+        day = su._chunk_dates_from_url(url)[0].day
+        return su.ChunkFetchResult(url=url, dataframe=pl.DataFrame({"day": [day]}))
+
+    monkeypatch.setattr(su, "_fetch_and_parse_chunk", _fake_fetch)
+
+    async def _run():
+        # Separate cache instances and no in-process coalescing, as in
+        # separate worker processes sharing one cache directory.
+        return await asyncio.gather(
+            *(
+                su._fetch_all_data(
+                    urls,
+                    show_progress=False,
+                    cache=scu.StatcastChunkCache(tmp_path),
+                    coalesce=False,
+                )
+                for _ in range(3)
+            )
+        )
+
+    for results in asyncio.run(_run()):
+        assert sorted(df.item() for df in results) == [1, 2, 3, 4, 5]
+    assert sorted(requested) == sorted(urls)
+
+
+def test_cold_cache_pull_reports_chunks_as_downloaded(tmp_path):
+    from aiohttp import web
+
+    async def _handler(request):
+        await asyncio.sleep(0.01)
+        day = request.query["game_date_gt"]
+        return web.Response(body=f"game_date,inning\n{day},3\n".encode())
+
+    async def _pull(origin: str, report: su.StatcastFetchReport):
+        urls = [
+            _url(date(2023, 7, d), date(2023, 7, d)).replace(
+                "https://baseballsavant.mlb.com", origin
+            )
+            for d in range(1, 6)
+        ]
+        return await su._fetch_all_data(
+            urls,
+            show_progress=False,
+            cache=scu.StatcastChunkCache(tmp_path),
+            report=report,
+        )
+
+    async def _run(cold, warm):
+        app = web.Application()
+        app.router.add_get("/statcast_search/csv", _handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        origin = f"http://127.0.0.1:{runner.addresses[0][1]}"
+        try:
+            await _pull(origin, cold)
+            await _pull(origin, warm)
+        finally:
+            await runner.cleanup()
+
+    cold, warm = su.StatcastFetchReport(), su.StatcastFetchReport()
+    asyncio.run(_run(cold, warm))
+
+    # Writing a download to the cache does not make it a cache hit.
+    assert len(cold.downloaded) == 5
+    assert cold.p50_latency_seconds > 0 and cold.p95_latency_seconds > 0
+    assert "(0 cached" in cold.summary()
+    assert len(warm.chunks) == 5 and warm.downloaded == []
+
+
+def test_cache_and_checkpoint_clear_remove_lock_files(tmp_path):
+    url = _url(date(2019, 7, 1), date(2019, 7, 3))
+    cache = scu.StatcastChunkCache(tmp_path / "cache")
+    cache.put(url, pl.DataFrame({"game_pk": [1]}))
+
+    async def _lock():
+        async with cache.lock(url) as acquired:
+            assert acquired
+
+    asyncio.run(_lock())
+    assert cache.path(url).with_suffix(".lock").exists()
+    cache.clear()
+    assert not [p for p in cache.cache_dir.rglob("*") if p.is_file()]
+
+    checkpoint = scu.StatcastCheckpoint([url], tmp_path / "checkpoints")
+    checkpoint.record(url, pl.DataFrame({"game_pk": [1]}))
+    checkpoint.clear()
+    assert not checkpoint.checkpoint_dir.exists()
+
+
+def test_checkpoint_resumes_only_failed_chunks(tmp_path, monkeypatch):
+    urls = [_url(date(2019, 7, d), date(2019, 7, d)) for d in (1, 2, 3)]
+    failing = {urls[1]}
+    requested: list[str] = []
+
+    async def _fake_fetch(session, url, limiter, max_retries=3, **kwargs):
+        requested.append(url)
+        if url in failing:
+            return su.ChunkFetchResult(url=url, dataframe=None, error="HTTP 503")
+        day = su._chunk_dates_from_url(url)[0].day
+        return su.ChunkFetchResult(url=url, dataframe=pl.DataFrame({"day": [day]}))
+
+    monkeypatch.setattr(su, "_fetch_and_parse_chunk", _fake_fetch)
+
+    checkpoint = scu.StatcastCheckpoint(urls, tmp_path)
+    with pytest.raises(RuntimeError, match="re-run the same call"):
+        asyncio.run(
+            su._fetch_all_data(urls, show_progress=False, checkpoint=checkpoint)
+        )
+    assert checkpoint.completed_count == 2
+
+    failing.clear()
+    requested.clear()
+    resumed = scu.StatcastCheckpoint(urls, tmp_path)
+    assert resumed.checkpoint_dir == checkpoint.checkpoint_dir
+    results = asyncio.run(
+        su._fetch_all_data(urls, show_progress=False, checkpoint=resumed)
+    )
+    assert requested == [urls[1]]
+    assert sorted(df.item() for df in results) == [1, 2, 3]
+    assert not resumed.checkpoint_dir.exists()
+
+
+def test_checkpoint_remembers_split_chunks_and_expires(tmp_path):
+    urls = [_url(date(2019, 7, 1), date(2019, 7, 4))]
+    checkpoint = scu.StatcastCheckpoint(urls, tmp_path)
+    checkpoint.record_split(urls[0])
+    checkpoint.record(urls[0], pl.DataFrame({"day": [1]}))
+
+    reopened = scu.StatcastCheckpoint(urls, tmp_path)
+    assert reopened.is_split(urls[0])
+    assert reopened.get(urls[0]) is not None
+    assert scu.StatcastCheckpoint(urls + ["other"], tmp_path).completed_count == 0
+
+    stale = time.time() - 2 * 24 * 60 * 60
+    os.utime(checkpoint.checkpoint_dir / "manifest.json", (stale, stale))
+    assert scu.StatcastCheckpoint(urls, tmp_path).completed_count == 0
+    assert not checkpoint.checkpoint_dir.exists()
+
+
+def test_cache_and_checkpoint_keys_depend_on_columns(tmp_path):
+    url = _url(date(2019, 7, 1), date(2019, 7, 3))
+    full = scu.StatcastChunkCache(tmp_path)
+    projected = scu.StatcastChunkCache(tmp_path, columns=["pitch_type"])
+    assert full.key(url) != projected.key(url)
+    assert (
+        scu.StatcastCheckpoint([url], tmp_path).key
+        != scu.StatcastCheckpoint([url], tmp_path, columns=["pitch_type"]).key
+    )
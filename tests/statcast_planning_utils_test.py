@@ -0,0 +1,134 @@
+from datetime import date, timedelta
+
+import polars as pl
+import pytest
+
+import pybaseballstats.utils.statcast_planning_utils as sp
+import pybaseballstats.utils.statcast_utils as su
+from pybaseballstats.consts.statcast_consts import (
+    STATCAST_EST_PITCHES_PER_GAME,
+    StatcastTeams,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _days(start: date, end: date):
+    day = start
+    while day <= end:
+        yield day
+        day += timedelta(days=1)
+
+
+def test_fixed_days_planner_matches_date_range_chunking():
+    start, end = date(2023, 7, 1), date(2023, 7, 12)
+    chunks = sp.FixedDaysPlanner(5).plan(start, end, StatcastTeams.DODGERS)
+    assert [(c.start, c.end) for c in chunks] == su._merge_small_ranges(
+        list(su._create_date_ranges(start, end, step=5))
+    )
+    assert {c.team for c in chunks} == {StatcastTeams.DODGERS}
+    with pytest.raises(ValueError):
+        sp.FixedDaysPlanner(0)
+
+
+def test_per_team_planner_partitions_by_pitching_team():
+    start, end = date(2023, 6, 1), date(2023, 8, 29)
+    chunks = sp.PerTeamPlanner(45).plan(start, end)
+    assert len(chunks) == 2 * len(StatcastTeams)
+    assert {c.team for c in chunks} == set(StatcastTeams)
+    assert {(c.start, c.end) for c in chunks} == {
+        (date(2023, 6, 1), date(2023, 7, 15)),
+        (date(2023, 7, 16), date(2023, 8, 29)),
+    }
+
+    only_yankees = sp.PerTeamPlanner(45).plan(start, end, StatcastTeams.YANKEES)
+    assert {c.team for c in only_yankees} == {StatcastTeams.YANKEES}
+    assert len(only_yankees) == 2
+
+    # By default a team's whole Statcast year takes two requests.
+    season = sp.PerTeamPlanner().plan(
+        date(2023, 1, 1), date(2023, 12, 31), StatcastTeams.YANKEES
+    )
+    assert len(season) == 2
+
+
+def test_balanced_planner_packs_dates_to_the_row_budget():
+    games = {day: 15 for day in _days(date(2023, 9, 20), date(2023, 10, 1))}
+    games.update({day: 2 for day in _days(date(2023, 10, 3), date(2023, 11, 1))})
+    planner = sp.BalancedPlanner(target_rows=20000, games_per_date=games)
+    chunks = planner.plan(date(2023, 9, 20), date(2024, 3, 31))
+
+    def _rows(chunk):
+        return sum(
+            games.get(day, 0) * STATCAST_EST_PITCHES_PER_GAME
+            for day in _days(chunk.start, chunk.end)
+        )
+
+    # Contiguous within the season, nothing planned in the offseason.
+    assert chunks[0].start == date(2023, 9, 20)
+    assert all(
+        c.end < date(2023, 11, 2) or c.start >= date(2024, 3, 15) for c in chunks
+    )
+    assert all(_rows(c) <= 20000 for c in chunks)
+    # 15-game days fit four to a request; the postseason needs only one more
+    # chunk for the 2023 season.
+    in_season = [c for c in chunks if c.end <= date(2023, 10, 1)]
+    assert all((c.end - c.start).days + 1 <= 4 for c in in_season)
+    postseason = [
+        c for c in chunks if date(2023, 10, 2) <= c.start <= date(2023, 11, 1)
+    ]
+    assert len(postseason) == 1
+    assert len(chunks) < len(
+        sp.FixedDaysPlanner(3).plan(date(2023, 9, 20), date(2024, 3, 31))
+    )
+
+
+def test_balanced_planner_estimates_games_without_a_schedule(monkeypatch):
+    monkeypatch.setattr(sp, "_fetch_games_per_date", lambda start, end: None)
+    chunks = sp.BalancedPlanner(target_rows=20000).plan(
+        date(2023, 7, 1), date(2023, 7, 10)
+    )
+    # 15 estimated games a day -> 4500 rows -> four days per request.
+    assert [(c.start, c.end) for c in chunks] == [
+        (date(2023, 7, 1), date(2023, 7, 4)),
+        (date(2023, 7, 5), date(2023, 7, 8)),
+        (date(2023, 7, 9), date(2023, 7, 10)),
+    ]
+
+
+def test_pitch_by_pitch_data_requests_one_url_per_planned_chunk(monkeypatch):
+    import pybaseballstats.statcast as sc
+
+    captured: list[str] = []
+
+    async def _fake_fetch_all_data(urls, **kwargs):
+        captured.extend(urls)
+        return [pl.DataFrame({"pitcher": [1]})]
+
+    monkeypatch.setattr(sc, "_fetch_all_data", _fake_fetch_all_data)
+    sc.pitch_by_pitch_data(
+        "2023-07-01",
+        "2023-07-20",
+        planner=sc.PerTeamPlanner(30),
+        show_progress=False,
+        resume=False,
+    )
+    teams = {su.parse_qs(su.urlsplit(url).query)["team"][0] for url in captured}
+    assert teams == {team.value for team in StatcastTeams}
+
+    with pytest.raises(ValueError):
+        sc.pitch_by_pitch_data("2023-07-01", "2023-07-20", planner="balanced")
+
+
+def test_aligned_fixed_days_planner_shares_chunks_between_overlapping_ranges():
+    planner = sp.FixedDaysPlanner(5, align=True)
+    week = planner.plan(date(2023, 7, 8), date(2023, 7, 14))
+    fortnight = planner.plan(date(2023, 7, 1), date(2023, 7, 14))
+    # The 2023 season started on March 15th, so the grid falls on 7/3, 7/8, ...
+    assert [(c.start, c.end) for c in fortnight] == [
+        (date(2023, 7, 1), date(2023, 7, 2)),
+        (date(2023, 7, 3), date(2023, 7, 7)),
+        (date(2023, 7, 8), date(2023, 7, 12)),
+        (date(2023, 7, 13), date(2023, 7, 14)),
+    ]
+    assert week == fortnight[2:]
@@ -0,0 +1,215 @@
+from datetime import date, timedelta
+
+import polars as pl
+import pytest
+
+import pybaseballstats.statcast as sc
+from pybaseballstats.utils.statcast_storage_utils import (
+    StatcastParquetSink,
+    StatcastParquetStore,
+)
+from pybaseballstats.utils.statcast_utils import (
+    _chunk_dates_from_url,
+    _missing_date_runs,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_sink_partitions_chunks_by_year_and_month(tmp_path):
+    sink = StatcastParquetSink(tmp_path)
+    sink.write(
+        "chunk-a",
+        pl.DataFrame(
+            {
+                "game_date": ["2023-06-30", "2023-07-01"],
+                "game_pk": [1, 2],
+                "release_speed": [95.1, 88.4],
+            }
+        ),
+    )
+    # Later chunks are conformed to the first chunk's schema.
+    sink.write(
+        "chunk-b",
+        pl.DataFrame({"game_date": ["2023-07-02"], "game_pk": ["3"]}),
+    )
+    sink.write("chunk-empty", pl.DataFrame())
+
+    assert (tmp_path / "year=2023" / "month=06").is_dir()
+    assert (tmp_path / "year=2023" / "month=07").is_dir()
+    assert len(sink.files) == 3
+
+    df = sink.scan().sort("game_pk").collect()
+    assert df["game_pk"].to_list() == [1, 2, 3]
+    assert df["month"].to_list() == [6, 7, 7]
+    assert df["year"].unique().to_list() == [2023]
+    assert df["release_speed"][2] is None
+
+
+def test_sink_rewrites_same_chunk_instead_of_duplicating(tmp_path):
+    df = pl.DataFrame({"game_date": ["2023-07-01"], "game_pk": [1]})
+    StatcastParquetSink(tmp_path).write("chunk-a", df)
+    StatcastParquetSink(tmp_path).write("chunk-a", df)
+    assert len(list(tmp_path.rglob("*.parquet"))) == 1
+
+
+def test_empty_sink_scans_to_empty_frame(tmp_path):
+    assert StatcastParquetSink(tmp_path).scan().collect().is_empty()
+
+
+def _pitches(game_date: str, game_pk: int, n: int) -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "game_date": [game_date] * n,
+            "game_pk": [game_pk] * n,
+            "at_bat_number": [1] * n,
+            "pitch_number": list(range(1, n + 1)),
+        }
+    )
+
+
+def test_store_drops_rows_already_present(tmp_path):
+    store = StatcastParquetStore(tmp_path)
+    store.write("chunk-a", _pitches("2023-07-01", 1, 3))
+
+    reopened = StatcastParquetStore(tmp_path)
+    assert reopened.present_dates() == {date(2023, 7, 1)}
+    reopened.write("chunk-a", _pitches("2023-07-01", 1, 5))
+    reopened.write("chunk-b", _pitches("2023-07-01", 1, 5))
+
+    df = reopened.scan_all().collect()
+    assert df.height == 5
+    assert df["pitch_number"].sort().to_list() == [1, 2, 3, 4, 5]
+
+
+def test_store_replaces_rows_of_recent_games_with_corrected_ones(tmp_path):
+    StatcastParquetStore(tmp_path).write(
+        "chunk-a",
+        pl.concat([_pitches("2023-07-01", 1, 3), _pitches("2023-07-08", 2, 3)]),
+    )
+
+    corrected = pl.concat(
+        [_pitches("2023-07-01", 1, 3), _pitches("2023-07-08", 2, 2)]
+    ).with_columns(pl.lit(2).alias("at_bat_number"))
+    store = StatcastParquetStore(tmp_path, replace_from=date(2023, 7, 7))
+    store.write("chunk-a", corrected)
+
+    df = store.scan_all().collect().sort("game_pk", "pitch_number")
+    # Settled games only gain new pitches; recent ones are replaced outright.
+    old = df.filter(pl.col("game_pk") == 1)
+    assert old.height == 6 and sorted(set(old["at_bat_number"])) == [1, 2]
+    recent = df.filter(pl.col("game_pk") == 2)
+    assert recent["at_bat_number"].to_list() == [2, 2]
+    assert recent["pitch_number"].to_list() == [1, 2]
+
+
+def test_missing_date_runs():
+    present = {date(2023, 7, 2), date(2023, 7, 3), date(2023, 7, 6)}
+    runs = list(_missing_date_runs(date(2023, 7, 1), date(2023, 7, 8), present))
+    assert runs == [
+        (date(2023, 7, 1), date(2023, 7, 1)),
+        (date(2023, 7, 4), date(2023, 7, 5)),
+        (date(2023, 7, 7), date(2023, 7, 8)),
+    ]
+
+
+def test_sync_pitch_by_pitch_fetches_only_gaps(tmp_path, monkeypatch):
+    requested: list[tuple[date, date]] = []
+
+    async def _fake_fetch_all_data(urls, *args, on_chunk=None, **kwargs):
+        for url in urls:
+            chunk_start, chunk_end = _chunk_dates_from_url(url)
+            requested.append((chunk_start, chunk_end))
+            day = chunk_start
+            while day <= chunk_end:
+                on_chunk(url, _pitches(day.isoformat(), day.toordinal(), 2))
+                day += timedelta(days=1)
+        return []
+
+    monkeypatch.setattr(sc, "_fetch_all_data", _fake_fetch_all_data)
+
+    first = sc.sync_pitch_by_pitch(
+        tmp_path, "2023-07-01", "2023-07-03", show_progress=False
+    ).collect()
+    assert first.height == 6
+    assert requested == [(date(2023, 7, 1), date(2023, 7, 3))]
+
+    requested.clear()
+    second = sc.sync_pitch_by_pitch(
+        tmp_path, "2023-06-30", "2023-07-05", show_progress=False
+    ).collect()
+    assert requested == [
+        (date(2023, 6, 30), date(2023, 6, 30)),
+        (date(2023, 7, 4), date(2023, 7, 5)),
+    ]
+    assert second.height == 12
+
+    requested.clear()
+    again = sc.sync_pitch_by_pitch(
+        tmp_path, "2023-07-01", "2023-07-03", show_progress=False
+    ).collect()
+    assert requested == []
+    assert again.height == 6
+
+
+def test_sync_skips_synced_off_days_and_refreshes_recent_dates(tmp_path, monkeypatch):
+    class _Today(date):
+        @classmethod
+        def today(cls):
+            return cls(2023, 7, 10)
+
+    requested: list[tuple[date, date]] = []
+    pitches_per_game = {"n": 2}
+
+    async def _fake_fetch_all_data(urls, *args, on_chunk=None, **kwargs):
+        for url in urls:
+            chunk_start, chunk_end = _chunk_dates_from_url(url)
+            requested.append((chunk_start, chunk_end))
+            day = chunk_start
+            while day <= chunk_end:
+                # July 3rd is an off-day: Savant returns no rows for it.
+                if day != date(2023, 7, 3):
+                    n = pitches_per_game["n"]
+                    on_chunk(url, _pitches(day.isoformat(), day.toordinal(), n))
+                day += timedelta(days=1)
+        return []
+
+    monkeypatch.setattr(sc, "date", _Today)
+    monkeypatch.setattr(sc, "_fetch_all_data", _fake_fetch_all_data)
+
+    first = sc.sync_pitch_by_pitch(
+        tmp_path, "2023-07-01", "2023-07-09", show_progress=False
+    ).collect()
+    assert requested == [
+        (date(2023, 7, 1), date(2023, 7, 5)),
+        (date(2023, 7, 6), date(2023, 7, 9)),
+    ]
+    assert first.height == 16
+
+    # The off-day is not requested again, but the last 3 days are, and the
+    # pitches published since the first sync are added.
+    requested.clear()
+    pitches_per_game["n"] = 3
+    again = sc.sync_pitch_by_pitch(
+        tmp_path, "2023-07-01", "2023-07-09", show_progress=False
+    ).collect()
+    assert requested == [(date(2023, 7, 7), date(2023, 7, 9))]
+    assert again.height == 19
+    assert StatcastParquetStore(tmp_path).synced_dates() == {
+        date(2023, 7, d) for d in range(1, 10)
+    }
+
+
+def test_store_without_manifest_treats_stored_dates_as_synced(tmp_path):
+    store = StatcastParquetStore(tmp_path)
+    store.write("chunk-a", _pitches("2023-07-01", 1, 3))
+    assert store.synced_dates() == {date(2023, 7, 1)}
+
+    # The stored dates are carried over to the scope of the first sync.
+    store.record_synced(date(2023, 7, 3), date(2023, 7, 4), "NYY")
+    assert store.synced_dates() == set()
+    assert store.synced_dates("NYY") == {
+        date(2023, 7, 1),
+        date(2023, 7, 3),
+        date(2023, 7, 4),
+    }
@@ -92,3 +92,44 @@ def test_pitch_by_pitch_data_invalid_team():
             end_date="2023-07-03",
             team=sc.StatcastTeams.METZ,
         )
+
+
+def test_pitch_by_pitch_data_filter_pushdown():
+    """Filters are applied by Savant and columns are projected at parse time."""
+    df = sc.pitch_by_pitch_data(
+        start_date="2023-07-01",
+        end_date="2023-07-10",
+        pitchers=[543037],
+        pitch_types=[sc.StatcastPitchTypes.FOUR_SEAM_FASTBALL],
+        game_types=[sc.StatcastGameTypes.REGULAR_SEASON],
+        columns=["game_date", "pitcher", "pitch_type", "release_speed"],
+        force_collect=True,
+    )
+    assert isinstance(df, pl.DataFrame)
+    assert df.columns == ["game_date", "pitcher", "pitch_type", "release_speed"]
+    assert df.height > 0
+    assert df.select(pl.col("pitcher").unique()).to_series().to_list() == [543037]
+    assert df.select(pl.col("pitch_type").cast(pl.String).unique()).item() == "FF"
+
+
+def test_pitch_by_pitch_data_filter_validation():
+    with pytest.raises(ValueError):
+        sc.pitch_by_pitch_data("2023-07-01", "2023-07-02", pitch_types=["FF"])
+    with pytest.raises(ValueError):
+        sc.pitch_by_pitch_data("2023-07-01", "2023-07-02", pitchers=["543037"])
+    with pytest.raises(ValueError):
+        sc.pitch_by_pitch_data("2023-07-01", "2023-07-02", columns="pitch_type")
+
+
+def test_player_pitch_by_pitch_single_pitcher_season():
+    df = sc.player_pitch_by_pitch(
+        543037,
+        "pitcher",
+        [2023],
+        force_collect=True,
+        columns=["game_date", "pitcher", "game_type"],
+    )
+    assert isinstance(df, pl.DataFrame)
+    assert df.height > 3000
+    assert df.select(pl.col("pitcher").unique()).to_series().to_list() == [543037]
+    assert df.select(pl.col("game_date").min()).item().startswith("2023-")
@@ -0,0 +1,689 @@
+import asyncio
+from datetime import date
+
+import polars as pl
+import pytest
+
+import pybaseballstats.utils.statcast_utils as su
+from pybaseballstats.consts.statcast_consts import (
+    STATCAST_DATE_RANGE_URL,
+    STATCAST_PITCH_BY_PITCH_SCHEMA,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _url(start: date, end: date, team: str = "") -> str:
+    return STATCAST_DATE_RANGE_URL.format(
+        player_type="pitcher", start_date=start, end_date=end, team=team
+    )
+
+
+def _csv(rows: list[dict[str, str]]) -> bytes:
+    header = list(rows[0])
+    lines = [",".join(header)]
+    lines.extend(",".join(row[c] for c in header) for row in rows)
+    return ("\n".join(lines) + "\n").encode()
+
+
+def test_chunk_dates_from_url():
+    url = _url(date(2023, 7, 1), date(2023, 7, 3), "LAD")
+    assert su._chunk_dates_from_url(url) == (date(2023, 7, 1), date(2023, 7, 3))
+
+
+def test_parse_statcast_csv_uses_declared_schema():
+    row = {
+        "pitch_type": "FF",
+        "game_date": "2023-07-01",
+        "release_speed": "95.3",
+        "events": "",
+        "description": "called_strike",
+        "stand": "R",
+        "balls": "1",
+        "strikes": "2",
+        "inning": "7",
+        "game_pk": "717465",
+        "bb_type": "null",
+        "some_new_savant_column": "7",
+    }
+    df = su._parse_statcast_csv(_csv([row, {**row, "pitch_type": "ST"}]))
+
+    for column, dtype in df.schema.items():
+        if column in STATCAST_PITCH_BY_PITCH_SCHEMA:
+            assert dtype == STATCAST_PITCH_BY_PITCH_SCHEMA[column], column
+    assert df.schema["some_new_savant_column"] == pl.String
+    assert df["game_date"].to_list() == ["2023-07-01", "2023-07-01"]
+    assert df["events"].null_count() == 2
+    assert df["bb_type"].null_count() == 2
+
+
+def test_parse_statcast_csv_nulls_unparseable_values():
+    row = {"game_date": "2023-07-01", "balls": "not-a-number", "plate_x": "0.5"}
+    df = su._parse_statcast_csv(_csv([row]))
+    assert df["balls"].to_list() == [None]
+    assert df["plate_x"].dtype == pl.Float32
+
+
+def test_categorical_columns_concatenate_across_separately_parsed_chunks():
+    first = su._parse_statcast_csv(
+        _csv([{"game_date": "2023-07-01", "pitch_type": "FF", "stand": "L"}])
+    )
+    second = su._parse_statcast_csv(
+        _csv([{"game_date": "2023-07-02", "pitch_type": "SL", "stand": "R"}])
+    )
+    df = su._collect_streaming(su._concat_chunks([first.lazy(), second.lazy()]))
+    assert df.schema["pitch_type"] == pl.Categorical()
+    assert df["pitch_type"].to_list() == ["FF", "SL"]
+    assert df["stand"].to_list() == ["L", "R"]
+
+
+def test_load_all_data_drops_empty_chunks():
+    chunk = su._parse_statcast_csv(_csv([{"game_date": "2023-07-01", "inning": "1"}]))
+    lazies = su._load_all_data([pl.DataFrame(), chunk], show_progress=False)
+    assert len(lazies) == 1
+    assert lazies[0].collect().schema["inning"] == pl.Int8
+
+
+def test_collect_streaming_keeps_chunk_order_without_copying_by_default():
+    chunks = [pl.DataFrame({"pitch": range(i * 10, (i + 1) * 10)}) for i in range(5)]
+    chunks.append(pl.DataFrame({"pitch": [50], "pitch_type": ["FF"]}))
+    lf = su._concat_chunks([c.lazy() for c in chunks])
+
+    df = su._collect_streaming(lf)
+    assert df["pitch"].to_list() == list(range(51))
+    assert df["pitch_type"].null_count() == 50
+    assert df.n_chunks() == len(chunks)
+    assert su._collect_streaming(lf, rechunk=True).n_chunks() == 1
+    assert su._collect_streaming(su._concat_chunks([])).is_empty()
+
+
+def test_split_chunk_url_halves_dates_and_keeps_filters():
+    url = _url(date(2023, 7, 1), date(2023, 7, 5), "LAD")
+    first, second = su._split_chunk_url(url)
+    assert su._chunk_dates_from_url(first) == (date(2023, 7, 1), date(2023, 7, 3))
+    assert su._chunk_dates_from_url(second) == (date(2023, 7, 4), date(2023, 7, 5))
+    assert "team=LAD" in first and "team=LAD" in second
+    assert su._split_chunk_url(_url(date(2023, 7, 1), date(2023, 7, 1))) is None
+
+
+def test_merge_small_ranges_only_merges_low_volume_contiguous_ranges():
+    in_season = [
+        (date(2023, 7, 1), date(2023, 7, 5)),
+        (date(2023, 7, 6), date(2023, 7, 10)),
+    ]
+    assert su._merge_small_ranges(in_season) == in_season
+
+    postseason = [
+        (date(2023, 10, 10), date(2023, 10, 14)),
+        (date(2023, 10, 15), date(2023, 10, 19)),
+        (date(2023, 10, 20), date(2023, 10, 24)),
+    ]
+    assert su._merge_small_ranges(postseason) == [
+        (date(2023, 10, 10), date(2023, 10, 19)),
+        (date(2023, 10, 20), date(2023, 10, 24)),
+    ]
+
+    across_offseason = [
+        (date(2023, 10, 30), date(2023, 11, 1)),
+        (date(2024, 3, 20), date(2024, 3, 20)),
+    ]
+    assert su._merge_small_ranges(across_offseason) == across_offseason
+
+
+def test_fetch_all_data_bisects_chunks_at_row_cap(monkeypatch):
+    rows_per_day = 4
+    requested: list[tuple[date, date]] = []
+
+    async def _fake_fetch(session, url, limiter, max_retries=3, **kwargs):
+        start, end = su._chunk_dates_from_url(url)
+        requested.append((start, end))
+        days = (end - start).days + 1
+        return su.ChunkFetchResult(
+            url=url, dataframe=pl.DataFrame({"day": range(days * rows_per_day)})
+        )
+
+    monkeypatch.setattr(su, "_fetch_and_parse_chunk", _fake_fetch)
+    url = _url(date(2023, 7, 1), date(2023, 7, 8))
+    results = asyncio.run(su._fetch_all_data([url], show_progress=False, row_cap=10))
+
+    # 8 days -> 4 -> 2 days (8 rows) which is under the cap of 10.
+    assert sum(df.height for df in results) == 8 * rows_per_day
+    assert all(df.height < 10 for df in results)
+    assert len(results) == 4
+    assert requested[0] == (date(2023, 7, 1), date(2023, 7, 8))
+    assert len(requested) == 1 + 2 + 4
+
+
+@pytest.mark.parametrize("parse_workers", [0, 2])
+def test_fetch_all_data_parses_downloads_with_and_without_parse_pool(parse_workers):
+    from aiohttp import web
+
+    calls = {"n": 0}
+
+    async def _handler(request):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return web.Response(status=503)
+        day = request.query["game_date_gt"]
+        return web.Response(body=_csv([{"game_date": day, "inning": "3"}]))
+
+    async def _run():
+        app = web.Application()
+        app.router.add_get("/statcast_search/csv", _handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        origin = f"http://127.0.0.1:{runner.addresses[0][1]}"
+        urls = [
+            _url(date(2023, 7, d), date(2023, 7, d)).replace(
+                "https://baseballsavant.mlb.com", origin
+            )
+            for d in range(1, 6)
+        ]
+        try:
+            return await su._fetch_all_data(
+                urls,
+                concurrency=2,
+                show_progress=False,
+                parse_workers=parse_workers,
+                report=report,
+            )
+        finally:
+            await runner.cleanup()
+
+    report = su.StatcastFetchReport()
+    results = asyncio.run(_run())
+    assert sorted(df["game_date"][0] for df in results) == [
+        f"2023-07-0{d}" for d in range(1, 6)
+    ]
+    assert all(df.schema["inning"] == pl.Int8 for df in results)
+
+    assert len(report.chunks) == 5 and report.rows == 5
+    assert report.retries == 1 and not report.failed
+    assert all(c.dataframe is None and not c.cached for c in report.chunks)
+    body_size = len(_csv([{"game_date": "2023-07-01", "inning": "3"}]))
+    assert report.body_bytes == 5 * body_size
+    assert all(c.ttfb_seconds > 0 and c.parse_seconds > 0 for c in report.chunks)
+    # The retried chunk waited out the back-off before succeeding.
+    assert report.p95_latency_seconds >= 1.5 > report.p50_latency_seconds
+    assert report.elapsed_seconds >= report.p95_latency_seconds
+
+
+def test_fetch_report_aggregates_chunk_timings():
+    report = su.StatcastFetchReport(elapsed_seconds=2.0)
+    for i in range(1, 11):
+        report.record(
+            su.ChunkFetchResult(
+                url=f"chunk-{i}",
+                dataframe=pl.DataFrame({"pitch": range(100)}),
+                ttfb_seconds=0.1,
+                download_seconds=0.2,
+                parse_seconds=0.05,
+                body_bytes=200_000,
+                retries=1 if i == 10 else 0,
+                total_seconds=i / 10,
+            )
+        )
+    report.record(
+        su.ChunkFetchResult(
+            url="cached", dataframe=pl.DataFrame({"pitch": range(50)}), cached=True
+        )
+    )
+
+    assert report.rows == 1050 and report.retries == 1
+    assert len(report.downloaded) == 10
+    assert report.p50_latency_seconds == 0.5
+    assert report.p95_latency_seconds == 1.0
+    assert report.megabytes_per_second == pytest.approx(1.0)
+    assert report.rows_per_second == pytest.approx(525)
+    assert report.stage_seconds()["download"] == pytest.approx(2.0)
+    assert "11 chunks (1 cached, 0 failed, 1 retries)" in report.summary()
+
+
+def test_statcast_search_filters_encode_savant_params():
+    from pybaseballstats.consts.statcast_consts import (
+        StatcastGameTypes,
+        StatcastPitchTypes,
+    )
+
+    assert su._statcast_search_filters() == ""
+    query = su._statcast_search_filters(
+        pitch_types=[StatcastPitchTypes.FOUR_SEAM_FASTBALL, StatcastPitchTypes.SLIDER],
+        pitchers=[543037, 477132],
+        batters=[592450],
+        game_types=[StatcastGameTypes.REGULAR_SEASON],
+        seasons=[2023],
+    )
+    url = _url(date(2023, 7, 1), date(2023, 7, 3)).replace(
+        "#results", f"{query}#results"
+    )
+    params = su.parse_qs(su.urlsplit(url).query)
+    assert params["hfPT"] == ["FF|SL|"]
+    assert params["hfGT"] == ["R|"]
+    assert params["hfSea"] == ["2023|"]
+    assert params["pitchers_lookup[]"] == ["543037", "477132"]
+    assert params["batters_lookup[]"] == ["592450"]
+    # Bisection keeps the filters on both halves.
+    _first, second = su._split_chunk_url(url)
+    assert su.parse_qs(su.urlsplit(second).query)["hfPT"] == ["FF|SL|"]
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"pitchers": 543037},
+        {"batters": "592450"},
+        {"seasons": 2023},
+        {"pitchers": [543037, "477132"]},
+    ],
+)
+def test_search_filters_reject_bare_values_with_value_error(filters):
+    import pybaseballstats.statcast as sc
+
+    with pytest.raises(ValueError, match="pitchers|batters|seasons"):
+        sc.pitch_by_pitch_data("2023-07-01", "2023-07-02", **filters)
+
+
+def test_parse_statcast_csv_projects_columns():
+    body = _csv([{"game_date": "2023-07-01", "inning": "3", "plate_x": "0.5"}])
+    df = su._parse_statcast_csv(body, ["plate_x", "game_date"])
+    assert df.columns == ["plate_x", "game_date"]
+    assert df.schema["plate_x"] == pl.Float32
+
+    # Columns missing from the body come back as typed nulls.
+    df = su._parse_statcast_csv(body, ["inning", "release_speed"])
+    assert df.schema == {"inning": pl.Int8, "release_speed": pl.Float32}
+    assert df["release_speed"].to_list() == [None]
+
+
+def test_read_body_streams_compressed_response_for_parsing():
+    from aiohttp import web
+
+    from pybaseballstats.utils.client_session_utils import ClientSessionConfig
+
+    body = _csv(
+        [{"game_date": "2023-07-01", "inning": str(i % 9 + 1)} for i in range(5000)]
+    )
+    seen = {}
+
+    async def _handler(request):
+        seen["accept_encoding"] = request.headers.get("Accept-Encoding", "")
+        if "empty" in request.query:
+            return web.Response(body=b"")
+        response = web.Response(body=body, content_type="text/csv")
+        response.enable_compression(web.ContentCoding.gzip)
+        return response
+
+    async def _run():
+        app = web.Application()
+        app.router.add_get("/csv", _handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        origin = f"http://127.0.0.1:{runner.addresses[0][1]}"
+        try:
+            async with ClientSessionConfig().create_session() as session:
+                async with session.get(f"{origin}/csv") as response:
+                    encoding = response.headers.get("Content-Encoding")
+                    streamed = await su._read_body(response)
+                async with session.get(f"{origin}/csv?empty=1") as response:
+                    empty = await su._read_body(response)
+            return encoding, streamed, empty
+        finally:
+            await runner.cleanup()
+
+    encoding, streamed, empty = asyncio.run(_run())
+    assert "gzip" in seen["accept_encoding"]
+    assert encoding == "gzip"
+    assert empty is None
+    assert streamed is not None
+    assert su._parse_statcast_csv(streamed).equals(su._parse_statcast_csv(body))
+
+
+def test_player_pitch_by_pitch_requests_one_player_scoped_url_per_season(
+    monkeypatch,
+):
+    import pybaseballstats.statcast as sc
+
+    captured: list[str] = []
+
+    async def _fake_fetch_all_data(urls, **kwargs):
+        captured.extend(urls)
+        return [pl.DataFrame({"pitcher": [543037]})]
+
+    monkeypatch.setattr(sc, "_fetch_all_data", _fake_fetch_all_data)
+    df = sc.player_pitch_by_pitch(
+        543037, "pitcher", [2019, 2020, 2019], force_collect=True, show_progress=False
+    )
+    assert df["pitcher"].to_list() == [543037]
+
+    assert len(captured) == 2
+    first = su.parse_qs(su.urlsplit(captured[0]).query)
+    assert first["player_type"] == ["pitcher"]
+    assert first["pitchers_lookup[]"] == ["543037"]
+    assert su._chunk_dates_from_url(captured[0]) == (
+        date(2019, 3, 20),
+        date(2019, 10, 30),
+    )
+    assert su._chunk_dates_from_url(captured[1]) == (
+        date(2020, 7, 23),
+        date(2020, 10, 27),
+    )
+
+    captured.clear()
+    sc.player_pitch_by_pitch(592450, "batter", 2023, show_progress=False)
+    query = su.parse_qs(su.urlsplit(captured[0]).query)
+    assert query["player_type"] == ["batter"]
+    assert query["batters_lookup[]"] == ["592450"]
+    assert "pitchers_lookup[]" not in query
+
+    with pytest.raises(ValueError):
+        sc.player_pitch_by_pitch(592450, "fielder", 2023)
+    with pytest.raises(ValueError):
+        sc.player_pitch_by_pitch(592450, "batter", [2014])
+
+
+def test_pitch_by_pitch_data_async_runs_on_callers_loop(monkeypatch):
+    import threading
+
+    import pybaseballstats.statcast as sc
+
+    async def _fake_fetch_all_data(urls, **kwargs):
+        await asyncio.sleep(0)
+        start = su._chunk_dates_from_url(urls[0])[0]
+        return [pl.DataFrame({"game_date": [str(start)]})]
+
+    monkeypatch.setattr(sc, "_fetch_all_data", _fake_fetch_all_data)
+    collected_on = []
+
+    def _collect_streaming(lf, **kwargs):
+        collected_on.append(threading.current_thread())
+        return su._collect_streaming(lf, **kwargs)
+
+    monkeypatch.setattr(sc, "_collect_streaming", _collect_streaming)
+
+    async def _gather():
+        loop = asyncio.get_running_loop()
+        frames = await asyncio.gather(
+            sc.pitch_by_pitch_data_async(
+                "2023-07-01", "2023-07-01", force_collect=True, show_progress=False
+            ),
+            sc.pitch_by_pitch_data_async(
+                "2023-07-02", "2023-07-02", force_collect=True, show_progress=False
+            ),
+        )
+        assert asyncio.get_running_loop() is loop
+        return frames
+
+    first, second = asyncio.run(_gather())
+    assert first["game_date"].to_list() == ["2023-07-01"]
+    assert second["game_date"].to_list() == ["2023-07-02"]
+    # Collecting the frame does not block the caller's loop.
+    assert len(collected_on) == 2
+    assert all(thread is not threading.main_thread() for thread in collected_on)
+
+    with pytest.raises(ValueError):
+        asyncio.run(sc.pitch_by_pitch_data_async("2023-07-01", None))
+
+
+def test_single_game_pitch_by_pitch_rejects_error_pages_and_parses_off_loop(
+    monkeypatch,
+):
+    import threading
+
+    from aiohttp import web
+
+    import pybaseballstats.statcast_single_game as ssg
+
+    async def _handler(request):
+        if request.query["game_pk"] == "1":
+            return web.Response(status=503, text="<html>Service Unavailable</html>")
+        return web.Response(body=_csv([{"game_pk": "2", "inning": "1"}]))
+
+    parsed_on: list[threading.Thread] = []
+
+    def _parse(body, columns=None):
+        parsed_on.append(threading.current_thread())
+        return su._parse_statcast_csv(body, columns)
+
+    monkeypatch.setattr(ssg, "_parse_statcast_csv", _parse)
+
+    async def _run():
+        app = web.Application()
+        app.router.add_get("/statcast_search/csv", _handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        origin = f"http://127.0.0.1:{runner.addresses[0][1]}"
+        monkeypatch.setattr(
+            ssg,
+            "STATCAST_SINGLE_GAME_URL",
+            ssg.STATCAST_SINGLE_GAME_URL.replace(
+                "https://baseballsavant.mlb.com", origin
+            ),
+        )
+        try:
+            with pytest.raises(RuntimeError, match="HTTP 503"):
+                await ssg.single_game_pitch_by_pitch_async(1)
+            return await ssg.single_game_pitch_by_pitch_async(2)
+        finally:
+            await runner.cleanup()
+
+    df = asyncio.run(_run())
+    assert df["game_pk"].to_list() == [2]
+    assert parsed_on and parsed_on[0] is not threading.main_thread()
+
+
+def test_iter_chunks_yields_fast_chunks_before_slow_ones_finish():
+    from aiohttp import web
+
+    async def _handler(request):
+        day = request.query["game_date_gt"]
+        if day == "2023-07-01":
+            await asyncio.sleep(1.0)
+        return web.Response(body=_csv([{"game_date": day, "inning": "3"}]))
+
+    async def _run():
+        app = web.Application()
+        app.router.add_get("/statcast_search/csv", _handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        origin = f"http://127.0.0.1:{runner.addresses[0][1]}"
+        urls = [
+            _url(date(2023, 7, d), date(2023, 7, d)).replace(
+                "https://baseballsavant.mlb.com", origin
+            )
+            for d in range(1, 4)
+        ]
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        arrivals = []
+        try:
+            async for _, df in su._iter_chunks(
+                urls, concurrency=3, show_progress=False
+            ):
+                arrivals.append((df["game_date"][0], loop.time() - started))
+        finally:
+            await runner.cleanup()
+        return arrivals
+
+    arrivals = asyncio.run(_run())
+    assert [day for day, _ in arrivals][-1] == "2023-07-01"
+    assert sorted(day for day, _ in arrivals) == [f"2023-07-0{d}" for d in (1, 2, 3)]
+    # The first chunk is available well before the slow one completes.
+    assert arrivals[0][1] < 0.5 < arrivals[-1][1]
+
+
+def test_iter_pitch_by_pitch_streams_chunks_and_stops_early(monkeypatch):
+    import pybaseballstats.statcast as sc
+
+    state = {"closed": False}
+
+    async def _fake_iter_chunks(urls, **kwargs):
+        try:
+            for url in urls:
+                await asyncio.sleep(0)
+                start = su._chunk_dates_from_url(url)[0]
+                yield url, pl.DataFrame({"game_date": [str(start)]})
+                yield url, pl.DataFrame()
+        finally:
+            state["closed"] = True
+
+    monkeypatch.setattr(sc, "_iter_chunks", _fake_iter_chunks)
+    chunks = sc.iter_pitch_by_pitch(
+        "2023-07-01",
+        "2023-07-09",
+        chunk_size_days=3,
+        show_progress=False,
+        resume=False,
+    )
+    first = next(chunks)
+    assert first["game_date"].to_list() == ["2023-07-01"]
+    chunks.close()
+    assert state["closed"]
+
+    collected = list(
+        sc.iter_pitch_by_pitch(
+            "2023-07-01",
+            "2023-07-09",
+            chunk_size_days=3,
+            show_progress=False,
+            resume=False,
+        )
+    )
+    assert [df["game_date"][0] for df in collected] == [
+        "2023-07-01",
+        "2023-07-04",
+        "2023-07-07",
+    ]
+
+    # Arguments are validated before iteration starts.
+    with pytest.raises(ValueError):
+        sc.iter_pitch_by_pitch("2023-07-01", "2023-07-09", chunk_size_days=0)
+
+
+def test_fetch_all_data_runs_chunk_sink_off_the_event_loop(monkeypatch):
+    import threading
+
+    async def _fake_iter_chunks(urls, **kwargs):
+        for url in urls:
+            yield url, pl.DataFrame({"game_date": [url]})
+
+    monkeypatch.setattr(su, "_iter_chunks", _fake_iter_chunks)
+    written: list[tuple[str, threading.Thread]] = []
+
+    def _sink(url: str, df: pl.DataFrame) -> None:
+        written.append((df["game_date"][0], threading.current_thread()))
+
+    results = asyncio.run(
+        su._fetch_all_data(["a", "b"], show_progress=False, on_chunk=_sink)
+    )
+    assert results == []
+    assert [url for url, _ in written] == ["a", "b"]
+    assert all(thread is not threading.main_thread() for _, thread in written)
+
+
+def test_concurrent_pulls_share_overlapping_chunk_downloads():
+    from aiohttp import web
+
+    requests_per_day: dict[str, int] = {}
+
+    async def _handler(request):
+        day = request.query["game_date_gt"]
+        requests_per_day[day] = requests_per_day.get(day, 0) + 1
+        await asyncio.sleep(0.05)
+        return web.Response(body=_csv([{"game_date": day, "inning": "3"}]))
+
+    async def _run():
+        app = web.Application()
+        app.router.add_get("/statcast_search/csv", _handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        origin = f"http://127.0.0.1:{runner.addresses[0][1]}"
+
+        def _urls(days):
+            return [
+                _url(date(2023, 7, d), date(2023, 7, d)).replace(
+                    "https://baseballsavant.mlb.com", origin
+                )
+                for d in days
+            ]
+
+        try:
+            return await asyncio.gather(
+                su._fetch_all_data(_urls(range(1, 8)), show_progress=False),
+                su._fetch_all_data(_urls(range(4, 15)), show_progress=False),
+            )
+        finally:
+            await runner.cleanup()
+
+    week, fortnight = asyncio.run(_run())
+    assert len(week) == 7 and len(fortnight) == 11
+    shared = {df["game_date"][0] for df in week} & {
+        df["game_date"][0] for df in fortnight
+    }
+    assert len(shared) == 4
+    assert all(count == 1 for count in requests_per_day.values())
+    assert len(requests_per_day) == 14
+
+
+def test_coalesced_pull_survives_the_owning_pull_stopping_early(monkeypatch):
+    import time
+
+    from aiohttp import web
+
+    parse = su._parse_statcast_csv_timed
+
+    def _slow_parse(body, columns=None):
+        time.sleep(0.05)
+        return parse(body, columns)
+
+    monkeypatch.setattr(su, "_parse_statcast_csv_timed", _slow_parse)
+
+    async def _handler(request):
+        day = request.query["game_date_gt"]
+        return web.Response(body=_csv([{"game_date": day, "inning": "3"}]))
+
+    async def _run():
+        app = web.Application()
+        app.router.add_get("/statcast_search/csv", _handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        origin = f"http://127.0.0.1:{runner.addresses[0][1]}"
+        urls = [
+            _url(date(2023, 7, d), date(2023, 7, d)).replace(
+                "https://baseballsavant.mlb.com", origin
+            )
+            for d in range(1, 7)
+        ]
+
+        async def _first_chunk_only():
+            # This pull owns the downloads (and their parse pool) and stops
+            # as soon as it has one chunk.
+            chunks = su._iter_chunks(urls, show_progress=False, parse_workers=1)
+            async for _, df in chunks:
+                await chunks.aclose()
+                return df
+
+        async def _everything():
+            await asyncio.sleep(0)
+            return await su._fetch_all_data(urls, show_progress=False, parse_workers=1)
+
+        try:
+            return await asyncio.gather(_first_chunk_only(), _everything())
+        finally:
+            await runner.cleanup()
+
+    first, everything = asyncio.run(_run())
+    assert first.height == 1
+    assert sorted(df["game_date"][0] for df in everything) == [
+        f"2023-07-0{d}" for d in range(1, 7)
+    ]